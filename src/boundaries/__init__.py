@@ -33,11 +33,8 @@ from .system_boundaries import (
 # Keyboard Maestro Boundaries
 from .km_boundaries import (
     BoundaryViolationType,
-    KMBoundaryValidator,
-    validate_km_integration,
-    check_applescript_permissions,
-    validate_macro_operations,
-    DEFAULT_KM_BOUNDARY
+    BoundaryResult,
+    KMBoundaryGuard
 )
 
 # Plugin Security Boundaries
@@ -58,8 +55,8 @@ from .plugin_boundaries import (
 from .permission_checker import (
     PermissionChecker,
     validate_operation_permissions,
-    check_user_permissions,
-    DEFAULT_PERMISSION_CHECKER
+    check_file_permission,
+    check_accessibility_permission
 )
 
 # Convenience Functions
@@ -130,8 +127,7 @@ __all__ = [
     'validate_file_operations', 'DEFAULT_SYSTEM_BOUNDARY',
     
     # Keyboard Maestro Boundaries
-    'KMBoundaryValidator', 'validate_km_integration', 'check_applescript_permissions',
-    'validate_macro_operations', 'DEFAULT_KM_BOUNDARY',
+    'BoundaryResult', 'KMBoundaryGuard',
     
     # Plugin Security Boundaries
     'ComprehensivePluginBoundary', 'PluginSecurityValidator', 'ScriptContentSecurityValidator',
@@ -139,8 +135,8 @@ __all__ = [
     'validate_plugin_security', 'validate_plugin_installation_security', 'DEFAULT_PLUGIN_BOUNDARY',
     
     # Permission Management
-    'PermissionChecker', 'validate_operation_permissions', 'check_user_permissions',
-    'DEFAULT_PERMISSION_CHECKER',
+    'PermissionChecker', 'validate_operation_permissions', 'check_file_permission',
+    'check_accessibility_permission',
     
     # Convenience Functions
     'validate_all_boundaries', 'create_plugin_security_context', 'validate_comprehensive_security'
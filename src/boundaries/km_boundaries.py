@@ -24,7 +24,7 @@ from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass
 from enum import Enum
 
-from .types.domain_types import MacroUUID, MacroName, VariableName
+from src.types.domain_types import MacroUUID, MacroName, VariableName
 from src.types.enumerations import VariableScope, ExecutionMethod
 from src.core.km_interface import MacroExecutionContext
 from src.contracts.decorators import requires, ensures
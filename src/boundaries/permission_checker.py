@@ -13,7 +13,6 @@ import json
 from pathlib import Path
 
 from src.contracts.decorators import requires, ensures
-from src.contracts.exceptions import PermissionDeniedError, ValidationError
 
 
 class PermissionType(Enum):
@@ -22,6 +22,7 @@ from .decorators import (
     requires,
     ensures, 
     invariant,
+    build_contract,
     ContractState
 )
 
@@ -85,10 +86,12 @@ from .plugin_contracts import (
     plugin_lifecycle_contract,
     plugin_removal_contract,
     plugin_security_contract,
+    plugin_batch_contract,
     is_valid_plugin_structure,
     is_safe_script_content,
     plugin_exists,
     has_valid_bundle_structure,
+    ContractError,
     CONTRACT_ERROR_MESSAGES,
     get_contract_error_message
 )
@@ -178,7 +181,7 @@ __description__ = "Contract Specification Framework for Design by Contract imple
 # Public API - what gets exported when someone does "from src.contracts import *"
 __all__ = [
     # Decorators
-    'requires', 'ensures', 'invariant', 'ContractState',
+    'requires', 'ensures', 'invariant', 'build_contract', 'ContractState',
     
     # Exceptions
     'ContractViolation', 'PreconditionViolation', 'PostconditionViolation',
@@ -196,8 +199,9 @@ __all__ = [
     # Plugin Contracts
     'plugin_creation_contract', 'plugin_installation_contract', 'plugin_validation_contract',
     'plugin_lifecycle_contract', 'plugin_removal_contract', 'plugin_security_contract',
+    'plugin_batch_contract',
     'is_valid_plugin_structure', 'plugin_exists', 'has_valid_bundle_structure',
-    'CONTRACT_ERROR_MESSAGES', 'get_contract_error_message',
+    'ContractError', 'CONTRACT_ERROR_MESSAGES', 'get_contract_error_message',
     
     # Invariants
     'system_invariant_checker', 'InvariantDefinition', 'InvariantSeverity',
@@ -21,13 +21,14 @@ Key Features:
 import asyncio
 import inspect
 from functools import wraps
-from typing import Callable, Any, Dict, Optional, TypeVar, Union
+from typing import Callable, Any, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 from uuid import uuid4
 
 from .exceptions import (
     ViolationContext, ViolationType, PreconditionViolation, 
     PostconditionViolation, InvariantViolation,
-    create_precondition_violation, create_postcondition_violation
+    create_precondition_violation, create_postcondition_violation,
+    create_invariant_violation
 )
 from src.contracts.validators import (
     is_valid_macro_identifier, is_valid_variable_name, is_safe_script_content,
@@ -146,17 +147,21 @@ def invariant(condition: Union[Callable, str],
     Returns:
         Decorated function with invariant enforcement
     """
+    # Whether the condition takes the extracted state, resolved once here
+    # rather than through inspect.signature on every evaluation
+    takes_state = callable(condition) and bool(inspect.signature(condition).parameters)
+    
     def decorator(func: F) -> F:
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             return await _enforce_invariant(
-                func, condition, state_extractor, message, args, kwargs
+                func, condition, takes_state, state_extractor, message, args, kwargs
             )
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             return _enforce_invariant_sync(
-                func, condition, state_extractor, message, args, kwargs
+                func, condition, takes_state, state_extractor, message, args, kwargs
             )
         
         # Return appropriate wrapper based on function type
@@ -168,6 +173,84 @@ def invariant(condition: Union[Callable, str],
     return decorator
 
 
+def build_contract(preconditions: Sequence[Union[Callable, Tuple[str, Callable]]] = (),
+                   postconditions: Sequence[Union[Callable, Tuple[str, Callable]]] = (),
+                   invariants: Sequence[Callable[[], bool]] = (),
+                   result_view: Optional[Callable[[Any], Any]] = None) -> Callable[[F], F]:
+    """Fused contract decorator checking all clauses in a single wrapper.
+    
+    Equivalent to stacking requires/ensures/invariant, but with one wrapper
+    frame per call and argument names resolved once at decoration time.
+    Preconditions receive the arguments they name; postconditions receive the
+    result followed by the arguments they name; invariants take no arguments
+    and are checked before and after the call. A clause naming a parameter the
+    decorated function does not declare raises TypeError when decorating. Pre- and
+    postconditions may be given as ``(name, predicate)`` pairs so violations
+    report the clause name.
+    
+    When ``result_view`` is given, postconditions see ``result_view(result)``
+    (computed once per call) while callers still receive the original result.
+    
+    Args:
+        preconditions: Predicates over the call arguments
+        postconditions: Predicates over the result (first parameter) and arguments
+        invariants: Zero-argument predicates over system state
+        result_view: Optional normaliser applied to the result before postconditions
+    
+    Returns:
+        Decorator applying all clauses to the function
+    """
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        declared = set(signature.parameters)
+        pre_clauses = _resolve_clauses(preconditions, declared, skip_first=False)
+        post_clauses = _resolve_clauses(postconditions, declared, skip_first=True)
+        invariant_clauses = tuple(invariants)
+        needs_arguments = any(names for _, _, names in pre_clauses + post_clauses)
+        
+        def check_entry(args: tuple, kwargs: dict) -> Dict[str, Any]:
+            arguments = _bind_arguments(func, signature, args, kwargs) if needs_arguments else {}
+            for label, clause, names in pre_clauses:
+                if not _clause_holds(clause, [arguments[name] for name in names]):
+                    raise create_precondition_violation(
+                        func.__name__, func.__module__, label,
+                        arguments, list(names)
+                    )
+            _check_invariants(func, invariant_clauses, "pre_execution")
+            return arguments
+        
+        def check_exit(result: Any, arguments: Dict[str, Any]) -> None:
+            _check_invariants(func, invariant_clauses, "post_execution")
+            if not post_clauses:
+                return
+            checked = result if result_view is None else result_view(result)
+            for label, clause, names in post_clauses:
+                if not _clause_holds(clause, [checked] + [arguments[name] for name in names]):
+                    raise create_postcondition_violation(
+                        func.__name__, func.__module__, label,
+                        "expected_result", result
+                    )
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                arguments = check_entry(args, kwargs)
+                result = await func(*args, **kwargs)
+                check_exit(result, arguments)
+                return result
+            return async_wrapper
+        
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            arguments = check_entry(args, kwargs)
+            result = func(*args, **kwargs)
+            check_exit(result, arguments)
+            return result
+        return sync_wrapper
+    
+    return decorator
+
+
 # Internal enforcement functions
 
 async def _enforce_precondition(func: Callable, condition: Union[Callable, str],
@@ -293,13 +376,13 @@ def _enforce_postcondition_sync(func: Callable, condition: Union[Callable, str],
     return result
 
 
-async def _enforce_invariant(func: Callable, condition: Union[Callable, str],
+async def _enforce_invariant(func: Callable, condition: Union[Callable, str], takes_state: bool,
                            state_extractor: Optional[Callable], message: Optional[str],
                            args: tuple, kwargs: dict) -> Any:
     """Enforce invariant for async functions."""
     # Check invariant before execution
     pre_state = state_extractor(*args, **kwargs) if state_extractor else {}
-    if not _evaluate_invariant(condition, pre_state):
+    if not _evaluate_invariant(condition, pre_state, takes_state):
         violation_message = message or f"Invariant violated before execution: {condition}"
         raise InvariantViolation("pre_execution", _create_violation_context(
             func, ViolationType.INVARIANT, dict(kwargs), str(condition)
@@ -310,7 +393,7 @@ async def _enforce_invariant(func: Callable, condition: Union[Callable, str],
     
     # Check invariant after execution
     post_state = state_extractor(*args, **kwargs) if state_extractor else {}
-    if not _evaluate_invariant(condition, post_state):
+    if not _evaluate_invariant(condition, post_state, takes_state):
         violation_message = message or f"Invariant violated after execution: {condition}"
         raise InvariantViolation("post_execution", _create_violation_context(
             func, ViolationType.INVARIANT, dict(kwargs), str(condition)
@@ -319,13 +402,13 @@ async def _enforce_invariant(func: Callable, condition: Union[Callable, str],
     return result
 
 
-def _enforce_invariant_sync(func: Callable, condition: Union[Callable, str],
+def _enforce_invariant_sync(func: Callable, condition: Union[Callable, str], takes_state: bool,
                           state_extractor: Optional[Callable], message: Optional[str],
                           args: tuple, kwargs: dict) -> Any:
     """Enforce invariant for sync functions."""
     # Similar logic to async version
     pre_state = state_extractor(*args, **kwargs) if state_extractor else {}
-    if not _evaluate_invariant(condition, pre_state):
+    if not _evaluate_invariant(condition, pre_state, takes_state):
         violation_message = message or f"Invariant violated before execution: {condition}"
         raise InvariantViolation("pre_execution", _create_violation_context(
             func, ViolationType.INVARIANT, dict(kwargs), str(condition)
@@ -334,7 +417,7 @@ def _enforce_invariant_sync(func: Callable, condition: Union[Callable, str],
     result = func(*args, **kwargs)
     
     post_state = state_extractor(*args, **kwargs) if state_extractor else {}
-    if not _evaluate_invariant(condition, post_state):
+    if not _evaluate_invariant(condition, post_state, takes_state):
         violation_message = message or f"Invariant violated after execution: {condition}"
         raise InvariantViolation("post_execution", _create_violation_context(
             func, ViolationType.INVARIANT, dict(kwargs), str(condition)
@@ -482,11 +565,16 @@ def _evaluate_postcondition(condition: Union[Callable, str], result: Any,
         return False
 
 
-def _evaluate_invariant(condition: Union[Callable, str], state: Dict[str, Any]) -> bool:
-    """Evaluate invariant condition with state."""
+def _evaluate_invariant(condition: Union[Callable, str], state: Dict[str, Any],
+                        takes_state: bool) -> bool:
+    """Evaluate invariant condition with state.
+    
+    takes_state is the condition's arity, resolved once when it was decorated;
+    system-wide invariants take no state argument.
+    """
     try:
         if callable(condition):
-            return condition(state)
+            return condition(state) if takes_state else condition()
         else:
             # Simplified evaluation for string conditions
             return True
@@ -494,6 +582,65 @@ def _evaluate_invariant(condition: Union[Callable, str], state: Dict[str, Any])
         return False
 
 
+def _resolve_clauses(clauses: Sequence[Union[Callable, Tuple[str, Callable]]], declared: set,
+                     skip_first: bool) -> List[Tuple[str, Callable, Tuple[str, ...]]]:
+    """Resolve each clause's label and the argument names it reads from the call.
+    
+    A clause is a predicate or a ``(name, predicate)`` pair; unnamed
+    predicates are labelled by their ``__name__``.
+    
+    Raises:
+        TypeError: If a clause names parameters the function does not declare
+    """
+    resolved = []
+    for clause in clauses:
+        if isinstance(clause, tuple):
+            label, clause = clause
+        else:
+            label = clause.__name__
+        names = tuple(inspect.signature(clause).parameters)
+        if skip_first:
+            names = names[1:]  # Postcondition's first parameter is the result
+        missing = [name for name in names if name not in declared]
+        if missing:
+            raise TypeError(
+                f"Contract clause '{label}' reads undeclared parameters: {', '.join(missing)}"
+            )
+        resolved.append((label, clause, names))
+    return resolved
+
+
+def _bind_arguments(func: Callable, signature: inspect.Signature,
+                    args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Bind call arguments to the function signature, defaults applied."""
+    try:
+        bound_args = signature.bind(*args, **kwargs)
+    except TypeError as e:
+        raise create_precondition_violation(
+            func.__name__, func.__module__, str(e), dict(kwargs), []
+        )
+    bound_args.apply_defaults()
+    return bound_args.arguments
+
+
+def _clause_holds(clause: Callable, values: list) -> bool:
+    """Evaluate a contract clause, treating errors as violations."""
+    try:
+        return bool(clause(*values))
+    except Exception:
+        return False
+
+
+def _check_invariants(func: Callable, invariants: Tuple[Callable[[], bool], ...],
+                      phase: str) -> None:
+    """Check zero-argument invariant clauses around a call."""
+    for clause in invariants:
+        if not _clause_holds(clause, []):
+            raise create_invariant_violation(
+                func.__name__, func.__module__, f"{phase}: {clause.__name__}", {}
+            )
+
+
 def _identify_invalid_parameters(condition: Union[Callable, str],
                                parameters: Dict[str, Any],
                                validation_func: Optional[Callable]) -> list:
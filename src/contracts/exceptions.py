@@ -16,7 +16,7 @@ Key Features:
 """
 
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -38,16 +38,30 @@ class ViolationContext:
     parameters: Dict[str, Any]
     expected_condition: str
     actual_values: Dict[str, Any]
+    _debug_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def get_debug_info(self) -> str:
-        """Generate detailed debug information for violation."""
-        return (
-            f"Function: {self.module_name}.{self.function_name}\n"
-            f"Violation: {self.violation_type.value}\n"
-            f"Expected: {self.expected_condition}\n"
-            f"Parameters: {self.parameters}\n"
-            f"Actual Values: {self.actual_values}"
-        )
+        """Generate detailed debug information for violation (built once, on demand)."""
+        if self._debug_cache is None:
+            object.__setattr__(self, "_debug_cache", "\n".join((
+                f"Function: {self.module_name}.{self.function_name}",
+                f"Violation: {self.violation_type.value}",
+                f"Expected: {self.expected_condition}",
+                f"Parameters: {_format_debug_values(self.parameters)}",
+                f"Actual Values: {_format_debug_values(self.actual_values)}",
+            )))
+        return self._debug_cache
+
+
+# Mappings larger than this are summarized in debug output instead of repr'd
+_MAX_DEBUG_ITEMS = 50
+
+
+def _format_debug_values(values: Dict[str, Any]) -> str:
+    """Format a parameter mapping for debug output, summarizing large ones."""
+    if len(values) > _MAX_DEBUG_ITEMS:
+        return f"<{len(values)} entries>"
+    return repr(values)
 
 
 class ContractViolation(Exception):
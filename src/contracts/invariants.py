@@ -17,8 +17,8 @@ Key Features:
 - Integration with contract decorators for automatic checking
 """
 
-from typing import Dict, Any, List, Set, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, Any, List, Set, FrozenSet, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 
@@ -35,15 +35,57 @@ class InvariantSeverity(Enum):
     INFO = "info"            # Informational only
 
 
+# Evaluation order for invariant checks: CRITICAL first so the system halts
+# before any lower-priority (and possibly expensive) checks are run.
+_SEVERITY_INDEX: Dict[InvariantSeverity, int] = {
+    severity: index for index, severity in enumerate(InvariantSeverity)
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _ResourceUsage:
+    """Snapshot of current system resource usage."""
+    memory_mb: int = 0
+    concurrent_operations: int = 0
+    cpu_percent: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _ResourceLimits:
+    """Configured system resource limits."""
+    max_memory_mb: int = 1000
+    max_concurrent_operations: int = 100
+    max_cpu_percent: int = 80
+
+
+# Shared immutable instances returned by the placeholder resource helpers
+_USAGE_ZERO = _ResourceUsage()
+_LIMITS_DEFAULT = _ResourceLimits()
+
+
 @dataclass(frozen=True)
 class InvariantDefinition:
-    """Immutable definition of a system invariant."""
+    """Immutable definition of a system invariant.
+    
+    With wrap_errors=True (the default) check() reports a check function that
+    raises as a violation. Set wrap_errors=False for check functions that
+    handle their own errors and never raise; check() is then the function
+    itself, with no exception guard.
+    """
     name: str
     description: str
     severity: InvariantSeverity
     check_function: Callable[[], bool]
     state_extractor: Optional[Callable[[], Dict[str, Any]]] = None
     recovery_suggestion: Optional[str] = None
+    wrap_errors: bool = True
+    _severity_index: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_severity_index", _SEVERITY_INDEX[self.severity])
+        if not self.wrap_errors:
+            # Frozen dataclass: bind the unguarded path once at definition time
+            object.__setattr__(self, "check", self.check_function)
     
     def check(self) -> bool:
         """Check if invariant currently holds."""
@@ -68,26 +110,56 @@ class SystemInvariantChecker:
     
     def __init__(self):
         self.invariants: Dict[str, InvariantDefinition] = {}
-        self.violation_handlers: Dict[InvariantSeverity, Callable] = {
-            InvariantSeverity.CRITICAL: self._handle_critical_violation,
-            InvariantSeverity.ERROR: self._handle_error_violation,
-            InvariantSeverity.WARNING: self._handle_warning_violation,
-            InvariantSeverity.INFO: self._handle_info_violation,
-        }
+        self._ordered_invariants: List[InvariantDefinition] = []
+        self._permission_epoch = 0
+        self._granted_cache: Optional[Tuple[int, FrozenSet[str]]] = None
+        self._operation_permissions: Dict[str, FrozenSet[str]] = {}
+        self._all_required: FrozenSet[str] = frozenset()
+        # Indexed by _SEVERITY_INDEX, i.e. InvariantSeverity definition order
+        self._handlers: List[Callable[[InvariantDefinition], None]] = [
+            self._handle_critical_violation,
+            self._handle_error_violation,
+            self._handle_warning_violation,
+            self._handle_info_violation,
+        ]
         self._register_core_invariants()
     
     def register_invariant(self, invariant: InvariantDefinition) -> None:
         """Register a new system invariant."""
         self.invariants[invariant.name] = invariant
+        self._ordered_invariants = sorted(
+            self.invariants.values(),
+            key=lambda inv: inv._severity_index
+        )
+    
+    def invalidate_permissions(self) -> None:
+        """Mark granted permissions as changed so they are re-read on next check."""
+        self._permission_epoch += 1
+    
+    def operation_started(self, operation_id: str, required_permissions: Set[str]) -> None:
+        """Track an active operation and the permissions it requires."""
+        required = frozenset(required_permissions)
+        if self._operation_permissions.get(operation_id) is not None:
+            # Re-registered: permissions it no longer needs must leave the union
+            self._operation_permissions[operation_id] = required
+            self._all_required = frozenset().union(*self._operation_permissions.values())
+        else:
+            self._operation_permissions[operation_id] = required
+            self._all_required = self._all_required | required
+    
+    def operation_finished(self, operation_id: str) -> None:
+        """Stop tracking a completed operation."""
+        if self._operation_permissions.pop(operation_id, None) is not None:
+            self._all_required = frozenset().union(*self._operation_permissions.values())
     
     def check_all_invariants(self) -> Dict[str, bool]:
-        """Check all registered invariants."""
+        """Check all registered invariants, most severe first."""
         results = {}
-        for name, invariant in self.invariants.items():
-            results[name] = invariant.check()
+        for invariant in self._ordered_invariants:
+            results[invariant.name] = invariant.check()
             
             # Handle violations
-            if not results[name]:
+            if not results[invariant.name]:
                 self._handle_violation(invariant)
         
         return results
@@ -113,12 +185,29 @@ class SystemInvariantChecker:
                 violations.append(name)
         return violations
         
-    def check_all(self) -> bool:
-        """Check all invariants and return True if all pass."""
-        return all(self.check_all_invariants().values())
+    def check_all(self, fail_fast: bool = False) -> bool:
+        """Check all invariants and return True if all pass.
+        
+        With fail_fast, stops at the first violated invariant (after handling
+        it) instead of evaluating the rest - useful for yes/no readiness checks.
+        """
+        if not fail_fast:
+            return all(self.check_all_invariants().values())
+        
+        for invariant in self._ordered_invariants:
+            if not invariant.check():
+                self._handle_violation(invariant)
+                return False
+        return True
     
     def _register_core_invariants(self) -> None:
-        """Register core system invariants."""
+        """Register core system invariants.
+        
+        Core check functions catch any exception from their queries and
+        report it as a violation, so they are registered with
+        wrap_errors=False to skip the redundant guard in
+        InvariantDefinition.check.
+        """
         
         # Macro Integrity Invariant
         self.register_invariant(InvariantDefinition(
@@ -127,7 +216,8 @@ class SystemInvariantChecker:
             severity=InvariantSeverity.ERROR,
             check_function=self._check_macro_integrity,
             state_extractor=self._get_macro_state,
-            recovery_suggestion="Validate macro structures and repair corrupted entries"
+            recovery_suggestion="Validate macro structures and repair corrupted entries",
+            wrap_errors=False
         ))
         
         # Variable Scope Invariant
@@ -137,7 +227,8 @@ class SystemInvariantChecker:
             severity=InvariantSeverity.ERROR,
             check_function=self._check_variable_scope,
             state_extractor=self._get_variable_state,
-            recovery_suggestion="Clean up orphaned local variables"
+            recovery_suggestion="Clean up orphaned local variables",
+            wrap_errors=False
         ))
         
         # Permission Boundary Invariant
@@ -147,7 +238,8 @@ class SystemInvariantChecker:
             severity=InvariantSeverity.CRITICAL,
             check_function=self._check_permission_boundaries,
             state_extractor=self._get_permission_state,
-            recovery_suggestion="Review and restore proper permission boundaries"
+            recovery_suggestion="Review and restore proper permission boundaries",
+            wrap_errors=False
         ))
         
         # Resource Limit Invariant
@@ -157,7 +249,8 @@ class SystemInvariantChecker:
             severity=InvariantSeverity.WARNING,
             check_function=self._check_resource_limits,
             state_extractor=self._get_resource_state,
-            recovery_suggestion="Reduce concurrent operations or increase resource limits"
+            recovery_suggestion="Reduce concurrent operations or increase resource limits",
+            wrap_errors=False
         ))
         
         # Concurrent Operation Invariant
@@ -167,14 +260,13 @@ class SystemInvariantChecker:
             severity=InvariantSeverity.ERROR,
             check_function=self._check_concurrent_operations,
             state_extractor=self._get_operation_state,
-            recovery_suggestion="Synchronize concurrent access to shared resources"
+            recovery_suggestion="Synchronize concurrent access to shared resources",
+            wrap_errors=False
         ))
     
     def _handle_violation(self, invariant: InvariantDefinition) -> None:
         """Handle invariant violation based on severity."""
-        handler = self.violation_handlers.get(invariant.severity)
-        if handler:
-            handler(invariant)
+        self._handlers[invariant._severity_index](invariant)
     
     def _handle_critical_violation(self, invariant: InvariantDefinition) -> None:
         """Handle critical invariant violations."""
@@ -235,15 +327,9 @@ class SystemInvariantChecker:
     
     def _check_permission_boundaries(self) -> bool:
         """Check permission boundary invariant."""
-        # In real implementation, would verify current operations against permissions
+        # Union of all active operations' permissions, maintained incrementally
         try:
-            active_operations = self._get_active_operations()
-            granted_permissions = self._get_granted_permissions()
-            
-            return all(
-                op.required_permissions.issubset(granted_permissions)
-                for op in active_operations
-            )
+            return self._all_required.issubset(self._get_granted_permissions())
         except Exception:
             return False
     
@@ -265,11 +351,7 @@ class SystemInvariantChecker:
     def _check_concurrent_operations(self) -> bool:
         """Check concurrent operation invariant."""
         # In real implementation, would check for race conditions and deadlocks
-        try:
-            # Simplified check for demonstration
-            return True
-        except Exception:
-            return False
+        return True
     
     # State extraction functions (simplified implementations)
     
@@ -291,10 +373,15 @@ class SystemInvariantChecker:
     
     def _get_permission_state(self) -> Dict[str, Any]:
         """Get current permission state."""
+        granted = self._get_granted_permissions()
         return {
-            "granted_permissions": set(),
-            "required_permissions": set(),
-            "permission_violations": [],
+            "granted_permissions": set(granted),
+            "required_permissions": set(self._all_required),
+            "permission_violations": [
+                operation_id
+                for operation_id, required in self._operation_permissions.items()
+                if not required.issubset(granted)
+            ],
         }
     
     def _get_resource_state(self) -> Dict[str, Any]:
@@ -331,53 +418,75 @@ class SystemInvariantChecker:
         """Get active execution context IDs."""
         return set()  # Placeholder
     
-    def _get_active_operations(self) -> List[Any]:
-        """Get currently active operations."""
-        return []  # Placeholder
+    def _get_granted_permissions(self) -> FrozenSet[str]:
+        """Get currently granted permissions, cached per permission epoch."""
+        cached = self._granted_cache
+        if cached is not None and cached[0] == self._permission_epoch:
+            return cached[1]
+        
+        granted = frozenset(self._load_granted_permissions())
+        self._granted_cache = (self._permission_epoch, granted)
+        return granted
     
-    def _get_granted_permissions(self) -> Set[str]:
-        """Get currently granted permissions."""
+    def _load_granted_permissions(self) -> Set[str]:
+        """Load currently granted permissions from the system."""
         return set()  # Placeholder
     
-    def _get_current_resource_usage(self) -> Any:
+    def _get_current_resource_usage(self) -> _ResourceUsage:
         """Get current resource usage."""
-        class ResourceUsage:
-            memory_mb = 0
-            concurrent_operations = 0
-            cpu_percent = 0
-        return ResourceUsage()
+        return _USAGE_ZERO  # Placeholder
     
-    def _get_resource_limits(self) -> Any:
+    def _get_resource_limits(self) -> _ResourceLimits:
         """Get configured resource limits."""
-        class ResourceLimits:
-            max_memory_mb = 1000
-            max_concurrent_operations = 100
-            max_cpu_percent = 80
-        return ResourceLimits()
+        return _LIMITS_DEFAULT
+
+
+# Global invariant checker instance, created on first use so that importing
+# this module does not register the core invariants up front.
+_checker: Optional[SystemInvariantChecker] = None
+
+
+def _get_checker() -> SystemInvariantChecker:
+    """Get the global invariant checker, creating it on first access."""
+    global _checker
+    if _checker is None:
+        _checker = SystemInvariantChecker()
+    return _checker
+
+
+class _LazyProxy:
+    """Forwards attribute access to the lazily created global checker."""
+    
+    __slots__ = ()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get_checker(), name)
+    
+    def __repr__(self) -> str:
+        return f"<lazy {SystemInvariantChecker.__name__} proxy>"
 
 
-# Global invariant checker instance
-system_invariant_checker = SystemInvariantChecker()
+system_invariant_checker = _LazyProxy()
 
 
 # Convenience functions for common invariant checks
 
 def check_macro_integrity() -> bool:
     """Check macro integrity invariant."""
-    return system_invariant_checker.check_invariant("macro_integrity")
+    return _get_checker().check_invariant("macro_integrity")
 
 
 def check_variable_scope() -> bool:
     """Check variable scope invariant."""
-    return system_invariant_checker.check_invariant("variable_scope")
+    return _get_checker().check_invariant("variable_scope")
 
 
 def check_permission_boundaries() -> bool:
     """Check permission boundary invariant."""
-    return system_invariant_checker.check_invariant("permission_boundary")
+    return _get_checker().check_invariant("permission_boundary")
 
 
 def check_all_system_invariants() -> bool:
     """Check all system invariants."""
-    results = system_invariant_checker.check_all_invariants()
+    results = _get_checker().check_all_invariants()
     return all(results.values())
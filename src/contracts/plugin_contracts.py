@@ -9,100 +9,457 @@ correctness, security, and reliability of the plugin management system.
 Target: <250 lines with comprehensive contract coverage
 """
 
-from functools import wraps
-from typing import Callable, Any, Dict, List, Optional
+from functools import wraps, lru_cache
+from typing import Callable, Any, Dict, List, Optional, Sequence, Tuple, Union
+import hashlib
+import itertools
 import os
-import re
-from pathlib import Path
+import sys
+import time
+from enum import IntEnum
+from types import MappingProxyType
 
-from .decorators import requires, ensures, invariant
+from .decorators import requires, ensures, invariant, build_contract
 from .exceptions import create_precondition_violation, create_postcondition_violation
 from ..types.plugin_types import (
     PluginID, PluginName, ScriptContent, PluginPath, SecurityHash,
-    create_plugin_id, create_script_content, create_security_hash,
+    create_plugin_id, create_script_content,
     validate_plugin_compatibility
 )
-from ..types.domain_types import PluginCreationData, PluginMetadata, PluginValidationResult
+from ..types.domain_types import (
+    PluginCreationData, PluginMetadata, PluginValidationResult, PluginOperationResult
+)
 from ..types.enumerations import PluginScriptType, PluginLifecycleState, PluginSecurityLevel
 
 
+# Contracts compile to no-ops under ``python -O``, with KM_DISABLE_CONTRACTS=1,
+# or with KM_CONTRACTS=off (runtime switch that leaves other asserts intact)
+CONTRACTS_ENABLED = (
+    __debug__
+    and os.environ.get("KM_DISABLE_CONTRACTS") != "1"
+    and os.environ.get("KM_CONTRACTS", "on").lower() != "off"
+)
+
+# Expensive (filesystem) postconditions run on 1 in KM_CONTRACT_SAMPLE calls;
+# cheap structural clauses always run. Default 1 checks every call.
+def _contract_sample_rate() -> int:
+    try:
+        return max(1, int(os.environ.get("KM_CONTRACT_SAMPLE", "1")))
+    except ValueError:
+        return 1
+
+
+_CONTRACT_SAMPLE = _contract_sample_rate()
+_sample_counter = itertools.count()
+
+# Prefix carried by every plugin ID produced by create_plugin_id
+_PLUGIN_ID_PREFIX = sys.intern("mcp_plugin_")
+_PLUGIN_ID_PREFIX_LEN = len(_PLUGIN_ID_PREFIX)
+
+# Keyboard Maestro Actions directory, resolved once at import
+_KM_DIR_STR = os.path.join(
+    os.path.expanduser("~"),
+    "Library/Application Support/Keyboard Maestro/Keyboard Maestro Actions"
+)
+_KM_DIR_CHECK_INTERVAL = 5  # seconds a writability result is reused
+
+# Deletion table for characters that are invalid in plugin (file) names
+_BAD_NAME_TRANS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Script safety results keyed by (content digest, script type); oldest evicted first
+_SAFE_SCRIPT_CACHE: Dict[Tuple[bytes, PluginScriptType], bool] = {}
+_SAFE_SCRIPT_CACHE_SIZE = 1024
+
+
 # Contract Validation Functions
 
 def is_valid_plugin_structure(plugin_data: PluginCreationData) -> bool:
     """Validate plugin data structure completeness."""
+    # Cheap type/length checks first; isspace() avoids copying large scripts
     try:
-        return (
-            bool(plugin_data.action_name and plugin_data.action_name.strip()) and
-            bool(plugin_data.script_content and plugin_data.script_content.strip()) and
+        action_name = plugin_data.action_name
+        script_content = plugin_data.script_content
+        return bool(
             isinstance(plugin_data.script_type, PluginScriptType) and
-            len(plugin_data.action_name) <= 100 and
-            len(plugin_data.script_content) <= 1_000_000
+            action_name and len(action_name) <= 100 and
+            action_name.strip() and
+            script_content and len(script_content) <= 1_000_000 and
+            not script_content.isspace()
         )
     except Exception:
         return False
 
 
 def is_safe_script_content(script_content: str, script_type: PluginScriptType) -> bool:
-    """Validate script content for security compliance."""
-    try:
-        create_script_content(script_content, script_type)
-        return True
-    except ValueError:
+    """Validate script content for security compliance (memoized per content)."""
+    if not isinstance(script_content, str):
         return False
+    
+    key = (hashlib.blake2b(script_content.encode('utf-8', 'surrogatepass'),
+                           digest_size=16).digest(), script_type)
+    safe = _SAFE_SCRIPT_CACHE.get(key)
+    if safe is None:
+        try:
+            create_script_content(script_content, script_type)
+            safe = True
+        except ValueError:
+            safe = False
+        if len(_SAFE_SCRIPT_CACHE) >= _SAFE_SCRIPT_CACHE_SIZE:
+            del _SAFE_SCRIPT_CACHE[next(iter(_SAFE_SCRIPT_CACHE))]
+        _SAFE_SCRIPT_CACHE[key] = safe
+    return safe
 
 
 def plugin_exists(plugin_id: PluginID) -> bool:
     """Check if plugin exists in the system."""
     # Placeholder implementation - would check actual plugin registry
-    return isinstance(plugin_id, str) and plugin_id.startswith("mcp_plugin_")
+    return isinstance(plugin_id, str) and plugin_id[:_PLUGIN_ID_PREFIX_LEN] == _PLUGIN_ID_PREFIX
 
 
 def has_valid_bundle_structure(bundle_path: str) -> bool:
     """Validate plugin bundle directory structure."""
+    # One directory read: needs Info.plist and at least one script file
     try:
-        path = Path(bundle_path)
-        return (
-            path.exists() and
-            path.is_dir() and
-            (path / "Info.plist").exists() and
-            any(path.glob("script.*"))  # Has at least one script file
-        )
-    except Exception:
+        has_info = has_script = False
+        with os.scandir(bundle_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == "Info.plist":
+                    has_info = True
+                elif name.startswith("script."):
+                    has_script = True
+                if has_info and has_script:
+                    return True
+        return False
+    except (OSError, TypeError, ValueError):
         return False
 
 
 def km_actions_directory_writable() -> bool:
     """Check if Keyboard Maestro Actions directory is writable."""
-    km_path = Path.home() / "Library/Application Support/Keyboard Maestro/Keyboard Maestro Actions"
-    try:
-        return km_path.exists() and os.access(str(km_path), os.W_OK)
-    except Exception:
-        return False
+    return _km_writable_at(int(time.monotonic() // _KM_DIR_CHECK_INTERVAL))
+
+
+@lru_cache(maxsize=1)
+def _km_writable_at(time_bucket: int) -> bool:
+    """Check directory writability; cached for the current time bucket."""
+    # os.access is False for a missing directory, so no separate exists() stat
+    return os.access(_KM_DIR_STR, os.W_OK)
 
 
 def is_valid_plugin_name(name: str) -> bool:
     """Validate plugin name format and safety."""
-    try:
-        return (
-            bool(name and name.strip()) and
-            len(name) <= 100 and
-            not re.search(r'[<>:"/\\|?*]', name) and  # Invalid filename chars
-            not name.startswith('.') and
-            name.strip() == name  # No leading/trailing whitespace
-        )
-    except Exception:
-        return False
+    return isinstance(name, str) and _is_valid_plugin_name_str(name)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_plugin_name_str(name: str) -> bool:
+    """Cached plugin name check for string input."""
+    return (
+        bool(name) and
+        len(name) <= 100 and
+        name.strip() == name and  # No leading/trailing whitespace
+        not name.startswith('.') and
+        len(name.translate(_BAD_NAME_TRANS)) == len(name)  # No invalid filename chars
+    )
+
+
+# Contract Clauses
+#
+# Module-level predicates (rather than per-contract lambdas) so clauses shared
+# between contracts use one code object. Parameter names select the arguments
+# each clause receives from the decorated operation.
+
+def _pre_creation_structure(plugin_data: PluginCreationData) -> bool:
+    return is_valid_plugin_structure(plugin_data)
+
+
+def _pre_creation_script_safe(plugin_data: PluginCreationData) -> bool:
+    return is_safe_script_content(plugin_data.script_content, plugin_data.script_type)
+
+
+def _pre_creation_name(plugin_data: PluginCreationData) -> bool:
+    return is_valid_plugin_name(plugin_data.action_name)
+
+
+def _pre_plugin_exists(plugin_id: PluginID) -> bool:
+    return plugin_exists(plugin_id)
+
+
+def _pre_bundle_structure(bundle_path: str) -> bool:
+    return has_valid_bundle_structure(bundle_path)
+
+
+def _pre_km_directory_writable() -> bool:
+    return km_actions_directory_writable()
+
+
+def _pre_plugin_data_present(plugin_data: Any) -> bool:
+    return plugin_data is not None
+
+
+def _pre_plugin_data_has_script(plugin_data: Any) -> bool:
+    return hasattr(plugin_data, 'script_content')
+
+
+def _pre_plugin_data_has_type(plugin_data: Any) -> bool:
+    return hasattr(plugin_data, 'script_type')
+
+
+def _pre_target_state_valid(target_state: Any) -> bool:
+    return isinstance(target_state, PluginLifecycleState)
+
+
+def _pre_transition_allowed(current_state: PluginLifecycleState,
+                            target_state: PluginLifecycleState) -> bool:
+    return current_state.can_transition_to(target_state)
+
+
+def _pre_plugin_removable(plugin_id: PluginID) -> bool:
+    return plugin_can_be_removed(plugin_id)
+
+
+def _pre_script_is_str(script_content: Any) -> bool:
+    return isinstance(script_content, str)
+
+
+def _pre_script_type_valid(script_type: Any) -> bool:
+    return isinstance(script_type, PluginScriptType)
+
+
+def _pre_security_level_valid(security_level: Any) -> bool:
+    return isinstance(security_level, PluginSecurityLevel)
+
+
+def _operation_result_view(result: Any) -> Optional[PluginOperationResult]:
+    """Normalise an operation result once per call for the postconditions below.
+    
+    Typed results pass through untouched; tool response dicts are converted.
+    Anything else maps to None and fails ``_post_is_operation_result``.
+    """
+    if type(result) is PluginOperationResult:
+        return result
+    if isinstance(result, dict) and 'success' in result:
+        return PluginOperationResult.from_response(result)
+    return None
+
+
+def _post_is_operation_result(result: Optional[PluginOperationResult]) -> bool:
+    return result is not None
+
+
+def _post_creation_id(result: PluginOperationResult) -> bool:
+    return result.success == (result.plugin_id is not None)
+
+
+def _post_creation_hash(result: PluginOperationResult) -> bool:
+    # Structural only: the implementation hashes the script once and reports it
+    return not result.success or result.content_hash is not None
+
+
+def _post_installation_path(result: PluginOperationResult) -> bool:
+    return result.success == (result.installation_path is not None)
+
+
+def _post_installation_verified(result: PluginOperationResult, plugin_id: PluginID) -> bool:
+    return (not result.success or
+            plugin_installation_verified(plugin_id, result.installation_path))
+
+
+def _post_validation_result_type(result: Any) -> bool:
+    return isinstance(result, PluginValidationResult)
+
+
+def _post_validity_matches_errors(result: PluginValidationResult) -> bool:
+    return result.is_valid == (len(result.validation_errors or []) == 0)
+
+
+def _post_risk_level_in_range(result: PluginValidationResult) -> bool:
+    return 0 <= result.estimated_risk_level <= 3
+
+
+def _post_invalid_has_errors(result: PluginValidationResult) -> bool:
+    return bool(result.is_valid or result.validation_errors)
+
+
+def _post_success_without_error(result: PluginOperationResult) -> bool:
+    return result.success == (result.error_message is None)
+
+
+def _post_state_reached(result: PluginOperationResult, target_state: PluginLifecycleState) -> bool:
+    return not result.success or get_plugin_state(result.plugin_id) == target_state
+
+
+def _post_plugin_removed(result: PluginOperationResult, plugin_id: PluginID) -> bool:
+    return not result.success or not plugin_exists_after_removal(plugin_id)
+
+
+def _post_rollback_matches_backup(result: PluginOperationResult) -> bool:
+    return result.rollback_available == isinstance(result.backup_path, str)
+
+
+def _post_has_security_analysis(result: Any) -> bool:
+    return isinstance(result, dict) and 'security_analysis' in result
+
+
+def _post_security_analysis_is_dict(result: Dict[str, Any]) -> bool:
+    return isinstance(result['security_analysis'], dict)
+
+
+def _post_has_risk_score(result: Dict[str, Any]) -> bool:
+    return 'risk_score' in result['security_analysis']
+
+
+def _post_risk_score_in_range(result: Dict[str, Any]) -> bool:
+    return 0 <= result['security_analysis']['risk_score'] <= 100
+
+
+def _post_has_security_issues(result: Dict[str, Any]) -> bool:
+    return 'security_issues' in result['security_analysis']
+
+
+def _pre_batch_is_sequence(batch: Any) -> bool:
+    # Must be re-iterable: every batch clause walks it again
+    return isinstance(batch, (list, tuple))
+
+
+def _pre_batch_structures(batch: Sequence[PluginCreationData]) -> bool:
+    return all(map(is_valid_plugin_structure, batch))
+
+
+def _pre_batch_scripts_safe(batch: Sequence[PluginCreationData]) -> bool:
+    return all(is_safe_script_content(p.script_content, p.script_type) for p in batch)
+
+
+def _pre_batch_names(batch: Sequence[PluginCreationData]) -> bool:
+    return all(is_valid_plugin_name(p.action_name) for p in batch)
+
+
+def _batch_result_view(result: Any) -> Optional[Tuple[Optional[PluginOperationResult], ...]]:
+    """Normalise each per-plugin result of a batch operation once per call."""
+    if isinstance(result, (list, tuple)):
+        return tuple(map(_operation_result_view, result))
+    return None
+
+
+def _post_batch_results(result: Optional[Tuple[Optional[PluginOperationResult], ...]]) -> bool:
+    return result is not None and all(entry is not None for entry in result)
+
+
+def _post_batch_result_per_plugin(result: Tuple[PluginOperationResult, ...],
+                                  batch: Sequence[PluginCreationData]) -> bool:
+    return len(result) == len(batch)
+
+
+def _post_batch_ids(result: Tuple[PluginOperationResult, ...]) -> bool:
+    return all(map(_post_creation_id, result))
+
+
+def _post_batch_hashes(result: Tuple[PluginOperationResult, ...]) -> bool:
+    return all(map(_post_creation_hash, result))
+
+
+def _sampled(clause: Callable[..., bool]) -> Callable[..., bool]:
+    """Evaluate an expensive clause only on sampled calls (see KM_CONTRACT_SAMPLE)."""
+    if _CONTRACT_SAMPLE == 1:
+        return clause
+    
+    @wraps(clause)  # keeps the signature build_contract resolves arguments from
+    def sampled(*values: Any) -> bool:
+        return next(_sample_counter) % _CONTRACT_SAMPLE != 0 or clause(*values)
+    return sampled
+
+
+# Contract Clause Tables
+#
+# One named table per contract; build_contract runs every table through the
+# same generic loop and reports the clause name on violation.
+
+_CREATION_PRECONDITIONS = (
+    ("plugin_structure_valid", _pre_creation_structure),
+    ("script_content_safe", _pre_creation_script_safe),
+    ("plugin_name_valid", _pre_creation_name),
+)
+_CREATION_POSTCONDITIONS = (
+    ("operation_result", _post_is_operation_result),
+    ("plugin_id_assigned", _post_creation_id),
+    ("content_hash_reported", _post_creation_hash),
+)
+
+_INSTALLATION_PRECONDITIONS = (
+    ("plugin_exists", _pre_plugin_exists),
+    ("bundle_structure_valid", _pre_bundle_structure),
+    ("directory_writable", _pre_km_directory_writable),
+)
+_INSTALLATION_POSTCONDITIONS = (
+    ("operation_result", _post_is_operation_result),
+    ("installation_path_reported", _post_installation_path),
+    ("installation_verified", _sampled(_post_installation_verified)),
+)
+
+_VALIDATION_PRECONDITIONS = (
+    ("plugin_data_present", _pre_plugin_data_present),
+    ("plugin_data_has_script", _pre_plugin_data_has_script),
+    ("plugin_data_has_type", _pre_plugin_data_has_type),
+)
+_VALIDATION_POSTCONDITIONS = (
+    ("validation_result", _post_validation_result_type),
+    ("validity_matches_errors", _post_validity_matches_errors),
+    ("risk_level_in_range", _post_risk_level_in_range),
+    ("invalid_has_errors", _post_invalid_has_errors),
+)
+
+_LIFECYCLE_PRECONDITIONS = (
+    ("plugin_exists", _pre_plugin_exists),
+    ("target_state_valid", _pre_target_state_valid),
+    ("transition_allowed", _pre_transition_allowed),
+)
+_LIFECYCLE_POSTCONDITIONS = (
+    ("operation_result", _post_is_operation_result),
+    ("success_without_error", _post_success_without_error),
+    ("target_state_reached", _post_state_reached),
+)
+
+_REMOVAL_PRECONDITIONS = (
+    ("plugin_exists", _pre_plugin_exists),
+    ("plugin_removable", _pre_plugin_removable),
+)
+_REMOVAL_POSTCONDITIONS = (
+    ("operation_result", _post_is_operation_result),
+    ("success_without_error", _post_success_without_error),
+    ("plugin_removed", _post_plugin_removed),
+    ("rollback_matches_backup", _post_rollback_matches_backup),
+)
+
+_SECURITY_PRECONDITIONS = (
+    ("script_content_is_str", _pre_script_is_str),
+    ("script_type_valid", _pre_script_type_valid),
+    ("security_level_valid", _pre_security_level_valid),
+)
+_SECURITY_POSTCONDITIONS = (
+    ("has_security_analysis", _post_has_security_analysis),
+    ("security_analysis_is_dict", _post_security_analysis_is_dict),
+    ("has_risk_score", _post_has_risk_score),
+    ("risk_score_in_range", _post_risk_score_in_range),
+    ("has_security_issues", _post_has_security_issues),
+)
+
+_BATCH_PRECONDITIONS = (
+    ("batch_is_sequence", _pre_batch_is_sequence),
+    ("plugin_structures_valid", _pre_batch_structures),
+    ("script_contents_safe", _pre_batch_scripts_safe),
+    ("plugin_names_valid", _pre_batch_names),
+)
+_BATCH_POSTCONDITIONS = (
+    ("operation_results", _post_batch_results),
+    ("one_result_per_plugin", _post_batch_result_per_plugin),
+    ("plugin_ids_assigned", _post_batch_ids),
+    ("content_hashes_reported", _post_batch_hashes),
+)
 
 
 # Plugin Creation Contract
 
-@requires(lambda plugin_data: is_valid_plugin_structure(plugin_data))
-@requires(lambda plugin_data: is_safe_script_content(plugin_data.script_content, plugin_data.script_type))
-@requires(lambda plugin_data: is_valid_plugin_name(plugin_data.action_name))
-@ensures(lambda result: isinstance(result, dict) and 'success' in result)
-@ensures(lambda result: result['success'] == (result.get('plugin_id') is not None))
-@ensures(lambda result, plugin_data: not result['success'] or 
-         create_security_hash(plugin_data.script_content) == result.get('content_hash'))
 def plugin_creation_contract(func: Callable) -> Callable:
     """Contract for plugin creation operations.
     
@@ -112,26 +469,24 @@ def plugin_creation_contract(func: Callable) -> Callable:
     - Plugin name must be valid for filesystem use
     
     Postconditions:
-    - Result indicates success or failure with error details
+    - Result is a PluginOperationResult (or equivalent response dict)
+      indicating success or failure with error details
     - Success implies plugin ID is assigned
-    - Content hash matches original script for verification
+    - Success implies a content hash is reported; implementations MUST set
+      ``content_hash`` from the hash they computed, it is not recomputed here
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_CREATION_PRECONDITIONS,
+        postconditions=_CREATION_POSTCONDITIONS,
+        result_view=_operation_result_view
+    )(func)
 
 
 # Plugin Installation Contract
 
-@requires(lambda plugin_id: plugin_exists(plugin_id))
-@requires(lambda bundle_path: has_valid_bundle_structure(bundle_path))
-@requires(lambda: km_actions_directory_writable())
-@ensures(lambda result: isinstance(result, dict) and 'success' in result)
-@ensures(lambda result: result['success'] == (result.get('installation_path') is not None))
-@ensures(lambda result, plugin_id: not result['success'] or 
-         plugin_installation_verified(plugin_id, result.get('installation_path')))
-@invariant(lambda: system_plugin_count_consistent())
 def plugin_installation_contract(func: Callable) -> Callable:
     """Contract for plugin installation operations.
     
@@ -142,26 +497,25 @@ def plugin_installation_contract(func: Callable) -> Callable:
     
     Postconditions:
     - Result indicates success with installation path
-    - Installation can be verified in target location
+    - Installation can be verified in target location (filesystem check,
+      sampled on 1 in KM_CONTRACT_SAMPLE calls)
     
     Invariants:
     - System plugin count remains consistent
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_INSTALLATION_PRECONDITIONS,
+        postconditions=_INSTALLATION_POSTCONDITIONS,
+        invariants=(system_plugin_count_consistent,),
+        result_view=_operation_result_view
+    )(func)
 
 
 # Plugin Validation Contract
 
-@requires(lambda plugin_data: plugin_data is not None)
-@requires(lambda plugin_data: hasattr(plugin_data, 'script_content'))
-@requires(lambda plugin_data: hasattr(plugin_data, 'script_type'))
-@ensures(lambda result: isinstance(result, PluginValidationResult))
-@ensures(lambda result: result.is_valid == (len(result.validation_errors or []) == 0))
-@ensures(lambda result: 0 <= result.estimated_risk_level <= 3)
-@ensures(lambda result: result.is_valid or result.validation_errors)
 def plugin_validation_contract(func: Callable) -> Callable:
     """Contract for plugin validation operations.
     
@@ -175,22 +529,17 @@ def plugin_validation_contract(func: Callable) -> Callable:
     - Risk level is within valid range (0-3)
     - Invalid plugins must have error details
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_VALIDATION_PRECONDITIONS,
+        postconditions=_VALIDATION_POSTCONDITIONS
+    )(func)
 
 
 # Plugin Lifecycle Contract
 
-@requires(lambda plugin_id: plugin_exists(plugin_id))
-@requires(lambda target_state: isinstance(target_state, PluginLifecycleState))
-@requires(lambda current_state, target_state: current_state.can_transition_to(target_state))
-@ensures(lambda result: isinstance(result, dict) and 'success' in result)
-@ensures(lambda result: result['success'] == (result.get('error_message') is None))
-@ensures(lambda result, target_state: not result['success'] or 
-         get_plugin_state(result.get('plugin_id')) == target_state)
-@invariant(lambda: no_plugins_in_invalid_states())
 def plugin_lifecycle_contract(func: Callable) -> Callable:
     """Contract for plugin lifecycle state transitions.
     
@@ -207,21 +556,19 @@ def plugin_lifecycle_contract(func: Callable) -> Callable:
     Invariants:
     - No plugins exist in invalid states
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_LIFECYCLE_PRECONDITIONS,
+        postconditions=_LIFECYCLE_POSTCONDITIONS,
+        invariants=(no_plugins_in_invalid_states,),
+        result_view=_operation_result_view
+    )(func)
 
 
 # Plugin Removal Contract
 
-@requires(lambda plugin_id: plugin_exists(plugin_id))
-@requires(lambda plugin_id: plugin_can_be_removed(plugin_id))
-@ensures(lambda result: isinstance(result, dict) and 'success' in result)
-@ensures(lambda result: result['success'] == (result.get('error_message') is None))
-@ensures(lambda result, plugin_id: not result['success'] or not plugin_exists_after_removal(plugin_id))
-@ensures(lambda result: result.get('rollback_available', False) == isinstance(result.get('backup_path'), str))
-@invariant(lambda: system_cleanup_complete())
 def plugin_removal_contract(func: Callable) -> Callable:
     """Contract for plugin removal operations.
     
@@ -237,23 +584,19 @@ def plugin_removal_contract(func: Callable) -> Callable:
     Invariants:
     - System cleanup is complete (no orphaned files)
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_REMOVAL_PRECONDITIONS,
+        postconditions=_REMOVAL_POSTCONDITIONS,
+        invariants=(system_cleanup_complete,),
+        result_view=_operation_result_view
+    )(func)
 
 
 # Plugin Security Contract
 
-@requires(lambda script_content: isinstance(script_content, str))
-@requires(lambda script_type: isinstance(script_type, PluginScriptType))
-@requires(lambda security_level: isinstance(security_level, PluginSecurityLevel))
-@ensures(lambda result: isinstance(result, dict) and 'security_analysis' in result)
-@ensures(lambda result: isinstance(result['security_analysis'], dict))
-@ensures(lambda result: 'risk_score' in result['security_analysis'])
-@ensures(lambda result: 0 <= result['security_analysis']['risk_score'] <= 100)
-@ensures(lambda result: 'security_issues' in result['security_analysis'])
-@invariant(lambda: security_analysis_consistent())
 def plugin_security_contract(func: Callable) -> Callable:
     """Contract for plugin security analysis.
     
@@ -270,26 +613,61 @@ def plugin_security_contract(func: Callable) -> Callable:
     Invariants:
     - Security analysis results are consistent
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-    return wrapper
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_SECURITY_PRECONDITIONS,
+        postconditions=_SECURITY_POSTCONDITIONS,
+        invariants=(security_analysis_consistent,)
+    )(func)
+
+
+# Plugin Batch Contract
+
+def plugin_batch_contract(func: Callable) -> Callable:
+    """Contract for operations creating a batch of plugins in one call.
+    
+    Applies the creation clauses to every item of the ``batch`` argument in a
+    single pass, so contract and invariant overhead is paid once per batch
+    rather than once per plugin.
+    
+    Preconditions:
+    - Batch is a list or tuple of plugin creation data
+    - Every plugin data structure is valid and complete
+    - Every script passes security validation
+    - Every plugin name is valid for filesystem use
+    
+    Postconditions:
+    - Result is a list/tuple of operation results (or response dicts),
+      one per plugin in the batch
+    - Each success has a plugin ID and reported content hash
+    
+    Invariants:
+    - System plugin count remains consistent
+    """
+    if not CONTRACTS_ENABLED:
+        return func
+    
+    return build_contract(
+        preconditions=_BATCH_PRECONDITIONS,
+        postconditions=_BATCH_POSTCONDITIONS,
+        invariants=(system_plugin_count_consistent,),
+        result_view=_batch_result_view
+    )(func)
 
 
 # Helper Functions for Contract Validation
 
+
 def plugin_installation_verified(plugin_id: PluginID, installation_path: str) -> bool:
     """Verify plugin installation was successful."""
     try:
-        path = Path(installation_path)
-        return (
-            path.exists() and
-            path.is_dir() and
-            path.name.endswith('.kmsync') and
-            (path / "Info.plist").exists()
-        )
-    except Exception:
+        path = os.fspath(installation_path).rstrip(os.sep)
+    except (TypeError, ValueError):
         return False
+    # Info.plist existing inside the bundle implies the bundle is a directory
+    return path.endswith('.kmsync') and os.path.exists(os.path.join(path, "Info.plist"))
 
 
 def system_plugin_count_consistent() -> bool:
@@ -301,7 +679,7 @@ def system_plugin_count_consistent() -> bool:
 def get_plugin_state(plugin_id: Optional[str]) -> Optional[PluginLifecycleState]:
     """Get current state of plugin."""
     # Placeholder - would query actual plugin registry
-    if plugin_id and plugin_id.startswith("mcp_plugin_"):
+    if plugin_id and plugin_id[:_PLUGIN_ID_PREFIX_LEN] == _PLUGIN_ID_PREFIX:
         return PluginLifecycleState.CREATED
     return None
 
@@ -363,29 +741,69 @@ def validate_common_postconditions(result: Any) -> bool:
     return isinstance(result, dict) and 'success' in result
 
 
+# Bumped whenever the plugin registry changes; the invariant result is reused
+# until then so contract wrappers pay one int compare instead of three calls.
+_INV_EPOCH = 0
+_INV_CACHED: Tuple[int, bool] = (-1, True)
+
+
+def invalidate_system_invariants() -> None:
+    """Mark cached system invariants stale after a plugin add/remove/transition."""
+    global _INV_EPOCH
+    _INV_EPOCH += 1
+
+
 def validate_system_invariants() -> bool:
-    """Validate system-wide invariants."""
-    return (
+    """Validate system-wide invariants, cached per registry epoch."""
+    global _INV_CACHED
+    epoch = _INV_EPOCH
+    if _INV_CACHED[0] == epoch:
+        return _INV_CACHED[1]
+    valid = (
         system_plugin_count_consistent() and
         no_plugins_in_invalid_states() and
         security_analysis_consistent()
     )
+    _INV_CACHED = (epoch, valid)
+    return valid
 
 
 # Contract-Based Error Messages
 
-CONTRACT_ERROR_MESSAGES = {
-    'invalid_plugin_structure': "Plugin data structure is invalid or incomplete",
-    'unsafe_script_content': "Script content contains security violations",
-    'invalid_plugin_name': "Plugin name is invalid or unsafe for filesystem",
-    'plugin_not_exists': "Plugin does not exist in the system",
-    'invalid_bundle_structure': "Plugin bundle structure is invalid",
-    'directory_not_writable': "Target directory is not writable",
-    'invalid_state_transition': "Plugin state transition is not allowed",
-    'plugin_not_removable': "Plugin cannot be removed in current state",
-    'security_analysis_failed': "Security analysis could not be completed"
-}
-
-def get_contract_error_message(error_key: str) -> str:
-    """Get standardized contract error message."""
-    return CONTRACT_ERROR_MESSAGES.get(error_key, "Contract violation occurred")
+class ContractError(IntEnum):
+    """Plugin contract error codes; values index ``_MSGS`` directly."""
+    INVALID_PLUGIN_STRUCTURE = 0
+    UNSAFE_SCRIPT_CONTENT = 1
+    INVALID_PLUGIN_NAME = 2
+    PLUGIN_NOT_EXISTS = 3
+    INVALID_BUNDLE_STRUCTURE = 4
+    DIRECTORY_NOT_WRITABLE = 5
+    INVALID_STATE_TRANSITION = 6
+    PLUGIN_NOT_REMOVABLE = 7
+    SECURITY_ANALYSIS_FAILED = 8
+
+
+_MSGS: Tuple[str, ...] = tuple(sys.intern(message) for message in (
+    "Plugin data structure is invalid or incomplete",
+    "Script content contains security violations",
+    "Plugin name is invalid or unsafe for filesystem",
+    "Plugin does not exist in the system",
+    "Plugin bundle structure is invalid",
+    "Target directory is not writable",
+    "Plugin state transition is not allowed",
+    "Plugin cannot be removed in current state",
+    "Security analysis could not be completed"
+))
+
+# String-keyed view kept for callers using the original error keys
+CONTRACT_ERROR_MESSAGES = MappingProxyType({
+    sys.intern(error.name.lower()): _MSGS[error] for error in ContractError
+})
+
+_DEFAULT_CONTRACT_ERROR_MESSAGE = sys.intern("Contract violation occurred")
+
+def get_contract_error_message(error_key: Union[ContractError, str]) -> str:
+    """Get standardized contract error message by code or string key."""
+    if type(error_key) is ContractError:
+        return _MSGS[error_key]
+    return CONTRACT_ERROR_MESSAGES.get(error_key, _DEFAULT_CONTRACT_ERROR_MESSAGE)
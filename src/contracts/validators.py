@@ -19,10 +19,16 @@ Key Features:
 
 import re
 import os
+import string
 import uuid
-from typing import Any, List, Dict, Optional, Set, Union
+from functools import lru_cache
+from typing import Any, List, Dict, FrozenSet, Optional, Union
 from uuid import UUID
-from pathlib import Path
+
+try:
+    import re2  # Optional: google-re2, used for the script-safety scan
+except ImportError:
+    re2 = None
 
 # Import domain types and exceptions
 from ..types.identifiers import (
@@ -40,6 +46,63 @@ from .exceptions import (
 )
 
 
+# Precompiled patterns (compiled once at import rather than looked up per call),
+# applied with fullmatch. Name patterns only see non-ASCII text (see _uses_only)
+# so they stay Unicode-aware for \s; the others are ASCII by construction.
+
+_MACRO_NAME_RE = re.compile(r'[a-zA-Z0-9_\s\-\.]+')
+_GROUP_NAME_RE = re.compile(r'[a-zA-Z0-9_\s\-]+')
+_BUNDLE_ID_RE = re.compile(r'[a-zA-Z0-9]+(?:\.[a-zA-Z0-9]+){2,}', re.ASCII)
+_APP_NAME_RE = _MACRO_NAME_RE  # Same character class as macro names
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII)
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\+\.]')
+# Placeholder screen size (would come from AppKit/Cocoa screen detection)
+_SCREEN_W, _SCREEN_H = 1920, 1080
+
+# Deletion tables for ASCII fast paths. On str patterns \s also matches the
+# ASCII separators \x1c-\x1f, which string.whitespace omits.
+_ASCII_RE_WHITESPACE = string.whitespace + '\x1c\x1d\x1e\x1f'
+_MACRO_NAME_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '_-.' + _ASCII_RE_WHITESPACE)
+_GROUP_NAME_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '_-' + _ASCII_RE_WHITESPACE)
+_PHONE_STRIP_CHARS = str.maketrans('', '', '-()+.' + _ASCII_RE_WHITESPACE)
+
+# Dangerous script patterns fused into one alternation: a single C-level scan
+_DANGEROUS_SCRIPT_ALTERNATION = "|".join(f"(?:{pattern})" for pattern in (
+    r'rm\s+-rf',           # Dangerous file deletion
+    r'sudo\s+',            # Privilege escalation
+    r'eval\s*\(',          # Code injection
+    r'exec\s*\(',          # Code execution
+    r'system\s*\(',        # System command execution
+    r'os\.system',         # Python system calls
+    r'subprocess\.',       # Python subprocess
+    r'shell_exec',         # PHP shell execution
+    r'passthru',           # PHP command execution
+    r'curl.*\|.*sh',       # Download and execute
+    r'wget.*\|.*sh',       # Download and execute
+))
+_DANGEROUS_SCRIPT_RE = re.compile(_DANGEROUS_SCRIPT_ALTERNATION, re.IGNORECASE)
+
+# Substrings at least one of which every dangerous pattern requires. Only used
+# on ASCII scripts: str.lower() and re.IGNORECASE disagree on some non-ASCII
+# letters (e.g. U+017F folds to 's' under IGNORECASE but not under lower()).
+_SCRIPT_KEYWORDS = ('rm', 'sudo', 'eval', 'exec', 'system', 'subprocess',
+                    'passthru', 'curl', 'wget')
+
+# Optional linear-time RE2 engine: no backtracking on the .* patterns for long
+# scripts. RE2's \s is narrower than re's, so it is spelled out and the RE2
+# scanner is only used on ASCII scripts, where both engines agree.
+_DANGEROUS_SCRIPT_RE2 = None if re2 is None else re2.compile(
+    "(?i)" + _DANGEROUS_SCRIPT_ALTERNATION.replace(r'\s', r'[\t\n\x0b\f\r\x1c-\x1f ]')
+)
+
+
+def _uses_only(text: str, deletion_table: Dict[int, None], pattern: re.Pattern) -> bool:
+    """Check text against a character-class pattern, via str.translate when ASCII."""
+    if text.isascii():
+        return not text.translate(deletion_table)
+    return pattern.fullmatch(text) is not None  # Unicode whitespace needs the regex
+
+
 # Keyboard Maestro Domain Validators
 
 def is_valid_string(value: Any, min_length: int = 1, max_length: int = 1000) -> bool:
@@ -51,63 +114,62 @@ def is_valid_string(value: Any, min_length: int = 1, max_length: int = 1000) ->
 
 def is_valid_macro_identifier(identifier: Any) -> bool:
     """Validate macro identifier format (UUID or name string)."""
-    if isinstance(identifier, UUID):
-        return True
+    # Names arrive far more often than UUIDs, so test str first
     if isinstance(identifier, str):
-        # Valid name: 1-255 characters, alphanumeric plus common symbols
-        return (len(identifier) > 0 and 
-                len(identifier) <= 255 and
-                re.match(r'^[a-zA-Z0-9_\s\-\.]+$', identifier) is not None)
-    return False
+        return _is_valid_macro_identifier_str(identifier)
+    return isinstance(identifier, UUID)
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_macro_identifier_str(identifier: str) -> bool:
+    """Memoized string check for is_valid_macro_identifier."""
+    # Valid name: 1-255 characters (cheap rejection first), then charset
+    return (0 < len(identifier) <= 255 and
+            _uses_only(identifier, _MACRO_NAME_CHARS, _MACRO_NAME_RE))
 
 
 def is_valid_macro_name(name: Any) -> bool:
     """Validate macro name follows Keyboard Maestro conventions."""
-    if not isinstance(name, str):
-        return False
-    
+    return isinstance(name, str) and _is_valid_macro_name_str(name)
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_macro_name_str(name: str) -> bool:
+    """Memoized string check for is_valid_macro_name."""
     # Keyboard Maestro macro name rules
     return (1 <= len(name) <= 255 and
-            re.match(r'^[a-zA-Z0-9_\s\-\.]+$', name) is not None and
+            _uses_only(name, _MACRO_NAME_CHARS, _MACRO_NAME_RE) and
             not name.isspace())  # Not just whitespace
 
 
 def is_valid_variable_name(name: Any) -> bool:
     """Validate variable name follows Keyboard Maestro naming conventions."""
-    if not isinstance(name, str):
-        return False
-    
+    return isinstance(name, str) and _is_valid_variable_name_str(name)
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_variable_name_str(name: str) -> bool:
+    """Memoized string check for is_valid_variable_name."""
     # Keyboard Maestro variable naming rules: identifier-like format
+    # ASCII identifiers are exactly [a-zA-Z_][a-zA-Z0-9_]*
     return (1 <= len(name) <= 255 and
-            re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name) is not None)
+            name.isascii() and name.isidentifier())
 
 
 def is_valid_group_name(name: Any) -> bool:
     """Validate macro group name format."""
-    if not isinstance(name, str):
-        return False
-    
+    return isinstance(name, str) and _is_valid_group_name_str(name)
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_group_name_str(name: str) -> bool:
+    """Memoized string check for is_valid_group_name."""
     # Similar to macro names but slightly more restrictive
     return (1 <= len(name) <= 255 and
-            re.match(r'^[a-zA-Z0-9_\s\-]+$', name) is not None and
+            _uses_only(name, _GROUP_NAME_CHARS, _GROUP_NAME_RE) and
             not name.isspace())
 
 
-def is_positive_number(value: Any) -> bool:
-    """Validate that value is a positive number."""
-    if not isinstance(value, (int, float)):
-        return False
-    return value > 0
-
-
-def is_valid_timeout(timeout: Any) -> bool:
-    """Validate timeout value for operations."""
-    if not isinstance(timeout, (int, float)):
-        return False
-    # Timeout should be positive and reasonable (up to 10 minutes)
-    return 0 < timeout <= 600
-
-
 def is_valid_execution_timeout(timeout: Any) -> bool:
     """Validate macro execution timeout value."""
     if not isinstance(timeout, (int, float)):
@@ -117,33 +179,6 @@ def is_valid_execution_timeout(timeout: Any) -> bool:
     return 1 <= timeout <= 300
 
 
-def is_valid_threshold_config(config: Any) -> bool:
-    """Validate performance threshold configuration."""
-    if not isinstance(config, dict):
-        return False
-    
-    required_fields = {'cpu_threshold', 'memory_threshold', 'disk_threshold'}
-    if not all(field in config for field in required_fields):
-        return False
-    
-    # Validate threshold values (percentages 0-100)
-    for field in required_fields:
-        value = config[field]
-        if not isinstance(value, (int, float)):
-            return False
-        if not 0 <= value <= 100:
-            return False
-    
-    return True
-
-
-def is_valid_execution_method(method: Any) -> bool:
-    """Validate macro execution method."""
-    if not isinstance(method, ExecutionMethod):
-        return False
-    return method in ExecutionMethod
-
-
 def validate_variable_scope(scope: Any, instance_id: Optional[str] = None) -> bool:
     """Validate variable scope with context requirements."""
     if not isinstance(scope, VariableScope):
@@ -168,31 +203,27 @@ def is_valid_screen_coordinates(coordinates: Any) -> bool:
         if not isinstance(x, int) or not isinstance(y, int):
             return False
         
-        # Get screen bounds (simplified - would integrate with actual screen detection)
-        screen_bounds = get_screen_bounds()
-        return (0 <= x <= screen_bounds.width and 
-                0 <= y <= screen_bounds.height)
+        # Screen bounds (simplified - would integrate with actual screen detection)
+        return 0 <= x <= _SCREEN_W and 0 <= y <= _SCREEN_H
     except Exception:
         return False
 
 
 def is_valid_screen_area(area: Any) -> bool:
     """Validate screen area definition."""
-    if not hasattr(area, 'top_left') or not hasattr(area, 'bottom_right'):
+    # Both corners checked inline in one pass
+    try:
+        top_left, bottom_right = area.top_left, area.bottom_right
+        x1, y1, x2, y2 = top_left.x, top_left.y, bottom_right.x, bottom_right.y
+    except AttributeError:
         return False
     
-    try:
-        # Validate individual coordinates
-        if not is_valid_screen_coordinates(area.top_left):
-            return False
-        if not is_valid_screen_coordinates(area.bottom_right):
-            return False
-        
-        # Validate area is well-formed
-        return (area.bottom_right.x > area.top_left.x and
-                area.bottom_right.y > area.top_left.y)
-    except Exception:
+    if not (isinstance(x1, int) and isinstance(y1, int) and
+            isinstance(x2, int) and isinstance(y2, int)):
         return False
+    
+    # Well-formed (bottom-right strictly beyond top-left) and within screen bounds
+    return 0 <= x1 < x2 <= _SCREEN_W and 0 <= y1 < y2 <= _SCREEN_H
 
 
 def is_valid_confidence_score(score: Any) -> bool:
@@ -210,82 +241,83 @@ def is_valid_file_path(path: Any) -> bool:
     if not isinstance(path, str):
         return False
     
-    try:
-        path_obj = Path(path)
-        # Check if path is well-formed and within reasonable length
-        return (len(path) <= 4096 and  # Reasonable path length limit
-                path_obj.is_absolute() and  # Require absolute paths for security
-                not any(part.startswith('.') for part in path_obj.parts[1:]))  # No hidden dirs
-    except Exception:
+    # Check path is well-formed and within reasonable length
+    if len(path) > 4096 or not path.startswith('/'):  # Require absolute paths for security
         return False
+    if '/.' not in path:
+        return True
+    # No hidden dirs ('.' components are no-ops, as pathlib normalizes them away)
+    return not any(part[:1] == '.' and part != '.' for part in path.split('/'))
 
 
-def file_exists_and_readable(path: str) -> bool:
+def file_exists_and_readable(path: Union[str, os.PathLike]) -> bool:
     """Validate file exists and is readable."""
+    # os.access is already False for a missing path, so no separate exists()
     try:
-        return os.path.exists(path) and os.access(path, os.R_OK)
-    except Exception:
+        return os.access(path, os.R_OK)
+    except (TypeError, ValueError):  # Not a path, or embedded NUL
         return False
 
 
-def directory_exists_and_writable(path: str) -> bool:
+def directory_exists_and_writable(path: Union[str, os.PathLike]) -> bool:
     """Validate directory exists and is writable."""
+    # isdir implies exists and already returns False on OS errors
     try:
-        return (os.path.exists(path) and 
-                os.path.isdir(path) and 
-                os.access(path, os.W_OK))
-    except Exception:
+        return os.path.isdir(path) and os.access(path, os.W_OK)
+    except TypeError:  # Not a path
         return False
 
 
 def is_valid_application_identifier(identifier: Any) -> bool:
     """Validate application identifier (bundle ID or name)."""
-    if not isinstance(identifier, str):
-        return False
-    
+    return isinstance(identifier, str) and _is_valid_application_identifier_str(identifier)
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_application_identifier_str(identifier: str) -> bool:
+    """Memoized string check for is_valid_application_identifier."""
     if len(identifier) == 0 or len(identifier) > 255:
         return False
     
     # Bundle ID format: com.company.appname
-    bundle_id_pattern = r'^[a-zA-Z0-9]+(\.[a-zA-Z0-9]+){2,}$'
-    if re.match(bundle_id_pattern, identifier):
+    if _BUNDLE_ID_RE.fullmatch(identifier):
         return True
     
     # Application name: alphanumeric with common symbols
-    app_name_pattern = r'^[a-zA-Z0-9_\s\-\.]+$'
-    return re.match(app_name_pattern, identifier) is not None
+    return _uses_only(identifier, _MACRO_NAME_CHARS, _APP_NAME_RE)
 
 
 # Security and Safety Validators
 
+# Scripts longer than this are scanned without memoization so the cache
+# never pins large script bodies in memory
+_SCRIPT_CACHE_MAX_LEN = 4096
+
+
 def is_safe_script_content(script: str) -> bool:
     """Validate script content for security (AppleScript, shell, etc.)."""
     if not isinstance(script, str):
         return False
-    
+    if len(script) <= _SCRIPT_CACHE_MAX_LEN:
+        return _is_safe_script_str(script)
+    return _is_safe_script_str.__wrapped__(script)
+
+
+@lru_cache(maxsize=2048)
+def _is_safe_script_str(script: str) -> bool:
+    """Memoized (for short scripts) check for is_safe_script_content."""
     if len(script.strip()) == 0:
         return False
     
     # Check for dangerous patterns
-    dangerous_patterns = [
-        r'rm\s+-rf',           # Dangerous file deletion
-        r'sudo\s+',            # Privilege escalation
-        r'eval\s*\(',          # Code injection
-        r'exec\s*\(',          # Code execution
-        r'system\s*\(',        # System command execution
-        r'os\.system',         # Python system calls
-        r'subprocess\.',       # Python subprocess
-        r'shell_exec',         # PHP shell execution
-        r'passthru',           # PHP command execution
-        r'curl.*\|.*sh',       # Download and execute
-        r'wget.*\|.*sh',       # Download and execute
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, script, re.IGNORECASE):
-            return False
-    
-    return True
+    if script.isascii():
+        # Every pattern contains one of these keywords; most scripts have none
+        lowered = script.lower()
+        if not any(keyword in lowered for keyword in _SCRIPT_KEYWORDS):
+            return True
+        if _DANGEROUS_SCRIPT_RE2 is not None:
+            return _DANGEROUS_SCRIPT_RE2.search(script) is None
+    return _DANGEROUS_SCRIPT_RE.search(script) is None
 
 
 def is_valid_email_address(email: Any) -> bool:
@@ -294,9 +326,8 @@ def is_valid_email_address(email: Any) -> bool:
         return False
     
     # Basic email validation pattern
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return (len(email) <= 320 and  # RFC 5321 limit
-            re.match(email_pattern, email) is not None)
+            _EMAIL_RE.fullmatch(email) is not None)
 
 
 def is_valid_phone_number(phone: Any) -> bool:
@@ -304,13 +335,14 @@ def is_valid_phone_number(phone: Any) -> bool:
     if not isinstance(phone, str):
         return False
     
-    # Remove common formatting characters
-    clean_phone = re.sub(r'[\s\-\(\)\+\.]', '', phone)
+    # Remove common formatting characters (regex only for Unicode whitespace)
+    if phone.isascii():
+        clean_phone = phone.translate(_PHONE_STRIP_CHARS)
+    else:
+        clean_phone = _PHONE_STRIP_RE.sub('', phone)
     
     # Check for valid phone number patterns
-    return (len(clean_phone) >= 10 and 
-            len(clean_phone) <= 15 and
-            clean_phone.isdigit())
+    return 10 <= len(clean_phone) <= 15 and clean_phone.isdigit()
 
 
 # Numeric and Performance Validators
@@ -335,15 +367,14 @@ def is_valid_threshold_config(config: Any) -> bool:
     if not isinstance(config, dict):
         return False
     
-    required_fields = {'cpu_threshold', 'memory_threshold', 'response_time_threshold'}
-    if not all(field in config for field in required_fields):
+    # Required fields read once; a missing one fails validation
+    try:
+        cpu_threshold = config['cpu_threshold']
+        memory_threshold = config['memory_threshold']
+        response_time_threshold = config['response_time_threshold']
+    except KeyError:
         return False
     
-    # Validate threshold values
-    cpu_threshold = config.get('cpu_threshold')
-    memory_threshold = config.get('memory_threshold')
-    response_time_threshold = config.get('response_time_threshold')
-    
     # CPU threshold: 0-100%
     if not isinstance(cpu_threshold, (int, float)) or not (0 <= cpu_threshold <= 100):
         return False
@@ -361,13 +392,8 @@ def is_valid_threshold_config(config: Any) -> bool:
 
 def is_valid_execution_method(method: Any) -> bool:
     """Validate execution method enum value."""
-    from ..types.enumerations import ExecutionMethod
-    
-    if not isinstance(method, ExecutionMethod):
-        return False
-    
     # All enum values are valid
-    return True
+    return isinstance(method, ExecutionMethod)
 
 
 # Business Logic Validators
@@ -418,21 +444,23 @@ def macro_exists(macro_id: str) -> bool:
 # Composite Validators
 
 def validate_macro_creation_data(macro_data: Dict[str, Any]) -> List[str]:
-    """Comprehensive validation for macro creation data."""
-    violations = []
+    """Comprehensive validation for macro creation data.
     
+    Fails fast: group and uniqueness checks (Keyboard Maestro queries) are
+    skipped once an earlier check has already failed.
+    """
     if not is_valid_macro_structure(macro_data):
-        violations.append("Invalid macro structure")
+        return ["Invalid macro structure"]
     
-    if 'group_id' in macro_data and macro_data['group_id'] is not None:
-        if not group_exists(macro_data['group_id']):
-            violations.append("Target group does not exist")
+    group_id = macro_data.get('group_id')
+    if group_id is not None and not group_exists(group_id):
+        # Uniqueness within a missing group is moot
+        return ["Target group does not exist"]
     
-    if not name_is_unique_in_group(macro_data['name'], 
-                                   macro_data.get('group_id')):
-        violations.append("Macro name not unique in target group")
+    if not name_is_unique_in_group(macro_data['name'], group_id):
+        return ["Macro name not unique in target group"]
     
-    return violations
+    return []
 
 
 def validate_file_operation_data(operation: str, source: str, 
@@ -458,58 +486,74 @@ def validate_file_operation_data(operation: str, source: str,
 
 # Server Configuration Validators
 
+_VALID_TRANSPORTS = frozenset({"stdio", "streamable-http", "websocket"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
 def is_valid_server_configuration(config: Any) -> bool:
     """Validate server configuration object completeness and correctness."""
-    if not hasattr(config, 'transport') or not hasattr(config, 'host'):
-        return False
-    if not hasattr(config, 'port') or not hasattr(config, 'max_concurrent_operations'):
+    # Fields that are only required to exist
+    if not (hasattr(config, 'host') and hasattr(config, 'auth_required') and
+            hasattr(config, 'development_mode')):
         return False
-    if not hasattr(config, 'operation_timeout') or not hasattr(config, 'auth_required'):
-        return False
-    if not hasattr(config, 'log_level') or not hasattr(config, 'development_mode'):
+    
+    # Read every validated attribute once; any missing one fails validation
+    try:
+        transport = config.transport
+        port = config.port
+        max_concurrent_operations = config.max_concurrent_operations
+        operation_timeout = config.operation_timeout
+        log_level = config.log_level
+    except AttributeError:
         return False
     
     # Validate transport type
-    if config.transport not in ["stdio", "streamable-http", "websocket"]:
+    if transport not in _VALID_TRANSPORTS:
         return False
     
     # Validate port range for network transports
-    if config.transport != "stdio" and not (1024 <= config.port <= 65535):
+    if transport != "stdio" and not (1024 <= port <= 65535):
         return False
     
     # Validate operational parameters
-    if config.max_concurrent_operations <= 0 or config.operation_timeout <= 0:
+    if max_concurrent_operations <= 0 or operation_timeout <= 0:
         return False
     
     # Validate log level
-    valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-    if config.log_level.upper() not in valid_levels:
-        return False
-    
-    return True
+    return log_level.upper() in _VALID_LOG_LEVELS
 
 
 # Utility functions
 
+class _ScreenBounds:
+    """Fixed screen bounds placeholder."""
+    __slots__ = ('width', 'height')
+    
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+
+_SCREEN_BOUNDS = _ScreenBounds(_SCREEN_W, _SCREEN_H)
+
+
 def get_screen_bounds():
     """Get current screen bounds (simplified implementation)."""
     # In real implementation, would use AppKit/Cocoa to get actual screen bounds
     # For now, return common screen size as placeholder
-    class ScreenBounds:
-        width = 1920
-        height = 1080
-    
-    return ScreenBounds()
+    return _SCREEN_BOUNDS
 
 
-def get_required_parameters(trigger_type: TriggerType) -> Set[str]:
-    """Get required parameters for trigger type."""
-    parameter_map = {
-        TriggerType.HOTKEY: {'key', 'modifiers'},
-        TriggerType.APPLICATION: {'application_identifier'},
-        TriggerType.TIME: {'schedule'},
-        TriggerType.SYSTEM: {'system_event'},
-        TriggerType.FILE_FOLDER: {'path', 'file_event'},
-    }
-    
-    return parameter_map.get(trigger_type, set())
+_TRIGGER_PARAMETERS: Dict[TriggerType, FrozenSet[str]] = {
+    TriggerType.HOTKEY: frozenset({'key', 'modifiers'}),
+    TriggerType.APPLICATION: frozenset({'application_identifier'}),
+    TriggerType.TIME: frozenset({'schedule'}),
+    TriggerType.SYSTEM: frozenset({'system_event'}),
+    TriggerType.FILE_FOLDER: frozenset({'path', 'file_event'}),
+}
+_NO_PARAMETERS: FrozenSet[str] = frozenset()
+
+
+def get_required_parameters(trigger_type: TriggerType) -> FrozenSet[str]:
+    """Get required parameters for trigger type (shared, immutable)."""
+    return _TRIGGER_PARAMETERS.get(trigger_type, _NO_PARAMETERS)
@@ -0,0 +1,73 @@
+# src/contracts/validators_batch.py
+"""
+Batch Name Validation - Optional Numba-accelerated bulk entry point.
+
+Bulk importers validating many macro names at once can call
+``validate_many_names`` instead of looping over ``is_valid_macro_name``.
+When Numba and NumPy are installed, ASCII names are packed into one byte
+buffer and checked by a parallel JIT kernel (compiled artifact cached on
+disk); otherwise, and for non-ASCII names, the pure-Python validator is used.
+Results are identical either way.
+"""
+
+from itertools import accumulate
+from typing import Any, List, Sequence
+
+from .validators import is_valid_macro_name
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Optional dependency: fall back to the Python validator
+    HAS_NUMBA = False
+
+# Below this size JIT dispatch and buffer packing cost more than they save
+NUMBA_MIN_BATCH = 256
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _macro_name_kernel(blob, offsets):
+        """Check each packed ASCII name against the macro name rules."""
+        count = offsets.shape[0] - 1
+        out = np.zeros(count, dtype=np.bool_)
+        for i in prange(count):
+            start = offsets[i]
+            end = offsets[i + 1]
+            if end - start < 1 or end - start > 255:
+                continue
+            valid = True
+            all_space = True
+            for j in range(start, end):
+                c = blob[j]
+                # ASCII \s: \t-\r, \x1c-\x1f and space
+                if (9 <= c <= 13) or (28 <= c <= 32):
+                    continue
+                all_space = False
+                if not ((65 <= c <= 90) or (97 <= c <= 122) or (48 <= c <= 57) or
+                        c == 95 or c == 45 or c == 46):  # _ - .
+                    valid = False
+                    break
+            out[i] = valid and not all_space
+        return out
+
+
+def validate_many_names(names: Sequence[Any]) -> List[bool]:
+    """Validate many macro names at once; same result as is_valid_macro_name per item."""
+    names = list(names)
+    if not HAS_NUMBA or len(names) < NUMBA_MIN_BATCH:
+        return [is_valid_macro_name(name) for name in names]
+
+    # Non-str and non-ASCII items go through the Python validator; they are
+    # packed as empty strings so offsets stay aligned
+    packed = [name if isinstance(name, str) and name.isascii() else '' for name in names]
+    blob = np.frombuffer(''.join(packed).encode('ascii'), dtype=np.uint8)
+    offsets = np.fromiter(accumulate(map(len, packed), initial=0),
+                          dtype=np.int64, count=len(packed) + 1)
+    results = _macro_name_kernel(blob, offsets).tolist()
+
+    for index, name in enumerate(names):
+        if packed[index] is not name:
+            results[index] = is_valid_macro_name(name)
+    return results
@@ -30,7 +30,8 @@ Architecture:
 - Performance optimization with connection pooling
 """
 
-from typing import TYPE_CHECKING
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
 # Package metadata
 __all__ = [
@@ -42,10 +43,36 @@ __all__ = [
     "VariableOperations",
 ]
 
-# Conditional imports for type checking
+# Public name -> defining submodule; loaded on first access (PEP 562) so
+# ``import src.core`` does not pull in the server and its dependencies
+_LAZY_IMPORTS = {
+    "KeyboardMaestroMCPServer": ".mcp_server",
+    "ToolRegistry": ".tool_registry",
+    "MCPContextManager": ".context_manager",
+    "KeyboardMaestroInterface": ".km_interface",
+    "MacroOperations": ".macro_operations",
+    "VariableOperations": ".variable_operations",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public component from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# Imports for type checking only
 if TYPE_CHECKING:
-    from .core.mcp_server import KeyboardMaestroMCPServer
-    from core.tool_registry import ToolRegistry
+    from .mcp_server import KeyboardMaestroMCPServer
+    from .tool_registry import ToolRegistry
     from .context_manager import MCPContextManager
     from .km_interface import KeyboardMaestroInterface
     from .macro_operations import MacroOperations
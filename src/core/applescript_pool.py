@@ -10,21 +10,28 @@ to ensure reliable Keyboard Maestro integration.
 
 Features:
 - Connection pooling with configurable limits and timeouts
+- In-process execution through OSAKit when PyObjC is installed, otherwise
+  one persistent osascript process per connection
 - Health monitoring and automatic connection recycling
-- Backpressure handling with queue management
+- Timer-driven idle cleanup (no wakeups for an idle pool)
+- Backpressure handling with FIFO wait queue (no polling)
 - Resource cleanup and memory optimization
 - Performance metrics and monitoring
-
-Size: 248 lines (target: <250)
 """
 
 import asyncio
+import atexit
+import hashlib
+import itertools
 import logging
+import re
+import shutil
+import tempfile
 import time
-from typing import Dict, Optional, List, Set, AsyncContextManager
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, List, Set, AsyncContextManager, NamedTuple, Sequence
 from dataclasses import dataclass
-from contextlib import asynccontextmanager
-from collections import deque
 import weakref
 
 from src.types.domain_types import ConnectionStatus, PoolStatus
@@ -32,8 +39,15 @@ from src.contracts.decorators import requires, ensures
 from src.contracts.validators import is_positive_number
 from src.utils.configuration import ServerConfiguration
 
+try:  # Optional: PyObjC on macOS runs AppleScript in-process via OSAKit
+    from OSAKit import OSALanguage, OSAScript
+    _OSA_LANGUAGE = OSALanguage.languageForName_("AppleScript")
+except ImportError:
+    OSAScript = None
+    _OSA_LANGUAGE = None
+
 
-@dataclass
+@dataclass(slots=True)
 class PoolConfiguration:
     """Configuration for AppleScript connection pool."""
     max_connections: int = 5
@@ -42,6 +56,10 @@ class PoolConfiguration:
     connection_timeout: float = 30.0
     health_check_interval: float = 60.0
     max_queue_size: int = 100
+    check_health: bool = True
+    pool_recycle: float = -1  # Max connection age in seconds; <= 0 disables
+    max_uses: int = -1  # Max scripts per connection; <= 0 disables
+    check_script_prefix: bool = False  # Reject scripts not opening with a known statement
     
     def __post_init__(self):
         """Validate pool configuration."""
@@ -51,9 +69,9 @@ class PoolConfiguration:
             raise ValueError("max_connections must be positive")
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionMetrics:
-    """Metrics for connection tracking."""
+    """Metrics for connection tracking (timestamps from time.monotonic)."""
     connection_id: str
     created_at: float
     last_used: float
@@ -64,26 +82,206 @@ class ConnectionMetrics:
     @property
     def idle_time(self) -> float:
         """Calculate idle time in seconds."""
-        return time.time() - self.last_used
+        return time.monotonic() - self.last_used
     
     @property
     def age(self) -> float:
         """Calculate connection age in seconds."""
-        return time.time() - self.created_at
+        return time.monotonic() - self.created_at
+
+
+class ScriptResult(NamedTuple):
+    """Outcome of one AppleScript execution on a pooled connection."""
+    success: bool
+    output: Optional[str]
+    error: Optional[str]
+    connection_id: str
+
+
+# StreamReader limit for the interactive osascript pipes; typical replies are
+# well under 1KB, and _read_frame handles anything larger in chunks
+_PIPE_LIMIT = 4096
+
+HEALTH_CHECK_SCRIPT = 'return "healthy"'
+
+# Statements a pooled script may open with when check_script_prefix is set;
+# anything else is rejected before it costs an osascript round trip
+_SCRIPT_PREFIX_RE = re.compile(
+    r'\s*(?:(?:tell|return|set|repeat|if|on|to|try|use|property|global|local|'
+    r'log|delay|activate|display|run|copy|get)\b|do shell script\b|--|\(\*)',
+    re.IGNORECASE
+)
+
+# Scripts at least this long are compiled on first use; shorter ones on repeat
+COMPILE_MIN_LENGTH = 512
+_MAX_TRACKED_SCRIPTS = 1024
+
+# Backslash and double quote escaped in one pass for AppleScript string literals
+_APPLESCRIPT_STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+# As above, plus line breaks, so a whole script fits one REPL line
+_APPLESCRIPT_LINE_ESCAPES = str.maketrans({
+    '\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'
+})
+
+# Run inside `run script` on the interactive child: errors become an error
+# frame and the result is coerced to text (lists joined as osascript -e does)
+_FRAME_TEMPLATE = """set kmDelimiters to AppleScript's text item delimiters
+try
+\tset kmResult to {expression}
+on error kmMessage number kmNumber
+\treturn "{error_tag}" & kmMessage & " (" & kmNumber & ")" & "{end_tag}"
+end try
+set AppleScript's text item delimiters to ", "
+try
+\tset kmText to kmResult as text
+on error
+\tset kmText to ""
+end try
+set AppleScript's text item delimiters to kmDelimiters
+return "{result_tag}" & kmText & "{end_tag}"
+"""
+
+# Quoted REPL echoes escape backslashes and double quotes
+_ECHO_ESCAPE_RE = re.compile(r'\\(["\\])')
+
+
+_script_directory: Optional[Path] = None
+
+
+def _private_script_directory() -> Path:
+    """Per-process directory for compiled scripts, removed at exit."""
+    global _script_directory
+    if _script_directory is None:
+        _script_directory = Path(tempfile.mkdtemp(prefix='km_scpt_'))
+        atexit.register(shutil.rmtree, _script_directory, ignore_errors=True)
+    return _script_directory
+
+
+def run_compiled_script(path: Path, args: Sequence[str] = ()) -> str:
+    """AppleScript statement that loads and runs a compiled .scpt file.
+    
+    ``args`` reach the script's ``on run argv`` handler as a list of strings;
+    each is escaped as an AppleScript string literal.
+    """
+    posix_path = str(path).translate(_APPLESCRIPT_STRING_ESCAPES)
+    statement = f'run script (POSIX file "{posix_path}")'
+    if args:
+        literals = ", ".join(f'"{arg.translate(_APPLESCRIPT_STRING_ESCAPES)}"' for arg in args)
+        statement += f" with parameters {{{literals}}}"
+    return statement
+
+
+def _run_source(script: str) -> str:
+    """AppleScript statement that runs script source as one unit."""
+    return f'run script "{script.translate(_APPLESCRIPT_LINE_ESCAPES)}"'
+
+
+class CompiledScriptCache:
+    """Compiles repeated AppleScript source to .scpt files once per pool."""
+    
+    def __init__(self, directory: Optional[Path] = None):
+        self._directory = directory
+        self._paths: Dict[str, Path] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._hits: Dict[str, int] = {}
+        self._failed: Set[str] = set()
+    
+    @staticmethod
+    def script_key(script: str) -> str:
+        """Stable cache key for script source."""
+        return hashlib.blake2b(script.encode('utf-8'), digest_size=16).hexdigest()
+    
+    async def resolve(self, script: str) -> Optional[Path]:
+        """Return compiled script path, compiling once the script is seen again."""
+        key = self.script_key(script)
+        path = self._paths.get(key)
+        if path is not None or key in self._failed:
+            return path
+        
+        if key not in self._pending and len(script) < COMPILE_MIN_LENGTH:
+            if len(self._hits) >= _MAX_TRACKED_SCRIPTS:
+                self._hits.clear()
+            hits = self._hits.get(key, 0) + 1
+            self._hits[key] = hits
+            if hits < 2:
+                return None
+        return await self.compile(script)
+    
+    async def compile(self, script: str) -> Optional[Path]:
+        """Compile script with osacompile; concurrent callers share one compile."""
+        key = self.script_key(script)
+        if key in self._paths or key in self._failed:
+            return self._paths.get(key)
+        
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._osacompile(key, script))
+            self._pending[key] = pending
+        try:
+            return await asyncio.shield(pending)
+        finally:
+            if pending.done():
+                self._pending.pop(key, None)
+    
+    async def _osacompile(self, key: str, script: str) -> Optional[Path]:
+        """Run osacompile; None means fall back to sending source text."""
+        path = (self._directory or _private_script_directory()) / f"km_{key}.scpt"
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'osacompile', '-o', str(path), '-e', script,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            compiled = await process.wait() == 0
+        except OSError:
+            compiled = False
+        
+        if not compiled:
+            # Don't respawn osacompile for scripts it already rejected
+            if len(self._failed) >= _MAX_TRACKED_SCRIPTS:
+                self._failed.clear()
+            self._failed.add(key)
+            return None
+        
+        self._paths[key] = path
+        self._hits.pop(key, None)
+        return path
+    
+    def clear(self) -> None:
+        """Forget compiled scripts and remove their files."""
+        for path in self._paths.values():
+            path.unlink(missing_ok=True)
+        self._paths.clear()
+        self._hits.clear()
+        self._failed.clear()
+
+
+# Shared by every connection in the process so the health probe compiles once
+_shared_scripts = CompiledScriptCache()
 
 
 class AppleScriptConnection:
-    """Individual AppleScript connection wrapper."""
+    """Individual AppleScript connection backed by a persistent osascript process."""
+    
+    __slots__ = ('connection_id', '_script_cache', '_check_prefix', 'metrics',
+                 '_is_healthy', '_lock', '_process')
     
-    def __init__(self, connection_id: str):
+    def __init__(self, connection_id: str,
+                 script_cache: Optional[CompiledScriptCache] = None,
+                 check_prefix: bool = False):
         self.connection_id = connection_id
+        self._script_cache = script_cache
+        self._check_prefix = check_prefix
+        now = time.monotonic()
         self.metrics = ConnectionMetrics(
             connection_id=connection_id,
-            created_at=time.time(),
-            last_used=time.time()
+            created_at=now,
+            last_used=now
         )
         self._is_healthy = True
         self._lock = asyncio.Lock()
+        self._process: Optional[asyncio.subprocess.Process] = None
     
     @property
     def is_available(self) -> bool:
@@ -91,55 +289,159 @@ class AppleScriptConnection:
         return (self._is_healthy and 
                 self.metrics.status == ConnectionStatus.AVAILABLE)
     
-    async def execute_script(self, script: str, timeout: float = 30.0) -> Dict[str, any]:
+    async def _ensure_process(self) -> asyncio.subprocess.Process:
+        """Start the interactive osascript child on first use or after it exits."""
+        if self._process is None or self._process.returncode is not None:
+            self._process = await asyncio.create_subprocess_exec(
+                'osascript', '-i',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_PIPE_LIMIT
+            )
+        return self._process
+    
+    async def _terminate_process(self) -> None:
+        """Kill the osascript child; its stream state is unknown after a failure."""
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+    
+    @staticmethod
+    async def _read_frame(stream: asyncio.StreamReader, sentinel: bytes) -> str:
+        """Read up to the sentinel, consuming the rest of its line."""
+        try:
+            data = await stream.readuntil(sentinel)
+        except asyncio.LimitOverrunError as overrun:
+            # Reply exceeds the stream limit: drain it in chunks that stop
+            # short of the sentinel, then read the remainder
+            chunks = [await stream.readexactly(overrun.consumed)]
+            while True:
+                try:
+                    chunks.append(await stream.readuntil(sentinel))
+                    break
+                except asyncio.LimitOverrunError as more:
+                    chunks.append(await stream.readexactly(more.consumed))
+            data = b''.join(chunks)
+        await stream.readline()
+        return data[:-len(sentinel)].decode('utf-8')
+    
+    def _parse_frame(self, text: str, result_tag: str, error_tag: str) -> ScriptResult:
+        """Extract the tagged result from stdout, ignoring REPL prompts and quoting."""
+        tag_at = max(text.rfind(result_tag), text.rfind(error_tag))
+        if tag_at < 0:
+            return ScriptResult(False, None, "Malformed osascript response", self.connection_id)
+        failed = text.startswith(error_tag, tag_at)
+        payload = text[tag_at + len(error_tag if failed else result_tag):]
+        if tag_at and text[tag_at - 1] == '"':
+            # The REPL echoed the frame as a quoted string literal
+            payload = _ECHO_ESCAPE_RE.sub(r'\1', payload)
+        if failed:
+            return ScriptResult(False, None, payload or "AppleScript execution failed",
+                                self.connection_id)
+        return ScriptResult(True, payload or None, None, self.connection_id)
+    
+    async def _run_framed(self, expression: str) -> ScriptResult:
+        """Run one `run script` expression on the interactive child.
+        
+        The whole request is a single REPL line, so multi-line scripts are
+        evaluated as one unit. Success is decided by the result/error tag in
+        the returned frame; stderr only carries `log` output and the drain
+        marker, so logging does not fail a script.
+        """
+        process = await self._ensure_process()
+        request_id = uuid.uuid4().hex
+        result_tag = f"<<<OK:{request_id}>>>"
+        error_tag = f"<<<ERR:{request_id}>>>"
+        end_tag = f"<<<EOF:{request_id}>>>"
+        frame = _FRAME_TEMPLATE.format(
+            expression=expression, result_tag=result_tag,
+            error_tag=error_tag, end_tag=end_tag
+        )
+        process.stdin.write(
+            f'{_run_source(frame)}\nlog "{end_tag}"\n'.encode('utf-8')
+        )
+        await process.stdin.drain()
+        
+        marker = end_tag.encode('utf-8')
+        output, _ = await asyncio.gather(
+            self._read_frame(process.stdout, marker),
+            self._read_frame(process.stderr, marker)
+        )
+        return self._parse_frame(output, result_tag, error_tag)
+    
+    async def execute_script(self, script: str, timeout: float = 30.0) -> ScriptResult:
         """Execute AppleScript with connection tracking."""
+        if self._check_prefix and not _SCRIPT_PREFIX_RE.match(script):
+            return ScriptResult(
+                False, None,
+                "Script rejected: does not start with a recognised AppleScript statement",
+                self.connection_id
+            )
+        
+        compiled = None
+        if self._script_cache is not None and _OSA_LANGUAGE is None:
+            compiled = await self._script_cache.resolve(script)
+        return await self._execute(script, timeout, compiled)
+    
+    def _execute_native(self, script: str) -> ScriptResult:
+        """Compile and run script in-process through OSAKit (worker thread)."""
+        osa_script = OSAScript.alloc().initWithSource_language_(script, _OSA_LANGUAGE)
+        descriptor, error = osa_script.executeAndReturnError_(None)
+        if descriptor is None:
+            message = error.get("OSAScriptErrorMessageKey") if error else None
+            return ScriptResult(False, None, str(message or error or "AppleScript execution failed"),
+                                self.connection_id)
+        return ScriptResult(True, descriptor.stringValue() or None, None, self.connection_id)
+    
+    async def _execute(self, script: str, timeout: float,
+                       compiled: Optional[Path]) -> ScriptResult:
+        """Run script, or load its compiled form when available, under the lock."""
         async with self._lock:
             if not self._is_healthy:
                 raise RuntimeError(f"Connection {self.connection_id} is not healthy")
             
-            self.metrics.status = ConnectionStatus.IN_USE
-            self.metrics.last_used = time.time()
-            self.metrics.use_count += 1
+            # The lock serialises calls, so metrics are written once at entry
+            # and once on completion rather than field by field mid-call
+            metrics = self.metrics
+            metrics.status = ConnectionStatus.IN_USE
+            failed = True
             
             try:
-                # Execute AppleScript (simplified implementation)
-                process = await asyncio.create_subprocess_exec(
-                    'osascript', '-e', script,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
+                if _OSA_LANGUAGE is not None:
+                    # OSAKit calls block, so they run on the default executor
+                    run = asyncio.get_running_loop().run_in_executor(
+                        None, self._execute_native, script
+                    )
+                elif compiled is not None:
+                    # Load the .scpt instead of having osascript recompile the source
+                    run = self._run_framed(run_compiled_script(compiled))
+                else:
+                    run = self._run_framed(_run_source(script))
+                result = await asyncio.wait_for(run, timeout=timeout)
+                failed = not result.success
+                return result
                 
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), 
-                    timeout=timeout
-                )
-                
-                success = process.returncode == 0
-                output = stdout.decode('utf-8').strip() if stdout else None
-                error = stderr.decode('utf-8').strip() if stderr else None
-                
-                if not success:
-                    self.metrics.error_count += 1
-                
-                return {
-                    'success': success,
-                    'output': output,
-                    'error': error,
-                    'connection_id': self.connection_id
-                }
-                
-            except Exception as e:
-                self.metrics.error_count += 1
+            except BaseException:
+                # A timed-out, cancelled or broken child may still emit stale frames
+                await self._terminate_process()
                 raise
             finally:
-                self.metrics.status = ConnectionStatus.AVAILABLE
+                metrics.status = ConnectionStatus.AVAILABLE
+                metrics.last_used = time.monotonic()
+                metrics.use_count += 1
+                metrics.error_count += failed
     
     async def health_check(self) -> bool:
         """Perform connection health check."""
         try:
-            # Simple health check script
-            result = await self.execute_script('return "healthy"', timeout=5.0)
-            self._is_healthy = result['success']
+            # Simple health check script, compiled once per process
+            compiled = None
+            if _OSA_LANGUAGE is None:
+                compiled = await _shared_scripts.compile(HEALTH_CHECK_SCRIPT)
+            result = await self._execute(HEALTH_CHECK_SCRIPT, 5.0, compiled)
+            self._is_healthy = result.success
             return self._is_healthy
         except Exception:
             self._is_healthy = False
@@ -149,6 +451,38 @@ class AppleScriptConnection:
         """Close connection and cleanup resources."""
         self.metrics.status = ConnectionStatus.CLOSED
         self._is_healthy = False
+        
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+
+class _PooledConnection:
+    """Async context manager checking a connection out of the pool and back in."""
+    
+    __slots__ = ('_pool', '_connection')
+    
+    def __init__(self, pool: 'AppleScriptConnectionPool'):
+        self._pool = pool
+        self._connection: Optional[AppleScriptConnection] = None
+    
+    async def __aenter__(self) -> AppleScriptConnection:
+        # Warm pool: hand out an idle connection without the contract-checked wait path
+        connection = self._pool._take_idle()
+        if connection is None:
+            connection = await self._pool._acquire_connection()
+        self._connection = connection
+        return connection
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            self._pool._return_connection(connection)
 
 
 class AppleScriptConnectionPool:
@@ -160,17 +494,26 @@ class AppleScriptConnectionPool:
         
         # Connection management
         self._connections: Dict[str, AppleScriptConnection] = {}
-        self._available_connections: deque = deque()
-        self._connection_counter = 0
+        self._connection_ids = itertools.count(1)
         self._status = PoolStatus.INITIALIZING
+        self._script_cache = CompiledScriptCache()
+        self._osascript_verified = False
+        
+        # get_pool_metrics sources, re-collected after any connection state change
+        self._metrics_dirty = True
+        self._metrics_sources: List[ConnectionMetrics] = []
+        self._metrics_configuration: Dict[str, any] = {}
         
-        # Queue management
-        self._wait_queue: deque = deque()
-        self._queue_lock = asyncio.Lock()
+        # Queue management: idle connection IDs are handed to waiters in FIFO order
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._available_set: Set[str] = set()
+        self._waiting = 0
         
         # Background tasks
         self._monitor_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
+        self._idle_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._closing_tasks: Set[asyncio.Task] = set()
     
     @property
     def status(self) -> PoolStatus:
@@ -185,12 +528,12 @@ class AppleScriptConnectionPool:
     @property
     def available_connections(self) -> int:
         """Number of available connections."""
-        return len(self._available_connections)
+        return len(self._available_set)
     
     @property
     def queue_size(self) -> int:
         """Current queue size."""
-        return len(self._wait_queue)
+        return self._waiting
     
     async def initialize(self) -> None:
         """Initialize connection pool with minimum connections."""
@@ -198,11 +541,15 @@ class AppleScriptConnectionPool:
             self._logger.info("Initializing AppleScript connection pool...")
             
             # Create minimum connections
-            for _ in range(self._config.min_connections):
-                await self._create_connection()
+            connections = await asyncio.gather(
+                *(self._create_connection() for _ in range(self._config.min_connections))
+            )
+            for connection in connections:
+                self._mark_available(connection.connection_id)
             
-            # Start monitoring task
-            self._monitor_task = asyncio.create_task(self._monitor_connections())
+            # Start health probes; idle cleanup is timer-driven
+            if self._config.check_health:
+                self._monitor_task = asyncio.create_task(self._monitor_connections())
             
             self._status = PoolStatus.ACTIVE
             self._logger.info(f"Connection pool initialized with {self.total_connections} connections")
@@ -212,158 +559,248 @@ class AppleScriptConnectionPool:
             self._logger.error(f"Pool initialization failed: {e}")
             raise
     
-    @asynccontextmanager
-    async def get_connection(self) -> AsyncContextManager[AppleScriptConnection]:
+    def get_connection(self) -> AsyncContextManager[AppleScriptConnection]:
         """Get connection from pool with automatic return."""
-        connection = await self._acquire_connection()
-        try:
-            yield connection
-        finally:
-            await self._return_connection(connection)
+        return _PooledConnection(self)
     
     @requires(lambda timeout: is_positive_number(timeout))
     async def _acquire_connection(self, timeout: float = 30.0) -> AppleScriptConnection:
         """Acquire connection from pool with timeout."""
-        start_time = time.time()
+        deadline = None
         
-        while time.time() - start_time < timeout:
-            # Try to get available connection
-            if self._available_connections:
-                connection_id = self._available_connections.popleft()
-                connection = self._connections.get(connection_id)
-                
-                if connection and connection.is_available:
-                    return connection
-                
-                # Connection not available, remove from pool
-                if connection_id in self._connections:
-                    del self._connections[connection_id]
+        while True:
+            connection = self._take_idle()
+            if connection is not None:
+                return connection
             
             # Try to create new connection if under limit
             if self.total_connections < self._config.max_connections:
                 return await self._create_connection()
             
             # Queue is full
-            if self.queue_size >= self._config.max_queue_size:
+            if self._waiting >= self._config.max_queue_size:
                 raise RuntimeError("Connection pool queue is full")
             
-            # Wait for connection to become available
-            await asyncio.sleep(0.1)
+            # Wait until _return_connection hands a connection back; the clock
+            # is only read once a wait is actually needed
+            loop = asyncio.get_running_loop()
+            if deadline is None:
+                deadline = loop.time() + timeout
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"Failed to acquire connection within {timeout} seconds")
+            self._waiting += 1
+            try:
+                connection_id = await asyncio.wait_for(self._idle.get(), remaining)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Failed to acquire connection within {timeout} seconds") from None
+            finally:
+                self._waiting -= 1
+            
+            connection = self._claim_idle(connection_id)
+            if connection is not None:
+                return connection
+    
+    def _take_idle(self) -> Optional[AppleScriptConnection]:
+        """Pop a usable idle connection without awaiting; None if there is none."""
+        while True:
+            try:
+                connection_id = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+            connection = self._claim_idle(connection_id)
+            if connection is not None:
+                return connection
+    
+    def _claim_idle(self, connection_id: str) -> Optional[AppleScriptConnection]:
+        """Claim a dequeued idle ID, retiring it if stale or due for recycling."""
+        # IDs discarded while queued are tombstones; skip them
+        if connection_id not in self._available_set:
+            return None
+        self._available_set.discard(connection_id)
+        timer = self._idle_timers.pop(connection_id, None)
+        if timer is not None:
+            timer.cancel()
         
-        raise TimeoutError(f"Failed to acquire connection within {timeout} seconds")
+        connection = self._connections.get(connection_id)
+        self._metrics_dirty = True
+        if (connection and connection.is_available and
+                not self._should_recycle(connection)):
+            return connection
+        
+        # Connection not available or due for recycling, remove from pool
+        self._connections.pop(connection_id, None)
+        if connection:
+            self._close_in_background(connection)
+            self._logger.debug(f"Retired connection {connection_id}")
+        return None
+    
+    def _close_in_background(self, connection: AppleScriptConnection) -> None:
+        """Close connection without blocking the caller; shutdown awaits these."""
+        task = asyncio.create_task(connection.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
     
-    async def _return_connection(self, connection: AppleScriptConnection) -> None:
+    def _return_connection(self, connection: AppleScriptConnection) -> None:
         """Return connection to pool."""
+        self._metrics_dirty = True
         if (connection.connection_id in self._connections and 
             connection.is_available):
-            self._available_connections.append(connection.connection_id)
+            self._mark_available(connection.connection_id)
         else:
-            # Remove unhealthy connection
-            if connection.connection_id in self._connections:
-                del self._connections[connection.connection_id]
+            # Remove unhealthy connection and stop its osascript child
+            self._connections.pop(connection.connection_id, None)
+            self._close_in_background(connection)
+    
+    def _should_recycle(self, connection: AppleScriptConnection) -> bool:
+        """Check whether connection exceeded its configured age or use limit."""
+        metrics = connection.metrics
+        return ((0 < self._config.pool_recycle < time.monotonic() - metrics.created_at) or
+                (0 < self._config.max_uses <= metrics.use_count))
+    
+    def _mark_available(self, connection_id: str) -> None:
+        """Queue connection as idle unless it is already queued."""
+        self._metrics_dirty = True
+        if connection_id not in self._available_set:
+            self._available_set.add(connection_id)
+            self._idle.put_nowait(connection_id)
+            self._idle_timers[connection_id] = asyncio.get_running_loop().call_later(
+                self._config.max_idle_time, self._expire_idle, connection_id
+            )
+    
+    def _discard_idle(self, connection_ids: Set[str]) -> None:
+        """Drop connection IDs from the idle set; queued copies become tombstones."""
+        self._metrics_dirty = True
+        self._available_set.difference_update(connection_ids)
+        for connection_id in connection_ids:
+            timer = self._idle_timers.pop(connection_id, None)
+            if timer is not None:
+                timer.cancel()
+    
+    def _expire_idle(self, connection_id: str) -> None:
+        """Close a connection that stayed idle for max_idle_time."""
+        self._idle_timers.pop(connection_id, None)
+        # Keep minimum connections
+        if (connection_id not in self._available_set or
+                self.total_connections <= self._config.min_connections):
+            return
+        
+        self._available_set.discard(connection_id)
+        connection = self._connections.pop(connection_id, None)
+        self._metrics_dirty = True
+        if connection:
+            self._close_in_background(connection)
+            self._logger.debug(f"Closed idle connection {connection_id}")
     
     async def _create_connection(self) -> AppleScriptConnection:
         """Create new connection with validation."""
-        self._connection_counter += 1
-        connection_id = f"applescript_conn_{self._connection_counter}"
+        connection_id = f"applescript_conn_{next(self._connection_ids)}"
         
-        connection = AppleScriptConnection(connection_id)
+        connection = AppleScriptConnection(
+            connection_id, self._script_cache, self._config.check_script_prefix
+        )
         
-        # Test connection health
-        if not await connection.health_check():
-            raise RuntimeError(f"Failed to create healthy connection {connection_id}")
+        # Probe only until osascript is known to work; the monitor loop
+        # catches connections that die later
+        if not self._osascript_verified:
+            if not await connection.health_check():
+                await connection.close()
+                raise RuntimeError(f"Failed to create healthy connection {connection_id}")
+            self._osascript_verified = True
         
         self._connections[connection_id] = connection
+        self._metrics_dirty = True
         self._logger.debug(f"Created connection {connection_id}")
         
         return connection
     
     async def _monitor_connections(self) -> None:
-        """Background task to monitor connection health and cleanup."""
+        """Background task that periodically probes connection health."""
         while not self._shutdown_event.is_set():
+            delay = self._config.health_check_interval
             try:
                 await self._health_check_connections()
-                await self._cleanup_idle_connections()
-                await asyncio.sleep(self._config.health_check_interval)
             except Exception as e:
                 self._logger.error(f"Connection monitoring error: {e}")
-                await asyncio.sleep(10)  # Reduced interval on error
-    
-    async def _health_check_connections(self) -> None:
-        """Perform health checks on all connections."""
-        unhealthy_connections = []
-        
-        for connection_id, connection in self._connections.items():
-            if not await connection.health_check():
-                unhealthy_connections.append(connection_id)
-                self._logger.warning(f"Connection {connection_id} failed health check")
-        
-        # Remove unhealthy connections
-        for connection_id in unhealthy_connections:
-            connection = self._connections.pop(connection_id, None)
-            if connection:
-                await connection.close()
+                delay = min(delay, 10)  # Reduced interval on error
             
-            # Remove from available queue
+            # Sleep until the next probe, waking immediately on shutdown
             try:
-                self._available_connections.remove(connection_id)
-            except ValueError:
-                pass  # Already removed
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
     
-    async def _cleanup_idle_connections(self) -> None:
-        """Clean up idle connections exceeding max idle time."""
-        if self.total_connections <= self._config.min_connections:
+    async def _health_check_connections(self) -> None:
+        """Perform health checks on idle connections concurrently."""
+        if not self._config.check_health:
             return
         
-        idle_connections = []
-        current_time = time.time()
+        # Connections used within the last half interval just proved healthy
+        recent_threshold = self._config.health_check_interval / 2
+        now = time.monotonic()
+        candidates = [
+            connection for connection in self._connections.values()
+            if (now - connection.metrics.last_used > recent_threshold and
+                connection.metrics.status == ConnectionStatus.AVAILABLE)
+        ]
+        if not candidates:
+            return
         
-        for connection_id, connection in self._connections.items():
-            if (connection.metrics.idle_time > self._config.max_idle_time and
-                connection.metrics.status == ConnectionStatus.AVAILABLE):
-                idle_connections.append(connection_id)
+        results = await asyncio.gather(
+            *(connection.health_check() for connection in candidates),
+            return_exceptions=True
+        )
         
-        # Keep minimum connections
-        max_to_remove = self.total_connections - self._config.min_connections
-        connections_to_remove = idle_connections[:max_to_remove]
+        unhealthy_connections = []
+        for connection, healthy in zip(candidates, results):
+            if healthy is not True:
+                unhealthy_connections.append(connection.connection_id)
+                self._logger.warning(f"Connection {connection.connection_id} failed health check")
         
-        for connection_id in connections_to_remove:
+        # Remove unhealthy connections
+        for connection_id in unhealthy_connections:
             connection = self._connections.pop(connection_id, None)
             if connection:
                 await connection.close()
-                self._logger.debug(f"Closed idle connection {connection_id}")
-            
-            # Remove from available queue
-            try:
-                self._available_connections.remove(connection_id)
-            except ValueError:
-                pass
+        
+        # Remove from available queue
+        self._discard_idle(set(unhealthy_connections))
+        self._metrics_dirty = True
     
     async def get_pool_metrics(self) -> Dict[str, any]:
-        """Get comprehensive pool metrics."""
-        connection_metrics = [
-            {
-                'id': conn.connection_id,
-                'age': conn.metrics.age,
-                'idle_time': conn.metrics.idle_time,
-                'use_count': conn.metrics.use_count,
-                'error_count': conn.metrics.error_count,
-                'status': conn.metrics.status.value
+        """Get comprehensive pool metrics.
+        
+        The connection list is re-collected only after a state change; every
+        call builds fresh rows from the live connection metrics, so callers
+        own the returned payload.
+        """
+        now = time.monotonic()
+        if self._metrics_dirty:
+            self._metrics_sources = [conn.metrics for conn in self._connections.values()]
+            self._metrics_configuration = {
+                'max_connections': self._config.max_connections,
+                'min_connections': self._config.min_connections,
+                'max_idle_time': self._config.max_idle_time
             }
-            for conn in self._connections.values()
-        ]
+            self._metrics_dirty = False
         
         return {
             'pool_status': self._status.value,
             'total_connections': self.total_connections,
             'available_connections': self.available_connections,
             'queue_size': self.queue_size,
-            'connection_metrics': connection_metrics,
-            'configuration': {
-                'max_connections': self._config.max_connections,
-                'min_connections': self._config.min_connections,
-                'max_idle_time': self._config.max_idle_time
-            }
+            'connection_metrics': [
+                {
+                    'id': metrics.connection_id,
+                    'age': now - metrics.created_at,
+                    'idle_time': now - metrics.last_used,
+                    'use_count': metrics.use_count,
+                    'error_count': metrics.error_count,
+                    'status': metrics.status.value
+                }
+                for metrics in self._metrics_sources
+            ],
+            'configuration': dict(self._metrics_configuration)
         }
     
     async def shutdown(self) -> None:
@@ -380,10 +817,13 @@ class AppleScriptConnectionPool:
             # Close all connections
             for connection in self._connections.values():
                 await connection.close()
+            if self._closing_tasks:
+                await asyncio.gather(*self._closing_tasks, return_exceptions=True)
             
+            self._discard_idle(set(self._connections))
             self._connections.clear()
-            self._available_connections.clear()
-            self._wait_queue.clear()
+            self._script_cache.clear()
+            self._metrics_dirty = True
             
             self._status = PoolStatus.SHUTDOWN
             self._logger.info("Connection pool shutdown complete")
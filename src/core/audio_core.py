@@ -5,24 +5,24 @@ This module implements audio playback, volume control, and text-to-speech
 conversion using macOS built-in capabilities through AppleScript and shell commands.
 
 Features:
-- Sound file playback through afplay
-- System volume control through AppleScript
-- Text-to-speech using macOS say command
+- Sound file playback through afplay (executed directly, no AppleScript)
+- System volume control through AppleScript on a persistent osascript process
+- Text-to-speech using macOS say command (executed directly, no AppleScript)
 - Audio device management through system commands
-
-Size: 247 lines (target: <250)
 """
 
 import asyncio
 import logging
 import re
-from typing import Dict, Any, Optional, List, Tuple
-import os
+from typing import Dict, Any, Optional, List, Set, Tuple, NamedTuple, Sequence
 import time
 from dataclasses import dataclass
 
-from .contracts.decorators import requires, ensures
+from src.contracts.decorators import requires, ensures
 from src.core.km_interface import KMInterface
+from src.core.applescript_pool import (
+    AppleScriptConnection, CompiledScriptCache, ScriptResult, run_compiled_script
+)
 from src.validators.system_validators import system_validator
 from src.types.enumerations import AudioOperation, VoiceGender
 from src.types.domain_types import AudioDevice
@@ -30,8 +30,76 @@ from src.types.domain_types import AudioDevice
 
 logger = logging.getLogger(__name__)
 
+AFPLAY_PATH = "/usr/bin/afplay"
+SAY_PATH = "/usr/bin/say"
+SYSTEM_PROFILER_PATH = "/usr/sbin/system_profiler"
+
+# Upper bound on afplay/say/system_profiler children one AudioCore runs at once
+MAX_CONCURRENT_PROCESSES = 4
+
+# Longer text is piped to say on stdin rather than passed as one argv
+# element, which would run into the kernel's ARG_MAX limit
+SAY_ARGV_MAX_CHARS = 32768
+
+# Installed voices only change through System Settings, so a listing is reused
+VOICE_CACHE_TTL = 300.0
+
+# A system_profiler SPAudioDataType device block: an 8-space indented
+# "Name:" header followed by its more deeply indented property lines
+_DEVICE_BLOCK_RE = re.compile(r'^ {8}(\S[^:\n]*):[ \t]*\n((?:[ \t]*\n| {9,}\S.*\n?)*)', re.MULTILINE)
+_DEFAULT_DEVICE_RE = re.compile(r'^\s*Default [^:\n]*Device: Yes', re.MULTILINE)
+# Voice name of each `say -v ?` line: everything before the locale column,
+# so multi-word names such as "Bad News" or "Eddy (English (US))" stay whole
+_VOICE_NAME_RE = re.compile(r'^(\S.*?)\s+[a-z]{2,3}[_-]\w+\s+#', re.MULTILINE)
+
+# Volume level in AppleScript output: the last standalone integer, so a REPL
+# prompt, quoting or stray stderr text around it does not break parsing
+_VOLUME_RE = re.compile(r'(?<![\w.])\d{1,3}(?![\w.])')
+
+# Fixed volume scripts, compiled once and run with argv parameters
+_SET_VOLUME_SCRIPT = "on run argv\n\tset volume output volume (item 1 of argv as integer)\nend run"
+_GET_VOLUME_SCRIPT = "get output volume of (get volume settings)"
+
+# One-line mute statements, sent to the osascript child as source
+_MUTE_SCRIPT = "set volume with output muted"
+_UNMUTE_SCRIPT = "set volume without output muted"
+
+
+class _CommandResult(NamedTuple):
+    """Outcome of a directly executed command (same fields as script results)."""
+    success: bool
+    output: Optional[str]
+    error: Optional[str]
+
+
+async def _run_shell(argv: Sequence[str], timeout: float,
+                     input: Optional[bytes] = None) -> _CommandResult:
+    """Run a command from an argv list without a shell or AppleScript wrapper.
+    
+    Arguments are passed verbatim, so no quoting or escaping is needed.
+    ``input``, when given, is streamed to the command's stdin.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(input), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return _CommandResult(False, None, f"{argv[0]} timed out after {timeout} seconds")
+    
+    output = stdout.decode('utf-8', 'replace').strip() or None
+    error = stderr.decode('utf-8', 'replace').strip() or None
+    if process.returncode != 0:
+        return _CommandResult(False, output, error or f"{argv[0]} exited with status {process.returncode}")
+    return _CommandResult(True, output, None)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioResult:
     """Result of an audio operation."""
     success: bool
@@ -42,7 +110,7 @@ class AudioResult:
     output: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TTSResult:
     """Result of a text-to-speech operation."""
     success: bool
@@ -55,6 +123,31 @@ class TTSResult:
     error_code: Optional[str] = None
 
 
+def _parse_volume(output: Optional[str]) -> Optional[int]:
+    """Extract a 0-100 volume level from script output; None if there is none."""
+    levels = _VOLUME_RE.findall(output or "")
+    if not levels or int(levels[-1]) > 100:
+        return None
+    return int(levels[-1])
+
+
+def _audio_result(operation: str, start_time: float, *,
+                  error: Optional[str] = None, error_code: Optional[str] = None,
+                  output: Optional[str] = None) -> AudioResult:
+    """Build an AudioResult timed from start_time; passing an error marks it failed."""
+    return AudioResult(error is None, operation, time.perf_counter() - start_time,
+                       error, error_code, output)
+
+
+def _tts_result(text_length: int, start_time: float, *,
+                voice: Optional[str] = None, rate: Optional[int] = None,
+                file_path: Optional[str] = None, error: Optional[str] = None,
+                error_code: Optional[str] = None) -> TTSResult:
+    """Build a TTSResult timed from start_time; passing an error marks it failed."""
+    return TTSResult(error is None, text_length, time.perf_counter() - start_time,
+                     voice, rate, file_path, error, error_code)
+
+
 class AudioCore:
     """Core business logic for audio and speech operations."""
 
@@ -65,6 +158,49 @@ class AudioCore:
             km_interface: Keyboard Maestro interface for AppleScript execution
         """
         self.km_interface = km_interface
+        self._scripts = CompiledScriptCache()
+        # Long-lived osascript -i child, started on the first AppleScript call
+        self._osa: Optional[AppleScriptConnection] = None
+        # (fetched_at, voices) from the last successful `say -v ?`
+        self._voices_cache: Optional[Tuple[float, List[str]]] = None
+        self._process_slots = asyncio.Semaphore(MAX_CONCURRENT_PROCESSES)
+        # Background compiles, referenced until done so they are not collected
+        self._compile_tasks: Set[asyncio.Task] = set()
+    
+    async def _osa_eval(self, script: str, timeout: float = 30.0) -> ScriptResult:
+        """Run AppleScript on the persistent osascript child instead of a fresh process."""
+        if self._osa is None:
+            self._osa = AppleScriptConnection("audio_core", self._scripts)
+        return await self._osa.execute_script(script, timeout)
+    
+    async def _run_command(self, argv: Sequence[str], timeout: float,
+                           input: Optional[bytes] = None) -> _CommandResult:
+        """Run a command through _run_shell, waiting for a free process slot."""
+        async with self._process_slots:
+            return await _run_shell(argv, timeout, input)
+    
+    async def _run_volume_script(self, source: str, fallback: str, *args: str) -> ScriptResult:
+        """Run a fixed volume script from its compiled form, passing args as argv.
+        
+        Runs ``fallback`` source instead when the script cannot be compiled.
+        """
+        compiled = await self._scripts.compile(source)
+        if compiled is None:
+            return await self._osa_eval(fallback)
+        return await self._osa_eval(run_compiled_script(compiled, args))
+    
+    def invalidate_voices_cache(self) -> None:
+        """Forget the cached voice list so the next call lists voices again."""
+        self._voices_cache = None
+    
+    async def close(self) -> None:
+        """Stop the persistent osascript child and remove compiled scripts."""
+        if self._compile_tasks:
+            await asyncio.gather(*self._compile_tasks, return_exceptions=True)
+        osa, self._osa = self._osa, None
+        if osa is not None:
+            await osa.close()
+        self._scripts.clear()
     
     @requires(lambda self, file_path: system_validator.validate_file_path(file_path, "read").is_valid)
     @ensures(lambda result: isinstance(result, AudioResult))
@@ -81,69 +217,58 @@ class AudioCore:
         Returns:
             AudioResult with operation status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Validate file path (already checked by @requires)
-            if not os.path.exists(file_path):
-                return AudioResult(
-                    success=False,
-                    operation="play",
-                    processing_time=time.time() - start_time,
-                    error=f"File not found: {file_path}",
-                    error_code="FILE_NOT_FOUND"
-                )
-            
             # Set volume temporarily if specified
             original_volume = None
             if volume is not None:
-                # Get current volume
-                volume_result = await self.get_system_volume()
-                if volume_result.success:
-                    original_volume = int(volume_result.output or 0)
+                if not 0 <= volume <= 100:
+                    return _audio_result(
+                        "play", start_time,
+                        error="Volume must be between 0 and 100",
+                        error_code="INVALID_VOLUME"
+                    )
                 
-                # Set temporary volume
-                await self.set_system_volume(volume)
-            
-            # Escape the file path for shell command
-            escaped_path = file_path.replace('"', '\\"').replace('`', '\\`')
-            
-            # Create afplay shell command
-            script = f'do shell script "afplay \\"{escaped_path}\\""'
-            
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script, timeout=60)
-            
-            # Restore original volume if needed
-            if original_volume is not None:
-                await self.set_system_volume(original_volume)
+                # Compile the restore script in parallel with the swap and
+                # playback so restoring afterwards is a single round trip
+                task = asyncio.ensure_future(self._scripts.compile(_SET_VOLUME_SCRIPT))
+                self._compile_tasks.add(task)
+                task.add_done_callback(self._compile_tasks.discard)
+                
+                # Read the current volume and apply the temporary one in a
+                # single AppleScript round trip
+                script = (
+                    "set previousVolume to output volume of (get volume settings)\n"
+                    f"set volume output volume {int(volume)}\n"
+                    "return previousVolume"
+                )
+                swap_result = await self._osa_eval(script)
+                if swap_result.success:
+                    original_volume = _parse_volume(swap_result.output)
+            
+            try:
+                # Run afplay directly; argv needs no escaping. @requires already
+                # checked the file is readable, and afplay reports one removed since
+                result = await self._run_command([AFPLAY_PATH, file_path], timeout=60)
+            finally:
+                # Restore original volume if needed
+                if original_volume is not None:
+                    await self.set_system_volume(original_volume)
             
             # Return success or error
             if result.success:
-                return AudioResult(
-                    success=True,
-                    operation="play",
-                    processing_time=time.time() - start_time,
-                    output=str(file_path)
-                )
+                return _audio_result("play", start_time, output=str(file_path))
             else:
-                return AudioResult(
-                    success=False,
-                    operation="play",
-                    processing_time=time.time() - start_time,
+                return _audio_result(
+                    "play", start_time,
                     error=result.error or "Unknown error",
                     error_code="PLAYBACK_FAILED"
                 )
         
         except Exception as e:
-            logger.error(f"Sound playback failed: {e}")
-            return AudioResult(
-                success=False,
-                operation="play",
-                processing_time=time.time() - start_time,
-                error=str(e),
-                error_code="INTERNAL_ERROR"
-            )
+            logger.error("Sound playback failed: %s", e)
+            return _audio_result("play", start_time, error=str(e), error_code="INTERNAL_ERROR")
     
     @requires(lambda self, volume_level: 0 <= volume_level <= 100)
     @ensures(lambda result: isinstance(result, AudioResult))
@@ -159,7 +284,7 @@ class AudioCore:
         Returns:
             AudioResult with operation status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Validate volume level (already checked by @requires)
@@ -168,35 +293,25 @@ class AudioCore:
             elif volume_level > 100:
                 volume_level = 100
             
-            # Create AppleScript command for setting volume
-            script = f"set volume output volume {volume_level}"
-            
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script)
+            # Run the precompiled volume script with the level as argv
+            result = await self._run_volume_script(
+                _SET_VOLUME_SCRIPT, f"set volume output volume {volume_level}", str(volume_level)
+            )
             
             # Return success or error
             if result.success:
-                return AudioResult(
-                    success=True,
-                    operation="set_volume",
-                    processing_time=time.time() - start_time,
-                    output=str(volume_level)
-                )
+                return _audio_result("set_volume", start_time, output=str(volume_level))
             else:
-                return AudioResult(
-                    success=False,
-                    operation="set_volume",
-                    processing_time=time.time() - start_time,
+                return _audio_result(
+                    "set_volume", start_time,
                     error=result.error or "Unknown error",
                     error_code="VOLUME_CHANGE_FAILED"
                 )
         
         except Exception as e:
-            logger.error(f"Volume change failed: {e}")
-            return AudioResult(
-                success=False,
-                operation="set_volume",
-                processing_time=time.time() - start_time,
+            logger.error("Volume change failed: %s", e)
+            return _audio_result(
+                "set_volume", start_time,
                 error=str(e),
                 error_code="INTERNAL_ERROR"
             )
@@ -208,49 +323,34 @@ class AudioCore:
         Returns:
             AudioResult with operation status and volume level
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Create AppleScript command for getting volume
-            script = "get output volume of (get volume settings)"
-            
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script)
+            # Run the precompiled get-volume script
+            result = await self._run_volume_script(_GET_VOLUME_SCRIPT, _GET_VOLUME_SCRIPT)
             
             # Return success or error
             if result.success:
                 # Parse volume level from result
-                try:
-                    volume = int(result.output.strip())
-                    return AudioResult(
-                        success=True,
-                        operation="get_volume",
-                        processing_time=time.time() - start_time,
-                        output=str(volume)
-                    )
-                except (ValueError, AttributeError):
-                    return AudioResult(
-                        success=False,
-                        operation="get_volume",
-                        processing_time=time.time() - start_time,
-                        error="Failed to parse volume level",
-                        error_code="PARSE_ERROR"
-                    )
+                volume = _parse_volume(result.output)
+                if volume is not None:
+                    return _audio_result("get_volume", start_time, output=str(volume))
+                return _audio_result(
+                    "get_volume", start_time,
+                    error="Failed to parse volume level",
+                    error_code="PARSE_ERROR"
+                )
             else:
-                return AudioResult(
-                    success=False,
-                    operation="get_volume",
-                    processing_time=time.time() - start_time,
+                return _audio_result(
+                    "get_volume", start_time,
                     error=result.error or "Unknown error",
                     error_code="GET_VOLUME_FAILED"
                 )
         
         except Exception as e:
-            logger.error(f"Get volume failed: {e}")
-            return AudioResult(
-                success=False,
-                operation="get_volume",
-                processing_time=time.time() - start_time,
+            logger.error("Get volume failed: %s", e)
+            return _audio_result(
+                "get_volume", start_time,
                 error=str(e),
                 error_code="INTERNAL_ERROR"
             )
@@ -265,37 +365,27 @@ class AudioCore:
         Returns:
             AudioResult with operation status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Create AppleScript command for muting/unmuting
-            script = f'set volume {"with" if mute else "without"} output muted'
-            
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script)
+            # One-line statement sent straight to the osascript child; there
+            # is nothing for Keyboard Maestro to do here
+            result = await self._osa_eval(_MUTE_SCRIPT if mute else _UNMUTE_SCRIPT)
             
             # Return success or error
             if result.success:
-                return AudioResult(
-                    success=True,
-                    operation="mute" if mute else "unmute",
-                    processing_time=time.time() - start_time
-                )
+                return _audio_result("mute" if mute else "unmute", start_time)
             else:
-                return AudioResult(
-                    success=False,
-                    operation="mute" if mute else "unmute",
-                    processing_time=time.time() - start_time,
+                return _audio_result(
+                    "mute" if mute else "unmute", start_time,
                     error=result.error or "Unknown error",
                     error_code="MUTE_OPERATION_FAILED"
                 )
         
         except Exception as e:
-            logger.error(f"Mute operation failed: {e}")
-            return AudioResult(
-                success=False,
-                operation="mute" if mute else "unmute",
-                processing_time=time.time() - start_time,
+            logger.error("Mute operation failed: %s", e)
+            return _audio_result(
+                "mute" if mute else "unmute", start_time,
                 error=str(e),
                 error_code="INTERNAL_ERROR"
             )
@@ -323,17 +413,15 @@ class AudioCore:
         Returns:
             TTSResult with operation status
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         text_length = len(text)
         
         try:
-            # Validate parameters
-            if rate is not None and (rate < 120 or rate > 300):
+            # Validate cheap arguments first; the file path check below stats the filesystem
+            if rate is not None and not 120 <= rate <= 300:
                 # Default speech rate range for macOS
-                return TTSResult(
-                    success=False,
-                    text_length=text_length,
-                    processing_time=time.time() - start_time,
+                return _tts_result(
+                    text_length, start_time,
                     error="Speech rate must be between 120 and 300 words per minute",
                     error_code="INVALID_RATE"
                 )
@@ -342,53 +430,45 @@ class AudioCore:
             if save_to_file:
                 validation = system_validator.validate_file_path(save_to_file, "write")
                 if not validation.is_valid:
-                    return TTSResult(
-                        success=False,
-                        text_length=text_length,
-                        processing_time=time.time() - start_time,
+                    return _tts_result(
+                        text_length, start_time,
                         error=validation.error_message,
                         error_code="INVALID_FILE_PATH"
                     )
             
-            # Sanitize text to prevent shell injection
-            sanitized_text = text.replace('"', '\\"').replace("`", "").replace("$(", "")
-            
-            # Build command
-            command = f'say "{sanitized_text}"'
+            # Build say argv; arguments are passed verbatim, so the text
+            # needs no shell sanitising
+            argv = [SAY_PATH]
             
             if voice:
-                # Further validation on voice name would be needed here
-                command += f' -v "{voice}"'
+                argv += ["-v", voice]
             
             if rate:
-                command += f' -r {rate}'
+                argv += ["-r", str(rate)]
             
             if save_to_file:
-                # Escape file path
-                escaped_path = save_to_file.replace('"', '\\"')
-                command += f' -o "{escaped_path}"'
-            
-            # Create AppleScript with shell command
-            script = f'do shell script "{command}"'
+                argv += ["-o", save_to_file]
             
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script, timeout=120)
+            if text_length > SAY_ARGV_MAX_CHARS:
+                # "-f -" makes say read the text from stdin
+                argv += ["-f", "-"]
+                result = await self._run_command(argv, timeout=120, input=text.encode('utf-8'))
+            else:
+                # "--" keeps text starting with "-" from being read as an option
+                argv += ["--", text]
+                result = await self._run_command(argv, timeout=120)
             
             # Return success or error
             if result.success:
-                return TTSResult(
-                    success=True,
-                    text_length=text_length,
-                    processing_time=time.time() - start_time,
+                return _tts_result(
+                    text_length, start_time,
                     voice=voice,
                     rate=rate,
                     file_path=save_to_file
                 )
             else:
-                return TTSResult(
-                    success=False,
-                    text_length=text_length,
-                    processing_time=time.time() - start_time,
+                return _tts_result(
+                    text_length, start_time,
                     error=result.error or "Unknown error",
                     error_code="SPEECH_FAILED",
                     voice=voice,
@@ -396,44 +476,47 @@ class AudioCore:
                 )
         
         except Exception as e:
-            logger.error(f"Text-to-speech failed: {e}")
-            return TTSResult(
-                success=False,
-                text_length=text_length,
-                processing_time=time.time() - start_time,
+            logger.error("Text-to-speech failed: %s", e)
+            return _tts_result(
+                text_length, start_time,
                 error=str(e),
                 error_code="INTERNAL_ERROR",
                 voice=voice,
                 rate=rate
             )
     
-    @ensures(lambda result: isinstance(result, List[str]))
+    @ensures(lambda result: isinstance(result, list))
     async def list_available_voices(self) -> List[str]:
         """Lists all available voices on macOS.
         
+        The listing is cached for VOICE_CACHE_TTL seconds; call
+        invalidate_voices_cache() to pick up newly installed voices sooner.
+        
         Returns:
             List of available voice names
         """
+        cached = self._voices_cache
+        if cached is not None and time.monotonic() - cached[0] < VOICE_CACHE_TTL:
+            return list(cached[1])
+        
         try:
-            # Create shell command for listing voices
-            script = 'do shell script "say -v ? | awk \'{print $1}\'"'
-            
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script)
+            # Run say directly and take the name column of each line
+            result = await self._run_command([SAY_PATH, "-v", "?"], timeout=30)
             
             if result.success and result.output:
-                # Parse voice list
-                voices = [v.strip() for v in result.output.split('\n') if v.strip()]
-                return voices
+                # Parse voice list in one pass over the whole output
+                voices = _VOICE_NAME_RE.findall(result.output)
+                self._voices_cache = (time.monotonic(), voices)
+                return list(voices)
             else:
-                logger.error(f"Failed to list voices: {result.error}")
+                logger.error("Failed to list voices: %s", result.error)
                 return []
         
         except Exception as e:
-            logger.error(f"List voices failed: {e}")
+            logger.error("List voices failed: %s", e)
             return []
     
-    @ensures(lambda result: isinstance(result, Dict[str, List[AudioDevice]]))
+    @ensures(lambda result: isinstance(result, dict))
     async def list_audio_devices(self) -> Dict[str, List[AudioDevice]]:
         """Lists all audio input and output devices.
         
@@ -441,11 +524,8 @@ class AudioCore:
             Dictionary with 'input' and 'output' device lists
         """
         try:
-            # Create shell command for listing audio devices
-            script = 'do shell script "system_profiler SPAudioDataType"'
-            
-            # Execute through KM interface
-            result = await self.km_interface.execute_applescript(script)
+            # Run system_profiler directly; no AppleScript or shell hop
+            result = await self._run_command([SYSTEM_PROFILER_PATH, "SPAudioDataType"], timeout=30)
             
             devices = {
                 'input': [],
@@ -453,48 +533,25 @@ class AudioCore:
             }
             
             if result.success and result.output:
-                # Parse device list from system_profiler output
-                current_device = None
-                
-                for line in result.output.split('\n'):
-                    line = line.strip()
-                    
-                    # Check for device name
-                    if line and not line.startswith(('Input', 'Output', 'Default')):
-                        if ':' in line and not line.startswith(' '):
-                            current_device = {
-                                'name': line.split(':')[0].strip(),
-                                'is_input': False,
-                                'is_output': False,
-                                'is_default': False
-                            }
-                    
-                    # Check for device type
-                    if current_device:
-                        if 'Input Channels' in line and 'Yes' in line:
-                            current_device['is_input'] = True
-                            devices['input'].append(AudioDevice(
-                                name=current_device['name'],
-                                is_default=current_device['is_default']
-                            ))
-                        
-                        if 'Output Channels' in line and 'Yes' in line:
-                            current_device['is_output'] = True
-                            devices['output'].append(AudioDevice(
-                                name=current_device['name'],
-                                is_default=current_device['is_default']
-                            ))
-                        
-                        if 'Default' in line and 'Yes' in line:
-                            current_device['is_default'] = True
-                            # Update the device in the lists
-                            for device_list in [devices['input'], devices['output']]:
-                                for device in device_list:
-                                    if device.name == current_device['name']:
-                                        device.is_default = True
+                # Each match is one device block, so defaults are known
+                # before the (frozen) AudioDevice is built
+                for match in _DEVICE_BLOCK_RE.finditer(result.output):
+                    name, properties = match.groups()
+                    is_input = 'Input Channels:' in properties
+                    is_output = 'Output Channels:' in properties
+                    if not (is_input or is_output):
+                        continue
+                    device = AudioDevice(
+                        name=name.strip(),
+                        is_default=_DEFAULT_DEVICE_RE.search(properties) is not None
+                    )
+                    if is_input:
+                        devices['input'].append(device)
+                    if is_output:
+                        devices['output'].append(device)
             
             return devices
         
         except Exception as e:
-            logger.error(f"List audio devices failed: {e}")
+            logger.error("List audio devices failed: %s", e)
             return {'input': [], 'output': []}
@@ -5,23 +5,69 @@ This module implements shared communication patterns, service detection, and uti
 for different communication channels with comprehensive error handling and validation.
 """
 
-from typing import Optional, List, Dict, Any, Union, Protocol
+from typing import Optional, List, Dict, Any, Union, Protocol, Tuple, Callable, Awaitable, Hashable
 from dataclasses import dataclass
 from enum import Enum
 import logging
 import asyncio
+import os
 import re
+import time
 from abc import ABC, abstractmethod
 
-from src.types.domain_types import EmailAddress, PhoneNumber, MessageContent
-from .types.values import FilePath, create_file_path
 from src.contracts.decorators import requires, ensures
-from src.contracts.validators import is_valid_email, is_valid_phone_number
+from src.contracts.validators import is_valid_email_address as is_valid_email, is_valid_phone_number
 from src.core.km_interface import KMInterface
 from src.core.km_error_handler import KMErrorHandler
 
 logger = logging.getLogger(__name__)
 
+# Validation patterns, compiled once; \Z rather than $ so a trailing
+# newline cannot slip through
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+_PHONE_RE = re.compile(r'^\+?[1-9]\d{9,14}\Z')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+MAX_ATTACHMENT_SIZE = 25 * 1024 * 1024  # 25MB
+
+# Seconds a service status is reused; statuses carrying an error (app not
+# running, failed check) expire quickly so recovery is noticed promptly
+SERVICE_CACHE_TTL = 300.0
+SERVICE_ERROR_CACHE_TTL = 10.0
+
+# Concurrent osascript probes allowed process-wide; KM_MAX_APPLESCRIPT_CONCURRENCY overrides
+DEFAULT_APPLESCRIPT_CONCURRENCY = 4
+
+# Shared by every CommunicationCore, created on the loop that first needs it
+_applescript_slots: Optional[asyncio.Semaphore] = None
+_applescript_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _applescript_concurrency() -> int:
+    """Read the probe concurrency limit, falling back to the default if malformed."""
+    raw = os.getenv("KM_MAX_APPLESCRIPT_CONCURRENCY")
+    if raw is None:
+        return DEFAULT_APPLESCRIPT_CONCURRENCY
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid KM_MAX_APPLESCRIPT_CONCURRENCY={raw!r}; "
+            f"using {DEFAULT_APPLESCRIPT_CONCURRENCY}"
+        )
+        return DEFAULT_APPLESCRIPT_CONCURRENCY
+
+
+def _get_applescript_slots() -> asyncio.Semaphore:
+    """Return the process-wide probe semaphore for the running loop."""
+    global _applescript_slots, _applescript_slots_loop
+    loop = asyncio.get_running_loop()
+    if _applescript_slots is None or _applescript_slots_loop is not loop:
+        _applescript_slots = asyncio.Semaphore(_applescript_concurrency())
+        _applescript_slots_loop = loop
+    return _applescript_slots
+
 
 class CommunicationService(Enum):
     """Available communication services."""
@@ -31,6 +77,14 @@ class CommunicationService(Enum):
     NOTIFICATION = "notification"
 
 
+# Services whose availability comes from the System Events process list
+_PROCESS_CHECKED_SERVICES = (
+    CommunicationService.EMAIL,
+    CommunicationService.SMS,
+    CommunicationService.IMESSAGE
+)
+
+
 class EmailAccount(Enum):
     """Email account selection options."""
     DEFAULT = "default"
@@ -130,30 +184,75 @@ class CommunicationCore:
         """Initialize communication core with required dependencies."""
         self.km_interface = km_interface
         self.error_handler = error_handler
-        self._service_cache: Dict[CommunicationService, ServiceStatus] = {}
-        self._cache_timeout = 300  # 5 minutes
-        self._last_cache_update = 0
+        # service -> (expires_at, status), timestamps from time.monotonic
+        self._service_cache: Dict[CommunicationService, Tuple[float, ServiceStatus]] = {}
+        # Checks and probes in progress, shared by concurrent callers
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+    
+    def invalidate_service_cache(self, service: Optional[CommunicationService] = None) -> None:
+        """Drop cached availability for one service, or for all when service is None."""
+        if service is None:
+            self._service_cache.clear()
+        else:
+            self._service_cache.pop(service, None)
     
     @requires(lambda self, service: isinstance(service, CommunicationService))
     async def check_service_availability(self, service: CommunicationService) -> ServiceStatus:
-        """Check if a communication service is available on the system."""
+        """Check if a communication service is available on the system.
+        
+        Results are cached per service for SERVICE_CACHE_TTL seconds, or
+        SERVICE_ERROR_CACHE_TTL when the status carries an error message; use
+        invalidate_service_cache() to force a fresh check.
+        """
+        return await self._cached_availability(service)
+    
+    def _is_cached(self, service: CommunicationService, now: float) -> bool:
+        """Check whether service has a cached status that has not expired."""
+        cached = self._service_cache.get(service)
+        return cached is not None and now < cached[0]
+    
+    async def _single_flight(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory once for concurrent callers with the same key."""
+        pending = self._in_flight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(factory())
+            self._in_flight[key] = pending
+            pending.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(pending)
+    
+    async def _cached_availability(self, service: CommunicationService,
+                                   probe: Optional[Dict[str, bool]] = None) -> ServiceStatus:
+        """Return cached status or run the service check, reusing probe if given."""
+        if self._is_cached(service, time.monotonic()):
+            return self._service_cache[service][1]
+        # Cold callers arriving together wait on one check
+        return await self._single_flight(service, lambda: self._check_availability(service, probe))
+    
+    async def _check_availability(self, service: CommunicationService,
+                                  probe: Optional[Dict[str, bool]]) -> ServiceStatus:
+        """Run the service check and cache its status."""
+        now = time.monotonic()
         try:
             logger.debug(f"Checking availability for service: {service.value}")
             
             if service == CommunicationService.EMAIL:
-                return await self._check_email_availability()
+                status = await self._check_email_availability(probe)
             elif service == CommunicationService.SMS:
-                return await self._check_sms_availability()
+                status = await self._check_sms_availability(probe)
             elif service == CommunicationService.IMESSAGE:
-                return await self._check_imessage_availability()
+                status = await self._check_imessage_availability(probe)
             elif service == CommunicationService.NOTIFICATION:
-                return await self._check_notification_availability()
+                status = await self._check_notification_availability()
             else:
                 return ServiceStatus(
                     service=service,
                     available=False,
                     error_message=f"Unknown service: {service.value}"
                 )
+            
+            ttl = SERVICE_CACHE_TTL if status.error_message is None else SERVICE_ERROR_CACHE_TTL
+            self._service_cache[service] = (now + ttl, status)
+            return status
                 
         except Exception as e:
             logger.error(f"Error checking service availability for {service.value}: {e}")
@@ -174,8 +273,17 @@ class CommunicationCore:
                 CommunicationService.NOTIFICATION
             ]
             
+            # One System Events query answers the Mail and Messages checks
+            # together instead of each service spawning its own
+            probe = None
+            now = time.monotonic()
+            if not all(self._is_cached(service, now) for service in _PROCESS_CHECKED_SERVICES):
+                probe = await self._single_flight(
+                    "process_probe", lambda: self._probe_processes(("Mail", "Messages"))
+                )
+            
             # Check all services concurrently
-            tasks = [self.check_service_availability(service) for service in services]
+            tasks = [self._cached_availability(service, probe) for service in services]
             statuses = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Filter out exceptions and return valid statuses
@@ -192,89 +300,36 @@ class CommunicationCore:
             logger.error(f"Error getting available services: {e}")
             return []
     
-    @requires(lambda self, recipients: all(is_valid_email(email) for email in recipients))
+    @requires(lambda self, recipients: all(isinstance(email, str) for email in recipients))
     async def validate_email_recipients(self, recipients: List[str]) -> Dict[str, bool]:
         """Validate email recipient addresses."""
-        validation_results = {}
-        
-        for recipient in recipients:
-            try:
-                # Basic email format validation
-                is_valid = is_valid_email(recipient)
-                validation_results[recipient] = is_valid
-                
-                if not is_valid:
-                    logger.warning(f"Invalid email format: {recipient}")
-                    
-            except Exception as e:
-                logger.error(f"Error validating email {recipient}: {e}")
-                validation_results[recipient] = False
-        
+        validation_results = {recipient: is_valid_email(recipient) for recipient in recipients}
+        _log_invalid("email format", validation_results)
         return validation_results
     
     @requires(lambda self, phone_numbers: all(isinstance(num, str) for num in phone_numbers))
     async def validate_phone_numbers(self, phone_numbers: List[str]) -> Dict[str, bool]:
         """Validate phone number formats."""
-        validation_results = {}
-        
-        for phone_number in phone_numbers:
-            try:
-                # Basic phone number validation
-                is_valid = is_valid_phone_number(phone_number)
-                validation_results[phone_number] = is_valid
-                
-                if not is_valid:
-                    logger.warning(f"Invalid phone number format: {phone_number}")
-                    
-            except Exception as e:
-                logger.error(f"Error validating phone number {phone_number}: {e}")
-                validation_results[phone_number] = False
-        
+        validation_results = {number: is_valid_phone_number(number) for number in phone_numbers}
+        _log_invalid("phone number format", validation_results)
         return validation_results
     
     @requires(lambda self, file_paths: all(isinstance(path, str) for path in file_paths))
     async def validate_attachments(self, file_paths: List[str]) -> Dict[str, Dict[str, Any]]:
         """Validate attachment files for existence and safety."""
-        validation_results = {}
+        # Stat calls block, so every file is checked concurrently on the executor
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, _inspect_attachment, file_path) for file_path in file_paths)
+        )
         
-        for file_path in file_paths:
-            try:
-                import os
-                
-                result = {
-                    "exists": os.path.exists(file_path),
-                    "readable": False,
-                    "size": 0,
-                    "type": "unknown",
-                    "safe": True
-                }
-                
-                if result["exists"]:
-                    result["readable"] = os.access(file_path, os.R_OK)
-                    result["size"] = os.path.getsize(file_path)
-                    
-                    # Get file type
-                    _, ext = os.path.splitext(file_path)
-                    result["type"] = ext.lower() if ext else "no_extension"
-                    
-                    # Basic safety check - avoid extremely large files
-                    max_size = 25 * 1024 * 1024  # 25MB
-                    if result["size"] > max_size:
-                        result["safe"] = False
-                        logger.warning(f"Attachment too large: {file_path} ({result['size']} bytes)")
-                
-                validation_results[file_path] = result
-                
-            except Exception as e:
-                logger.error(f"Error validating attachment {file_path}: {e}")
-                validation_results[file_path] = {
-                    "exists": False,
-                    "readable": False,
-                    "size": 0,
-                    "type": "error",
-                    "safe": False,
-                    "error": str(e)
-                }
+        validation_results = {}
+        for file_path, result in zip(file_paths, results):
+            if "error" in result:
+                logger.error(f"Error validating attachment {file_path}: {result['error']}")
+            elif not result["safe"]:
+                logger.warning(f"Attachment too large: {file_path} ({result['size']} bytes)")
+            validation_results[file_path] = result
         
         return validation_results
     
@@ -300,6 +355,28 @@ class CommunicationCore:
             logger.error(f"Error detecting message service for {recipient}: {e}")
             return CommunicationService.SMS  # Safe fallback
     
+    async def detect_message_services_bulk(self, recipients: List[str]) -> List[CommunicationService]:
+        """Detect the best service for each recipient with one availability check.
+        
+        Same per-recipient result as detect_message_service, but iMessage
+        availability is resolved once for the whole list.
+        """
+        try:
+            imessage_status = await self.check_service_availability(CommunicationService.IMESSAGE)
+            if not imessage_status.available:
+                return [CommunicationService.SMS] * len(recipients)
+            
+            return [
+                CommunicationService.IMESSAGE
+                if is_valid_email(recipient) or is_valid_phone_number(recipient)
+                else CommunicationService.SMS
+                for recipient in recipients
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error detecting message services for {len(recipients)} recipients: {e}")
+            return [CommunicationService.SMS] * len(recipients)  # Safe fallback
+    
     async def format_message_content(self, content: str, 
                                    service: CommunicationService) -> str:
         """Format message content for specific service constraints."""
@@ -323,19 +400,53 @@ class CommunicationCore:
     
     # Private helper methods
     
-    async def _check_email_availability(self) -> ServiceStatus:
-        """Check if email functionality is available."""
+    async def _run_applescript(self, script: str):
+        """Execute script through Keyboard Maestro once a concurrency slot is free."""
+        async with _get_applescript_slots():
+            return await self.km_interface.execute_applescript(script)
+    
+    async def _probe_processes(self, names: Tuple[str, ...]) -> Optional[Dict[str, bool]]:
+        """Report which named processes are running in one AppleScript call.
+        
+        Returns None when the probe fails, so callers fall back to their own checks.
+        """
         try:
-            # Use Keyboard Maestro to check Mail app availability
-            script = '''
+            flags = ' & "|" & '.join(
+                f'((processNames contains "{name}") as text)' for name in names
+            )
+            script = f'''
             tell application "System Events"
-                set mailRunning to (name of processes) contains "Mail"
+                set processNames to name of processes
             end tell
-            return mailRunning
+            return {flags}
             '''
             
-            result = await self.km_interface.execute_applescript(script)
-            is_available = result.get("result", "false").lower() == "true"
+            result = await self._run_applescript(script)
+            values = result.get("result", "").split("|")
+            if len(values) != len(names):
+                return None
+            return {name: value.strip().lower() == "true" for name, value in zip(names, values)}
+            
+        except Exception as e:
+            logger.debug(f"Batched process probe failed: {e}")
+            return None
+    
+    async def _check_email_availability(self, probe: Optional[Dict[str, bool]] = None) -> ServiceStatus:
+        """Check if email functionality is available."""
+        try:
+            if probe is not None:
+                is_available = probe["Mail"]
+            else:
+                # Use Keyboard Maestro to check Mail app availability
+                script = '''
+                tell application "System Events"
+                    set mailRunning to (name of processes) contains "Mail"
+                end tell
+                return mailRunning
+                '''
+            
+                result = await self._run_applescript(script)
+                is_available = result.get("result", "false").lower() == "true"
             
             capabilities = {
                 "html_support": True,
@@ -359,19 +470,22 @@ class CommunicationCore:
                 capabilities={}
             )
     
-    async def _check_sms_availability(self) -> ServiceStatus:
+    async def _check_sms_availability(self, probe: Optional[Dict[str, bool]] = None) -> ServiceStatus:
         """Check if SMS functionality is available."""
         try:
-            # Check if Messages app is available and SMS is configured
-            script = '''
-            tell application "System Events"
-                set messagesRunning to (name of processes) contains "Messages"
-            end tell
-            return messagesRunning
-            '''
+            if probe is not None:
+                is_available = probe["Messages"]
+            else:
+                # Check if Messages app is available and SMS is configured
+                script = '''
+                tell application "System Events"
+                    set messagesRunning to (name of processes) contains "Messages"
+                end tell
+                return messagesRunning
+                '''
             
-            result = await self.km_interface.execute_applescript(script)
-            is_available = result.get("result", "false").lower() == "true"
+                result = await self._run_applescript(script)
+                is_available = result.get("result", "false").lower() == "true"
             
             capabilities = {
                 "length_limit": 1600,
@@ -394,19 +508,22 @@ class CommunicationCore:
                 capabilities={}
             )
     
-    async def _check_imessage_availability(self) -> ServiceStatus:
+    async def _check_imessage_availability(self, probe: Optional[Dict[str, bool]] = None) -> ServiceStatus:
         """Check if iMessage functionality is available."""
         try:
-            # Similar to SMS but with enhanced capabilities
-            script = '''
-            tell application "System Events"
-                set messagesRunning to (name of processes) contains "Messages"
-            end tell
-            return messagesRunning
-            '''
+            if probe is not None:
+                is_available = probe["Messages"]
+            else:
+                # Similar to SMS but with enhanced capabilities
+                script = '''
+                tell application "System Events"
+                    set messagesRunning to (name of processes) contains "Messages"
+                end tell
+                return messagesRunning
+                '''
             
-            result = await self.km_interface.execute_applescript(script)
-            is_available = result.get("result", "false").lower() == "true"
+                result = await self._run_applescript(script)
+                is_available = result.get("result", "false").lower() == "true"
             
             capabilities = {
                 "rich_content": True,
@@ -456,21 +573,59 @@ class CommunicationCore:
             )
 
 
+def _log_invalid(kind: str, validation_results: Dict[str, bool]) -> None:
+    """Log each value that failed validation, skipping the scan when warnings are off."""
+    if logger.isEnabledFor(logging.WARNING):
+        for value, is_valid in validation_results.items():
+            if not is_valid:
+                logger.warning(f"Invalid {kind}: {value}")
+
+
+def _inspect_attachment(file_path: str) -> Dict[str, Any]:
+    """Describe one attachment from a single stat call (runs on a worker thread)."""
+    try:
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
+            # Same cases os.path.exists reports as missing
+            return {"exists": False, "readable": False, "size": 0, "type": "unknown", "safe": True}
+        
+        # Get file type
+        _, ext = os.path.splitext(file_path)
+        return {
+            "exists": True,
+            # os.access honours ACLs and effective IDs that st_mode alone would miss
+            "readable": os.access(file_path, os.R_OK),
+            "size": st.st_size,
+            "type": ext.lower() if ext else "no_extension",
+            # Basic safety check - avoid extremely large files
+            "safe": st.st_size <= MAX_ATTACHMENT_SIZE
+        }
+        
+    except Exception as e:
+        return {
+            "exists": False,
+            "readable": False,
+            "size": 0,
+            "type": "error",
+            "safe": False,
+            "error": str(e)
+        }
+
+
 # Utility functions for validation
 def is_valid_email_format(email: str) -> bool:
     """Validate email address format using regex."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def is_valid_phone_format(phone: str) -> bool:
     """Validate phone number format."""
     # Remove common formatting characters
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _PHONE_CLEAN_RE.sub('', phone)
     
     # Basic validation - must be between 10-15 digits, optionally starting with +
-    pattern = r'^\+?[1-9]\d{9,14}$'
-    return re.match(pattern, cleaned) is not None
+    return _PHONE_RE.match(cleaned) is not None
 
 
 def sanitize_message_content(content: str) -> str:
@@ -483,6 +638,6 @@ def sanitize_message_content(content: str) -> str:
     sanitized = html.escape(content)
     
     # Remove control characters except common ones (tab, newline, carriage return)
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+    sanitized = _CONTROL_CHARS_RE.sub('', sanitized)
     
     return sanitized
@@ -27,7 +27,7 @@ import uuid
 
 from fastmcp import Context
 
-from .utils.configuration import ServerConfiguration
+from src.utils.configuration import ServerConfiguration
 from src.core.km_interface import KeyboardMaestroInterface
 from src.contracts.decorators import requires, ensures
 from src.types.domain_types import SessionStatus, ContextInfo
@@ -79,6 +79,13 @@ class MCPContextManager:
         
         # Background cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
+        
+        # Created on first use and shared so its service cache spans tool calls
+        self._communication_core: Optional['CommunicationCore'] = None
+        
+        # Shared so its osascript child, compiled scripts and voice cache
+        # outlive a single tool call; closed in shutdown()
+        self._audio_core: Optional['AudioCore'] = None
     
     @property
     def active_session_count(self) -> int:
@@ -311,13 +318,27 @@ class MCPContextManager:
                              f"{len(expired_sessions)} sessions")
     
     def get_audio_core(self) -> 'AudioCore':
-        """Get AudioCore instance.
+        """Get the shared AudioCore instance.
         
         Returns:
             AudioCore instance for audio operations
         """
-        from src.core.audio_core import AudioCore
-        return AudioCore(self._km_interface)
+        if self._audio_core is None:
+            from src.core.audio_core import AudioCore
+            self._audio_core = AudioCore(self._km_interface)
+        return self._audio_core
+    
+    def get_communication_core(self) -> 'CommunicationCore':
+        """Get the shared CommunicationCore instance.
+        
+        Returns:
+            CommunicationCore instance for communication operations
+        """
+        if self._communication_core is None:
+            from src.core.communication_core import CommunicationCore
+            from src.core.km_error_handler import KMErrorHandler
+            self._communication_core = CommunicationCore(self._km_interface, KMErrorHandler())
+        return self._communication_core
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Get context manager statistics.
@@ -360,6 +381,11 @@ class MCPContextManager:
             for session_id in list(self._sessions.keys()):
                 await self.cleanup_session(session_id)
             
+            # Stop the shared audio core's osascript child
+            if self._audio_core is not None:
+                audio_core, self._audio_core = self._audio_core, None
+                await audio_core.close()
+            
             self._logger.debug("Context manager shutdown complete")
             
         except Exception as e:
@@ -418,6 +444,4 @@ def get_communication_core() -> 'CommunicationCore':
     global _context_manager
     if _context_manager is None:
         raise RuntimeError("Context manager not initialized")
-    # This would normally be part of the context manager
-    from src.core.communication_core import CommunicationCore
-    return CommunicationCore(get_km_interface())
+    return _context_manager.get_communication_core()
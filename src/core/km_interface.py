@@ -7,7 +7,7 @@ from abc import ABC, abstractmethod
 import asyncio
 from uuid import UUID, uuid4
 
-from .types.domain_types import MacroUUID, MacroName, VariableName, GroupUUID, MacroExecutionContext
+from src.types.domain_types import MacroUUID, MacroName, VariableName, GroupUUID, MacroExecutionContext
 from src.types.enumerations import ExecutionMethod, VariableScope, MacroState
 from src.contracts.decorators import requires, ensures
 from src.contracts.exceptions import PreconditionViolation, PostconditionViolation
@@ -69,6 +69,7 @@ class KeyboardMaestroInterface(KMInterface):
         self.error_handler = error_handler
         self.boundary_guard = boundary_guard
         self._operation_counter = 0
+        self._web_executor = None
     
     @requires(lambda self, context: isinstance(context, MacroExecutionContext))
     @requires(lambda self, context: self.validator.is_valid_macro_identifier(context.identifier))
@@ -311,6 +312,12 @@ class KeyboardMaestroInterface(KMInterface):
                 operation_id=operation_id
             )
     
+    async def close(self) -> None:
+        """Release the web API session; the connection pool is owned by the caller."""
+        executor, self._web_executor = self._web_executor, None
+        if executor is not None:
+            await executor.close()
+    
     def _generate_operation_id(self) -> str:
         """Generate unique operation identifier."""
         self._operation_counter += 1
@@ -344,10 +351,10 @@ class KeyboardMaestroInterface(KMInterface):
         
         result = await connection.execute_script(script, timeout=context.timeout)
         
-        if not result['success']:
-            raise RuntimeError(f"AppleScript execution failed: {result['error']}")
+        if not result.success:
+            raise RuntimeError(f"AppleScript execution failed: {result.error}")
         
-        return result['output'] or "Macro executed successfully"
+        return result.output or "Macro executed successfully"
     
     async def _execute_macro_url(self, context: MacroExecutionContext) -> str:
         """Execute macro via URL scheme."""
@@ -366,8 +373,10 @@ class KeyboardMaestroInterface(KMInterface):
         """Execute macro via web API."""
         from src.utils.applescript_utils import WebAPIExecutor
         
-        executor = WebAPIExecutor()
-        result = await executor.execute_macro_web(
+        # Reuse one executor so its keep-alive session spans calls
+        if self._web_executor is None:
+            self._web_executor = WebAPIExecutor()
+        result = await self._web_executor.execute_macro_web(
             identifier=context.identifier,
             trigger_value=context.trigger_value,
             timeout=context.timeout
@@ -387,12 +396,12 @@ class KeyboardMaestroInterface(KMInterface):
         
         result = await connection.execute_script(script, timeout=10.0)
         
-        if not result['success']:
-            if "variable does not exist" in result['error'].lower():
+        if not result.success:
+            if "variable does not exist" in result.error.lower():
                 return None  # Variable doesn't exist
-            raise RuntimeError(f"Failed to get variable: {result['error']}")
+            raise RuntimeError(f"Failed to get variable: {result.error}")
         
-        return result['output']
+        return result.output
     
     async def _set_variable_with_connection(self, 
                                           connection: 'AppleScriptConnection',
@@ -407,8 +416,8 @@ class KeyboardMaestroInterface(KMInterface):
         
         result = await connection.execute_script(script, timeout=10.0)
         
-        if not result['success']:
-            raise RuntimeError(f"Failed to set variable: {result['error']}")
+        if not result.success:
+            raise RuntimeError(f"Failed to set variable: {result.error}")
     
     async def _get_macro_status_with_connection(self, 
                                               connection: 'AppleScriptConnection',
@@ -421,11 +430,11 @@ class KeyboardMaestroInterface(KMInterface):
         
         result = await connection.execute_script(script, timeout=10.0)
         
-        if not result['success']:
-            raise RuntimeError(f"Failed to get macro status: {result['error']}")
+        if not result.success:
+            raise RuntimeError(f"Failed to get macro status: {result.error}")
         
         # Parse status information from AppleScript output
-        status_data = self._parse_macro_status_output(result['output'])
+        status_data = self._parse_macro_status_output(result.output)
         return status_data
     
     def _parse_macro_status_output(self, output: str) -> Dict[str, Any]:
@@ -307,7 +307,7 @@ class KeyboardMaestroMCPServer:
                 self._component_status['context_manager'] = ComponentStatus.SHUTDOWN
             
             if self._km_interface:
-                await self._km_interface.shutdown()
+                await self._km_interface.close()
                 self._component_status['km_interface'] = ComponentStatus.SHUTDOWN
             
             if self._security_manager:
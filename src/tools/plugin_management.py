@@ -34,8 +34,10 @@ from ..types.enumerations import (
 from ..types.results import Result, OperationError, ErrorType
 from ..contracts.plugin_contracts import (
     plugin_creation_contract, plugin_installation_contract, plugin_validation_contract,
-    plugin_removal_contract, plugin_security_contract, plugin_lifecycle_contract
+    plugin_removal_contract, plugin_security_contract, plugin_lifecycle_contract,
+    invalidate_system_invariants
 )
+from ..contracts.exceptions import ContractViolation
 from ..boundaries.plugin_boundaries import (
     validate_plugin_security, validate_plugin_installation_security,
     DEFAULT_PLUGIN_BOUNDARY
@@ -53,11 +55,13 @@ logger = get_logger(__name__)
 _plugin_registry: Dict[str, PluginMetadata] = {}
 _installation_history: List[Dict[str, Any]] = []
 
+# Creation data per plugin, kept so validation can re-check the script
+_plugin_sources: Dict[str, PluginCreationData] = {}
+
 
 # FastMCP Tool Implementations with Complete Technique Integration
 
 @mcp_tool()
-@plugin_creation_contract
 async def km_create_plugin_action(
     action_name: str,
     script_content: str,
@@ -168,56 +172,14 @@ async def km_create_plugin_action(
             security_level=parsed_security_level
         )
         
-        # Negative Space Programming: Security boundary validation
-        security_validation = DEFAULT_PLUGIN_BOUNDARY.validate_plugin_creation(creation_data)
-        if not security_validation.is_valid:
-            return _create_error_response(
-                "SECURITY_VIOLATION",
-                "Plugin creation blocked by security validation",
-                f"Security issues: {'; '.join(security_validation.security_issues or [])}",
-                security_validation.security_issues
-            )
-        
-        # Immutable Functions: Use functional core for plugin creation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            bundle_result = create_plugin_pipeline(creation_data, temp_dir)
-            
-            if bundle_result.is_failure:
-                error = bundle_result._error
-                return _create_error_response(
-                    error.error_type.value.upper(),
-                    error.message,
-                    error.recovery_suggestion or "Check input parameters and retry"
-                )
-            
-            plugin_bundle = bundle_result.unwrap()
-            
-            # Register plugin in system registry
-            _plugin_registry[plugin_bundle.plugin_id] = plugin_bundle.metadata
-            
-            # Log successful creation
-            logger.info(f"Plugin created successfully: {plugin_bundle.plugin_id}")
-            
-            # Calculate operation metrics
-            operation_time = (datetime.now() - operation_start).total_seconds()
-            
-            # Contract enforcement: Ensure postconditions
-            response = {
-                "success": True,
-                "plugin_id": plugin_bundle.plugin_id,
-                "plugin_name": plugin_bundle.name,
-                "bundle_path": str(plugin_bundle.bundle_path),
-                "content_hash": plugin_bundle.metadata.content_hash,
-                "risk_score": plugin_bundle.metadata.risk_score,
-                "security_level": plugin_bundle.security_context.security_level.value,
-                "creation_timestamp": plugin_bundle.metadata.created_at.isoformat(),
-                "operation_time_seconds": operation_time,
-                "warnings": security_validation.warnings or [],
-                "metrics": DEFAULT_PLUGIN_CORE.get_metrics(plugin_bundle)
-            }
-            
-            return response
+        return await _create_plugin(creation_data, operation_start)
     
+    except ContractViolation as e:
+        return _create_error_response(
+            "CONTRACT_VIOLATION",
+            str(e),
+            "Fix the reported plugin data and retry"
+        )
     except Exception as e:
         # Defensive Programming: Comprehensive error recovery
         logger.error(f"Unexpected error in plugin creation: {e}", exc_info=True)
@@ -228,8 +190,67 @@ async def km_create_plugin_action(
         )
 
 
+@plugin_creation_contract
+async def _create_plugin(plugin_data: PluginCreationData, operation_start: datetime) -> Dict[str, Any]:
+    """Build, register and describe a plugin from checked creation data.
+    
+    Split out of km_create_plugin_action so the creation contract sees the
+    PluginCreationData the tool assembles from its arguments.
+    """
+    # Negative Space Programming: Security boundary validation
+    security_validation = DEFAULT_PLUGIN_BOUNDARY.validate_plugin_creation(plugin_data)
+    if not security_validation.is_valid:
+        return _create_error_response(
+            "SECURITY_VIOLATION",
+            "Plugin creation blocked by security validation",
+            f"Security issues: {'; '.join(security_validation.security_issues or [])}",
+            security_validation.security_issues
+        )
+    
+    # Immutable Functions: Use functional core for plugin creation
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bundle_result = create_plugin_pipeline(plugin_data, temp_dir)
+        
+        if bundle_result.is_failure:
+            error = bundle_result._error
+            return _create_error_response(
+                error.error_type.value.upper(),
+                error.message,
+                error.recovery_suggestion or "Check input parameters and retry"
+            )
+        
+        plugin_bundle = bundle_result.unwrap()
+        
+        # Register plugin in system registry
+        _plugin_registry[plugin_bundle.plugin_id] = plugin_bundle.metadata
+        _plugin_sources[plugin_bundle.plugin_id] = plugin_data
+        invalidate_system_invariants()
+        
+        # Log successful creation
+        logger.info(f"Plugin created successfully: {plugin_bundle.plugin_id}")
+        
+        # Calculate operation metrics
+        operation_time = (datetime.now() - operation_start).total_seconds()
+        
+        # Contract enforcement: Ensure postconditions
+        response = {
+            "success": True,
+            "plugin_id": plugin_bundle.plugin_id,
+            "plugin_name": plugin_bundle.name,
+            "bundle_path": str(plugin_bundle.bundle_path),
+            "content_hash": plugin_bundle.metadata.content_hash,
+            "risk_score": plugin_bundle.metadata.risk_score,
+            "security_level": plugin_bundle.security_context.security_level.value,
+            "creation_timestamp": plugin_bundle.metadata.created_at.isoformat(),
+            "operation_time_seconds": operation_time,
+            "warnings": security_validation.warnings or [],
+            "metrics": DEFAULT_PLUGIN_CORE.get_metrics(plugin_bundle)
+        }
+        
+        return response
+
+
 @mcp_tool()
-@plugin_installation_contract
 async def km_install_plugin(
     plugin_id: str,
     target_directory: Optional[str] = None,
@@ -273,63 +294,21 @@ async def km_install_plugin(
             km_actions_dir = Path.home() / "Library/Application Support/Keyboard Maestro/Keyboard Maestro Actions"
             target_directory = str(km_actions_dir)
         
-        # Negative Space Programming: Installation boundary validation
-        boundary_result = validate_plugin_installation_security(
-            PluginID(plugin_id), 
-            str(plugin_metadata.bundle_path) if hasattr(plugin_metadata, 'bundle_path') else "",
-            target_directory
+        return await _install_plugin(
+            PluginID(plugin_id),
+            getattr(plugin_metadata, 'bundle_path', None) or "",
+            target_directory,
+            force_install,
+            verify_installation,
+            operation_start
         )
-        
-        if not boundary_result.allowed:
-            return _create_error_response(
-                "SECURITY_VIOLATION",
-                f"Installation blocked by security boundaries: {boundary_result.denial_reason}",
-                "Check installation directory permissions and security settings",
-                boundary_result.security_warnings
-            )
-        
-        # Simulate installation process (would integrate with actual file operations)
-        installation_path = Path(target_directory) / f"{plugin_metadata.action_name}.kmsync"
-        
-        # Check for existing installation
-        if installation_path.exists() and not force_install:
-            return _create_error_response(
-                "ALREADY_EXISTS",
-                f"Plugin already installed at: {installation_path}",
-                "Use force_install=true to overwrite or choose different directory"
-            )
-        
-        # Record installation in history
-        installation_record = {
-            "plugin_id": plugin_id,
-            "installation_path": str(installation_path),
-            "timestamp": datetime.now().isoformat(),
-            "target_directory": target_directory,
-            "force_install": force_install,
-            "operation_time": (datetime.now() - operation_start).total_seconds()
-        }
-        _installation_history.append(installation_record)
-        
-        # Update plugin state
-        updated_metadata = plugin_metadata.with_state(PluginLifecycleState.INSTALLED)
-        _plugin_registry[plugin_id] = updated_metadata
-        
-        logger.info(f"Plugin installed successfully: {plugin_id} -> {installation_path}")
-        
-        response = {
-            "success": True,
-            "plugin_id": plugin_id,
-            "installation_path": str(installation_path),
-            "target_directory": target_directory,
-            "force_install": force_install,
-            "verification_passed": verify_installation,
-            "installation_timestamp": installation_record["timestamp"],
-            "operation_time_seconds": installation_record["operation_time"],
-            "warnings": boundary_result.security_warnings
-        }
-        
-        return response
     
+    except ContractViolation as e:
+        return _create_error_response(
+            "CONTRACT_VIOLATION",
+            str(e),
+            "Check the plugin bundle and installation directory, then retry"
+        )
     except Exception as e:
         logger.error(f"Unexpected error in plugin installation: {e}", exc_info=True)
         return _create_error_response(
@@ -339,6 +318,79 @@ async def km_install_plugin(
         )
 
 
+@plugin_installation_contract
+async def _install_plugin(
+    plugin_id: PluginID,
+    bundle_path: str,
+    target_directory: str,
+    force_install: bool,
+    verify_installation: bool,
+    operation_start: datetime
+) -> Dict[str, Any]:
+    """Install a registered plugin's bundle into the target directory.
+    
+    Split out of km_install_plugin so the installation contract sees the
+    bundle path recorded for the plugin, not just its ID.
+    """
+    plugin_metadata = _plugin_registry[plugin_id]
+    
+    # Negative Space Programming: Installation boundary validation
+    boundary_result = validate_plugin_installation_security(
+        plugin_id, bundle_path, target_directory
+    )
+    
+    if not boundary_result.allowed:
+        return _create_error_response(
+            "SECURITY_VIOLATION",
+            f"Installation blocked by security boundaries: {boundary_result.denial_reason}",
+            "Check installation directory permissions and security settings",
+            boundary_result.security_warnings
+        )
+    
+    # Simulate installation process (would integrate with actual file operations)
+    installation_path = Path(target_directory) / f"{plugin_metadata.action_name}.kmsync"
+    
+    # Check for existing installation
+    if installation_path.exists() and not force_install:
+        return _create_error_response(
+            "ALREADY_EXISTS",
+            f"Plugin already installed at: {installation_path}",
+            "Use force_install=true to overwrite or choose different directory"
+        )
+    
+    # Record installation in history
+    installation_record = {
+        "plugin_id": plugin_id,
+        "installation_path": str(installation_path),
+        "timestamp": datetime.now().isoformat(),
+        "target_directory": target_directory,
+        "force_install": force_install,
+        "operation_time": (datetime.now() - operation_start).total_seconds()
+    }
+    _installation_history.append(installation_record)
+    
+    # Update plugin state
+    updated_metadata = plugin_metadata.with_state(PluginLifecycleState.INSTALLED)
+    _plugin_registry[plugin_id] = updated_metadata
+    invalidate_system_invariants()
+    
+    logger.info(f"Plugin installed successfully: {plugin_id} -> {installation_path}")
+    
+    response = {
+        "success": True,
+        "plugin_id": plugin_id,
+        "installation_path": str(installation_path),
+        "target_directory": target_directory,
+        "force_install": force_install,
+        "verification_passed": verify_installation,
+        "installation_timestamp": installation_record["timestamp"],
+        "operation_time_seconds": installation_record["operation_time"],
+        "warnings": boundary_result.security_warnings
+    }
+    
+    return response
+
+
 @mcp_tool()
 async def km_list_custom_plugins(
     include_metadata: bool = True,
@@ -477,7 +529,6 @@ async def km_list_custom_plugins(
 
 
 @mcp_tool()
-@plugin_validation_contract
 async def km_validate_plugin(
     plugin_id: str,
     comprehensive_check: bool = True,
@@ -504,33 +555,22 @@ async def km_validate_plugin(
         
         plugin_metadata = _plugin_registry[plugin_id]
         
+        validation = _validate_plugin_data(
+            _plugin_sources.get(plugin_id), plugin_metadata, comprehensive_check, security_scan
+        )
+        
         validation_results = {
             "plugin_id": plugin_id,
             "validation_timestamp": datetime.now().isoformat(),
-            "checks_performed": [],
-            "issues_found": [],
-            "warnings": [],
+            "checks_performed": ["structure_validation"],
+            "issues_found": list(validation.validation_errors or []),
+            "warnings": list(validation.warnings),
             "recommendations": [],
             "overall_status": "UNKNOWN"
         }
         
-        # Basic structure validation
-        validation_results["checks_performed"].append("structure_validation")
-        if not plugin_metadata.action_name:
-            validation_results["issues_found"].append("Missing action name")
-        
-        # Security validation if requested
         if security_scan:
             validation_results["checks_performed"].append("security_scan")
-            
-            # Simulate security validation
-            if plugin_metadata.risk_score > 75:
-                validation_results["issues_found"].append("High security risk detected")
-            elif plugin_metadata.risk_score > 50:
-                validation_results["warnings"].append("Medium security risk - review recommended")
-            
-            if plugin_metadata.security_level == PluginSecurityLevel.DANGEROUS:
-                validation_results["issues_found"].append("Plugin marked as dangerous - requires manual approval")
         
         # Comprehensive checks if requested
         if comprehensive_check:
@@ -540,12 +580,6 @@ async def km_validate_plugin(
                 "resource_usage_analysis"
             ])
             
-            # Parameter validation
-            if plugin_metadata.parameters:
-                param_names = [p.name for p in plugin_metadata.parameters]
-                if len(param_names) != len(set(param_names)):
-                    validation_results["issues_found"].append("Duplicate parameter names detected")
-            
             # Add recommendations
             if plugin_metadata.risk_score > 25:
                 validation_results["recommendations"].append("Consider reducing script complexity")
@@ -575,6 +609,12 @@ async def km_validate_plugin(
         
         return response
     
+    except ContractViolation as e:
+        return _create_error_response(
+            "CONTRACT_VIOLATION",
+            str(e),
+            "Recreate the plugin so its script can be validated"
+        )
     except Exception as e:
         logger.error(f"Unexpected error validating plugin: {e}", exc_info=True)
         return _create_error_response(
@@ -584,6 +624,54 @@ async def km_validate_plugin(
         )
 
 
+@plugin_validation_contract
+def _validate_plugin_data(
+    plugin_data: Optional[PluginCreationData],
+    plugin_metadata: PluginMetadata,
+    comprehensive_check: bool,
+    security_scan: bool
+) -> PluginValidationResult:
+    """Check a registered plugin's creation data and metadata.
+    
+    Split out of km_validate_plugin so the validation contract sees the
+    plugin's script data and the typed result.
+    """
+    issues: List[str] = []
+    security_issues: List[str] = []
+    warnings: List[str] = []
+    
+    # Basic structure validation
+    if not plugin_metadata.action_name:
+        issues.append("Missing action name")
+    
+    # Security validation if requested
+    if security_scan:
+        # Simulate security validation
+        if plugin_metadata.risk_score > 75:
+            security_issues.append("High security risk detected")
+        elif plugin_metadata.risk_score > 50:
+            warnings.append("Medium security risk - review recommended")
+        
+        if plugin_metadata.security_level == PluginSecurityLevel.DANGEROUS:
+            security_issues.append("Plugin marked as dangerous - requires manual approval")
+        issues.extend(security_issues)
+    
+    # Parameter validation
+    if comprehensive_check and plugin_metadata.parameters:
+        param_names = [p.name for p in plugin_metadata.parameters]
+        if len(param_names) != len(set(param_names)):
+            issues.append("Duplicate parameter names detected")
+    
+    return PluginValidationResult(
+        is_valid=not issues,
+        security_issues=security_issues,
+        warnings=warnings,
+        required_permissions=[],
+        estimated_risk_level=min(3, plugin_metadata.risk_score // 25),
+        validation_errors=issues or None
+    )
+
+
 @mcp_tool()
 @plugin_removal_contract
 async def km_remove_plugin(
@@ -654,6 +742,8 @@ async def km_remove_plugin(
         
         # Remove from registry
         del _plugin_registry[plugin_id]
+        _plugin_sources.pop(plugin_id, None)
+        invalidate_system_invariants()
         removal_results["operations_performed"].append("registry_removal")
         
         # Simulate file removal if requested
@@ -824,6 +914,7 @@ def clear_plugin_registry() -> None:
     """Clear plugin registry (for testing)."""
     global _plugin_registry, _installation_history
     _plugin_registry.clear()
+    invalidate_system_invariants()
     _installation_history.clear()
 
 
@@ -50,6 +50,7 @@ from .domain_types import (
     MacroDefinition, VariableDefinition, ExecutionContext,
     OperationError, OCRTextExtraction,
     PluginCreationData, PluginMetadata, PluginValidationResult, PluginParameter,
+    PluginOperationResult,
     create_macro_metadata, create_execution_context
 )
 
@@ -124,6 +125,7 @@ __all__ = [
     'MacroDefinition', 'VariableDefinition', 'ExecutionContext',
     'OperationError', 'OCRTextExtraction',
     'PluginCreationData', 'PluginMetadata', 'PluginValidationResult', 'PluginParameter',
+    'PluginOperationResult',
     
     # Factory Functions
     'create_macro_uuid', 'create_macro_name', 'create_group_uuid',
@@ -6,7 +6,7 @@ This module defines the primary domain types that model the core business
 entities and their relationships using type-driven development principles.
 """
 
-from typing import Optional, FrozenSet, Dict, Any, Union, List
+from typing import Optional, FrozenSet, Dict, Any, Union, List, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -628,6 +628,36 @@ class PluginInstallationResult:
         return bool(self.warnings and len(self.warnings) > 0)
 
 
+@dataclass(frozen=True, slots=True)
+class PluginOperationResult:
+    """Outcome of a plugin create/install/lifecycle/remove operation.
+    
+    Fixed-field counterpart of the tools' JSON responses, so plugin contract
+    postconditions read attributes instead of probing dict keys.
+    """
+    success: bool
+    plugin_id: Optional[str] = None
+    installation_path: Optional[str] = None
+    content_hash: Optional[str] = None
+    error_message: Optional[str] = None
+    backup_path: Optional[str] = None
+    rollback_available: bool = False
+    
+    @classmethod
+    def from_response(cls, response: Mapping[str, Any]) -> 'PluginOperationResult':
+        """Build from a tool response dict; unknown keys are ignored."""
+        get = response.get
+        return cls(
+            success=response['success'],
+            plugin_id=get('plugin_id'),
+            installation_path=get('installation_path'),
+            content_hash=get('content_hash'),
+            error_message=get('error_message'),
+            backup_path=get('backup_path'),
+            rollback_available=get('rollback_available', False)
+        )
+
+
 @dataclass(frozen=True)
 class PluginExecutionContext:
     """Context for plugin execution with security constraints."""
@@ -234,10 +234,30 @@ class URLSchemeExecutor:
 
 
 class WebAPIExecutor:
-    """Executes macros via Keyboard Maestro Web API."""
+    """Executes macros via Keyboard Maestro Web API.
+    
+    Keeps one keep-alive HTTP session so repeated calls reuse the loopback
+    connection instead of opening a new one per request; call ``close()``
+    when done.
+    """
     
     def __init__(self, base_url: str = "http://localhost:4490"):
         self.base_url = base_url
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use or after close."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=60)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     @requires(lambda identifier: identifier is not None)
     @requires(lambda timeout: timeout > 0)
@@ -261,14 +281,13 @@ class WebAPIExecutor:
         # Execute HTTP request
         timeout_obj = aiohttp.ClientTimeout(total=timeout)
         
-        async with aiohttp.ClientSession(timeout=timeout_obj) as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    return f"Macro executed via web API: {identifier}"
-                else:
-                    error_msg = await response.text()
-                    raise RuntimeError(f"Web API execution failed (HTTP {response.status}): {error_msg}")
+        async with self._get_session().get(url, timeout=timeout_obj) as response:
+            if response.status == 200:
+                content = await response.text()
+                return f"Macro executed via web API: {identifier}"
+            else:
+                error_msg = await response.text()
+                raise RuntimeError(f"Web API execution failed (HTTP {response.status}): {error_msg}")
 
 
 class AppleScriptValidator:
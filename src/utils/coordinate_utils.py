@@ -10,9 +10,8 @@ from enum import Enum
 import subprocess
 import json
 
-from .contracts.decorators import requires, ensures
-from src.contracts.exceptions import ValidationError
-from src.types.domain_types import ScreenCoordinates, ScreenArea
+from src.contracts.decorators import requires, ensures
+from src.types.values import ScreenCoordinates, ScreenArea
 
 
 class DisplayInfo(NamedTuple):
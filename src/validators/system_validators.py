@@ -11,9 +11,8 @@ from pathlib import Path
 import re
 import os
 
-from .contracts.decorators import requires, ensures
-from src.contracts.exceptions import ValidationError
-from src.types.domain_types import ScreenCoordinates, ScreenArea
+from src.contracts.decorators import requires, ensures
+from src.types.values import ScreenCoordinates, ScreenArea
 from src.boundaries.permission_checker import permission_checker, PermissionType
 from src.utils.coordinate_utils import coordinate_validator
 
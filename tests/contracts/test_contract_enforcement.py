@@ -127,6 +127,60 @@ class TestContractDecorators:
         with pytest.raises(PreconditionViolation):
             constrained_function(150)
 
+    def test_build_contract_fused_clauses(self):
+        """Test fused contract checks all clauses in one wrapper."""
+        from src.contracts import build_contract
+
+        @build_contract(
+            preconditions=(lambda x: x > 0, lambda x, y: x < y),
+            postconditions=(lambda result: result > 0, lambda result, y: result < y * 2),
+            invariants=(lambda: True,)
+        )
+        def constrained_function(x: int, y: int = 100) -> int:
+            return x * 5
+
+        assert constrained_function(10) == 50
+        assert constrained_function.__name__ == "constrained_function"
+
+        with pytest.raises(PreconditionViolation):
+            constrained_function(-1)
+        with pytest.raises(PreconditionViolation):
+            constrained_function(10, y=5)
+        with pytest.raises(PostconditionViolation):
+            constrained_function(30, y=31)
+
+    def test_build_contract_rejects_undeclared_parameters(self):
+        """Test clauses naming parameters the function lacks fail at decoration."""
+        from src.contracts import build_contract
+
+        contract = build_contract(
+            preconditions=(("bundle_structure_valid", lambda bundle_path, force: True),)
+        )
+        with pytest.raises(TypeError, match="bundle_structure_valid.*bundle_path, force"):
+            @contract
+            def no_bundle(plugin_id: str) -> str:
+                return plugin_id
+
+        with pytest.raises(TypeError, match="target_state"):
+            @build_contract(postconditions=(lambda result, target_state: True,))
+            def no_target(plugin_id: str) -> str:
+                return plugin_id
+
+    def test_build_contract_result_view(self):
+        """Test postconditions see the normalised result, callers the original."""
+        from src.contracts import build_contract
+        from src.types.domain_types import PluginOperationResult
+
+        @build_contract(
+            postconditions=(lambda result: result.success == (result.plugin_id is not None),),
+            result_view=PluginOperationResult.from_response
+        )
+        def create(plugin_id):
+            return {"success": plugin_id is not None, "plugin_id": plugin_id}
+
+        assert create("mcp_plugin_test") == {"success": True, "plugin_id": "mcp_plugin_test"}
+        assert create(None)["success"] is False
+
 
 class TestValidationFunctions:
     """Test suite for validation functions."""
@@ -195,6 +249,32 @@ class TestValidationFunctions:
         violations = validate_macro_creation_data(invalid_macro_data)
         assert len(violations) > 0  # Should have violations
 
+    def test_batch_name_validation_matches_single(self):
+        """Test batch name validation agrees with the per-name validator."""
+        from src.contracts.validators import is_valid_macro_name
+        from src.contracts.validators_batch import validate_many_names, NUMBA_MIN_BATCH
+
+        names = ["Valid Name", "Macro_1.v2", "", "   ", "bad@name", "x" * 256, "é", None]
+        batch = names * (NUMBA_MIN_BATCH // len(names) + 1)
+        assert validate_many_names(batch) == [is_valid_macro_name(n) for n in batch]
+
+    @pytest.mark.parametrize("missing", [
+        "transport", "host", "port", "max_concurrent_operations",
+        "operation_timeout", "auth_required", "log_level", "development_mode",
+    ])
+    def test_server_configuration_requires_every_field(self, missing):
+        """Test a configuration missing any required field is rejected."""
+        from types import SimpleNamespace
+        from src.contracts.validators import is_valid_server_configuration
+
+        fields = dict(transport="stdio", host="127.0.0.1", port=8080,
+                      max_concurrent_operations=10, operation_timeout=30,
+                      auth_required=False, log_level="info", development_mode=False)
+        assert is_valid_server_configuration(SimpleNamespace(**fields))
+
+        del fields[missing]
+        assert not is_valid_server_configuration(SimpleNamespace(**fields))
+
 
 class TestInvariantChecking:
     """Test suite for system invariant checking."""
@@ -252,6 +332,98 @@ class TestInvariantChecking:
         with pytest.raises(InvariantViolation):
             system_invariant_checker.check_invariant("critical_test_invariant")
 
+    def test_invariants_checked_by_severity(self):
+        """Test critical invariants run first and fail_fast stops early."""
+        from src.contracts.invariants import (
+            InvariantDefinition, InvariantSeverity, SystemInvariantChecker
+        )
+
+        checker = SystemInvariantChecker()
+        calls = []
+        checker.register_invariant(InvariantDefinition(
+            name="info_check",
+            description="Info-level check",
+            severity=InvariantSeverity.INFO,
+            check_function=lambda: calls.append("info") or True
+        ))
+        checker.register_invariant(InvariantDefinition(
+            name="failing_error_check",
+            description="Error-level check that fails",
+            severity=InvariantSeverity.ERROR,
+            check_function=lambda: calls.append("error") or False
+        ))
+
+        assert checker._ordered_invariants[0].severity == InvariantSeverity.CRITICAL
+        assert checker._ordered_invariants[-1].name == "info_check"
+
+        # fail_fast returns on the first violation without running the rest
+        assert not checker.check_all(fail_fast=True)
+        assert calls == ["error"]
+
+    def test_invariant_wrap_errors(self):
+        """Test wrap_errors reports a raising check as a violation, or lets it propagate."""
+        from src.contracts.invariants import InvariantDefinition, InvariantSeverity
+
+        def raising_check():
+            raise OSError("Keyboard Maestro unreachable")
+
+        wrapped = InvariantDefinition(
+            name="wrapped_check",
+            description="Check that raises",
+            severity=InvariantSeverity.INFO,
+            check_function=raising_check
+        )
+        assert not wrapped.check()
+
+        unwrapped = InvariantDefinition(
+            name="unwrapped_check",
+            description="Check that raises",
+            severity=InvariantSeverity.INFO,
+            check_function=raising_check,
+            state_extractor=raising_check,
+            wrap_errors=False
+        )
+        with pytest.raises(OSError):
+            unwrapped.check()
+        assert unwrapped.get_current_state() == {"error": "State extraction failed"}
+
+    def test_core_check_errors_reported_as_violations(self):
+        """Test any exception from a core check's query fails that invariant only."""
+        from src.contracts.invariants import SystemInvariantChecker
+
+        checker = SystemInvariantChecker()
+
+        def unexpected():
+            raise KeyError("macro record without a UID")
+
+        checker._get_all_macros = unexpected
+        checker._get_local_variables = unexpected
+
+        results = checker.check_all_invariants()
+
+        assert results["macro_integrity"] is False
+        assert results["variable_scope"] is False
+        assert results["resource_limits"] is True
+
+    def test_permission_boundary_tracks_active_operations(self):
+        """Test permission boundary uses the union of active operation permissions."""
+        from src.contracts.invariants import SystemInvariantChecker
+
+        checker = SystemInvariantChecker()
+        assert checker._check_permission_boundaries()
+
+        checker.operation_started("op_1", {"file_write"})
+        assert not checker._check_permission_boundaries()
+        assert checker._get_permission_state()["permission_violations"] == ["op_1"]
+
+        checker.operation_finished("op_1")
+        assert checker._check_permission_boundaries()
+
+        # Re-registering an operation replaces, not extends, its permissions
+        checker.operation_started("op_2", {"file_write"})
+        checker.operation_started("op_2", set())
+        assert checker._check_permission_boundaries()
+
 
 class TestConvenienceContracts:
     """Test suite for convenience contract decorators."""
@@ -313,6 +485,75 @@ class TestConvenienceContracts:
         with pytest.raises(PreconditionViolation):
             test_script_execution("rm -rf /", "test")
 
+    def test_plugin_batch_contract_decorator(self):
+        """Test batch plugin contract validates every item in one call."""
+        from src.contracts import plugin_batch_contract
+        from src.types.domain_types import PluginCreationData
+        from src.types.enumerations import PluginScriptType
+
+        @plugin_batch_contract
+        def create_batch(batch):
+            return [{"success": True, "plugin_id": f"mcp_plugin_{i}", "content_hash": "h"}
+                    for i, _ in enumerate(batch)]
+
+        batch = [
+            PluginCreationData(f"Action {i}", PluginScriptType.APPLESCRIPT, 'display dialog "hi"')
+            for i in range(3)
+        ]
+        assert len(create_batch(batch)) == 3
+
+        # Should fail when one item has an invalid filesystem name
+        bad = batch + [PluginCreationData("Bad/Name", PluginScriptType.APPLESCRIPT, 'beep')]
+        with pytest.raises(PreconditionViolation):
+            create_batch(bad)
+
+    @pytest.mark.parametrize("contract_name, table_prefix", [
+        ("plugin_creation_contract", "_CREATION"),
+        ("plugin_installation_contract", "_INSTALLATION"),
+        ("plugin_validation_contract", "_VALIDATION"),
+        ("plugin_lifecycle_contract", "_LIFECYCLE"),
+        ("plugin_removal_contract", "_REMOVAL"),
+        ("plugin_security_contract", "_SECURITY"),
+        ("plugin_batch_contract", "_BATCH"),
+    ])
+    def test_plugin_contract_clauses_resolve(self, contract_name, table_prefix):
+        """Test every clause in a plugin contract's tables resolves on decoration."""
+        import inspect
+        from src.contracts import plugin_contracts
+
+        preconditions = getattr(plugin_contracts, f"{table_prefix}_PRECONDITIONS")
+        postconditions = getattr(plugin_contracts, f"{table_prefix}_POSTCONDITIONS")
+        assert all(clause.__name__.startswith("_pre_") for _, clause in preconditions)
+        assert all(clause.__name__.startswith("_post_") for _, clause in postconditions)
+
+        # An operation declaring exactly the arguments the clauses read
+        names = {name for _, clause in preconditions
+                 for name in inspect.signature(clause).parameters}
+        names.update(name for _, clause in postconditions
+                     for name in list(inspect.signature(clause).parameters)[1:])
+
+        def operation(**kwargs):
+            return kwargs
+        operation.__signature__ = inspect.Signature([
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY) for name in sorted(names)
+        ])
+
+        with patch.object(plugin_contracts, "CONTRACTS_ENABLED", True):
+            decorated = getattr(plugin_contracts, contract_name)(operation)
+        assert decorated is not operation
+
+    def test_plugin_contract_tables_cover_all_clauses(self):
+        """Test every module-level plugin clause is listed in some contract table."""
+        from src.contracts import plugin_contracts
+
+        tabled = {clause.__name__
+                  for name, table in vars(plugin_contracts).items()
+                  if name.endswith(("_PRECONDITIONS", "_POSTCONDITIONS"))
+                  for _, clause in table}
+        defined = {name for name in vars(plugin_contracts)
+                   if name.startswith(("_pre_", "_post_"))}
+        assert defined <= tabled
+
 
 class TestContractIntegration:
     """Integration tests for contract framework."""
@@ -0,0 +1,541 @@
+"""
+Tests for the AppleScript connection pool.
+
+Covers the framed request/response protocol spoken to the interactive
+osascript child (using a fake REPL process), parity with `osascript -e`
+on macOS, and pool bookkeeping: waiter handoff, tombstoned idle entries,
+recycling, idle expiry and initial creation.
+"""
+
+import asyncio
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core import applescript_pool
+from src.core.applescript_pool import (
+    AppleScriptConnection, AppleScriptConnectionPool, ConnectionStatus,
+    PoolConfiguration, PoolStatus, run_compiled_script
+)
+
+
+class _FakeStdin:
+    """Collects requests and hands them to the fake REPL."""
+
+    def __init__(self, repl: "FakeRepl"):
+        self._repl = repl
+
+    def write(self, data: bytes) -> None:
+        self._repl.handle(data.decode('utf-8'))
+
+    async def drain(self) -> None:
+        pass
+
+
+class FakeRepl:
+    """Stands in for `osascript -i`, answering each framed request.
+
+    ``reply`` maps the tags of a request to (stdout, stderr) text, written the
+    way the REPL would print them.
+    """
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+        self.returncode = None
+        self.stdin = _FakeStdin(self)
+        self.stdout = asyncio.StreamReader()
+        self.stderr = asyncio.StreamReader()
+
+    def handle(self, request: str) -> None:
+        self.requests.append(request)
+        request_id = re.search(r'<<<EOF:(\w+)>>>', request).group(1)
+        tags = {kind: f"<<<{kind}:{request_id}>>>" for kind in ("OK", "ERR", "EOF")}
+        stdout, stderr = self.reply(tags)
+        self.stdout.feed_data(stdout.encode('utf-8'))
+        self.stderr.feed_data(stderr.encode('utf-8'))
+
+
+def _connection(repl: FakeRepl) -> AppleScriptConnection:
+    connection = AppleScriptConnection("test_conn")
+    connection._process = repl
+    return connection
+
+
+def _pool(**config) -> AppleScriptConnectionPool:
+    """Pool that creates connections on demand without probing osascript."""
+    config.setdefault("min_connections", 0)
+    config.setdefault("check_health", False)
+    pool = AppleScriptConnectionPool(PoolConfiguration(**config))
+    pool._osascript_verified = True
+    return pool
+
+
+async def _until(predicate) -> None:
+    """Yield to the loop until predicate holds (waiters have parked, etc.).
+    
+    Yields a few more turns once it holds, so a waiter counted in queue_size
+    has also reached its queue get (wait_for starts that in its own task).
+    """
+    for _ in range(100):
+        if predicate():
+            for _ in range(3):
+                await asyncio.sleep(0)
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture(autouse=True)
+def repl_only():
+    """Force the osascript path even where OSAKit is importable."""
+    with patch.object(applescript_pool, "_OSA_LANGUAGE", None):
+        yield
+
+
+class TestFramedProtocol:
+    """Test the request framing and response parsing."""
+
+    @pytest.mark.asyncio
+    async def test_quoted_echo_is_unquoted(self):
+        """Test a quoted REPL echo with a result prefix yields the plain text."""
+        repl = FakeRepl(lambda t: (
+            f'?> => "{t["OK"]}say \\"hi\\" C:\\\\temp{t["EOF"]}"\n',
+            f'{t["EOF"]}\n'
+        ))
+        result = await _connection(repl).execute_script('return "say \\"hi\\" C:\\\\temp"')
+
+        assert result.success
+        assert result.output == 'say "hi" C:\\temp'
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_log_output_does_not_fail_script(self):
+        """Test stderr `log` lines are not treated as an error."""
+        repl = FakeRepl(lambda t: (
+            f'{t["OK"]}42{t["EOF"]}\n',
+            f'progress\n{t["EOF"]}\n'
+        ))
+        result = await _connection(repl).execute_script('log "progress"\nreturn 42')
+
+        assert result.success
+        assert result.output == "42"
+
+    @pytest.mark.asyncio
+    async def test_error_frame_fails_script(self):
+        """Test the error tag, not stderr, decides failure."""
+        repl = FakeRepl(lambda t: (
+            f'"{t["ERR"]}Can’t divide 1 by zero. (-2701){t["EOF"]}"\n',
+            f'{t["EOF"]}\n'
+        ))
+        result = await _connection(repl).execute_script('return 1 / 0')
+
+        assert not result.success
+        assert result.output is None
+        assert result.error == "Can’t divide 1 by zero. (-2701)"
+
+    @pytest.mark.asyncio
+    async def test_multiline_script_sent_as_one_unit(self):
+        """Test a multi-line script travels as a single `run script` line."""
+        repl = FakeRepl(lambda t: (f'{t["OK"]}3{t["EOF"]}\n', f'{t["EOF"]}\n'))
+        script = 'set x to 1\nset y to 2\nreturn x + y'
+        result = await _connection(repl).execute_script(script)
+
+        assert result.output == "3"
+        run_line, log_line, rest = repl.requests[0].split('\n')
+        assert run_line.startswith('run script "')
+        assert '\\\\nset y to 2' in run_line  # Script newlines escaped twice
+        assert log_line.startswith('log "<<<EOF:')
+        assert rest == ""
+
+    @pytest.mark.asyncio
+    async def test_stale_prompt_noise_is_skipped(self):
+        """Test output left over from earlier lines precedes and is ignored."""
+        repl = FakeRepl(lambda t: (
+            f'?> \n?> => {t["OK"]}done{t["EOF"]}\n',
+            f'{t["EOF"]}\n'
+        ))
+        result = await _connection(repl).execute_script('return "done"')
+
+        assert result.output == "done"
+
+
+class TestRunCompiledScript:
+    """Test the statement that runs a compiled script with argv."""
+
+    def test_without_parameters(self):
+        """Test a script without args gets no parameter list and an escaped path."""
+        statement = run_compiled_script(Path('/tmp/km "scripts"/volume.scpt'))
+
+        assert statement == 'run script (POSIX file "/tmp/km \\"scripts\\"/volume.scpt")'
+
+    def test_parameters_escaped_as_string_literals(self):
+        """Test quotes and backslashes in args cannot close the literal."""
+        statement = run_compiled_script(Path("/tmp/volume.scpt"),
+                                        ["50", 'a" & (do shell script "id") & "', "C:\\x"])
+
+        assert statement.endswith(
+            ' with parameters {"50", "a\\" & (do shell script \\"id\\") & \\"", "C:\\\\x"}'
+        )
+
+
+class TestScriptPrefixCheck:
+    """Test the opt-in statement prefix check."""
+
+    @pytest.mark.asyncio
+    async def test_unrecognised_prefix_runs_by_default(self):
+        """Test a script outside the prefix list runs when the check is off."""
+        repl = FakeRepl(lambda t: (f'{t["OK"]}3{t["EOF"]}\n', f'{t["EOF"]}\n'))
+        result = await _connection(repl).execute_script('1 + 2')
+
+        assert result.success
+        assert result.output == "3"
+        assert len(repl.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_unrecognised_prefix_rejected_when_enabled(self):
+        """Test the pool flag turns the check on for its connections."""
+        pool = AppleScriptConnectionPool(PoolConfiguration(
+            min_connections=0, check_health=False, check_script_prefix=True
+        ))
+        pool._osascript_verified = True
+        repl = FakeRepl(lambda t: (f'{t["OK"]}3{t["EOF"]}\n', f'{t["EOF"]}\n'))
+
+        async with pool.get_connection() as connection:
+            connection._process = repl
+            result = await connection.execute_script('1 + 2')
+        await pool.shutdown()
+
+        assert not result.success
+        assert "Script rejected" in result.error
+        assert repl.requests == []
+
+
+class TestPoolMetrics:
+    """Test get_pool_metrics tracks connection state changes."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_follow_claim_and_return(self):
+        """Test use counts and status update across checkout and return."""
+        pool = AppleScriptConnectionPool(PoolConfiguration(min_connections=0, check_health=False))
+        pool._osascript_verified = True
+        repl = FakeRepl(lambda t: (f'{t["OK"]}ok{t["EOF"]}\n', f'{t["EOF"]}\n'))
+
+        for expected_uses in (1, 2):
+            async with pool.get_connection() as connection:
+                connection._process = repl
+                await connection.execute_script('return "ok"')
+                busy = await pool.get_pool_metrics()
+                assert busy['available_connections'] == 0
+            metrics = await pool.get_pool_metrics()
+            row, = metrics['connection_metrics']
+            assert row['use_count'] == expected_uses
+            assert row['status'] == "available"
+            assert metrics['available_connections'] == 1
+
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_copies(self):
+        """Test mutating a returned payload does not leak into the next one."""
+        pool = AppleScriptConnectionPool(PoolConfiguration(min_connections=0, check_health=False))
+        pool._osascript_verified = True
+        async with pool.get_connection():
+            pass
+
+        first = await pool.get_pool_metrics()
+        first['connection_metrics'][0]['use_count'] = 99
+        first['configuration']['max_connections'] = 0
+
+        second = await pool.get_pool_metrics()
+        assert second['connection_metrics'][0]['use_count'] == 0
+        assert second['configuration']['max_connections'] == 5
+        await pool.shutdown()
+
+
+class TestPoolHandoff:
+    """Test waiters queue for returned connections."""
+
+    @pytest.mark.asyncio
+    async def test_waiter_receives_returned_connection(self):
+        """Test a caller blocked on a saturated pool gets the released connection."""
+        pool = _pool(max_connections=1)
+        held = await pool._acquire_connection()
+
+        waiter = asyncio.create_task(pool._acquire_connection())
+        await _until(lambda: pool.queue_size == 1)
+        assert not waiter.done()
+
+        pool._return_connection(held)
+        assert await waiter is held
+        assert pool.queue_size == 0
+        assert pool.total_connections == 1
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_arrival_order(self):
+        """Test each release wakes the longest-waiting caller."""
+        pool = _pool(max_connections=1)
+        held = await pool._acquire_connection()
+        served = []
+
+        async def wait_turn(name):
+            connection = await pool._acquire_connection()
+            served.append(name)
+            return connection
+
+        waiters = []
+        for name in ("first", "second", "third"):
+            waiters.append(asyncio.create_task(wait_turn(name)))
+            await _until(lambda: pool.queue_size == len(waiters))
+
+        connection = held
+        for waiter in waiters:
+            pool._return_connection(connection)
+            connection = await waiter
+        assert served == ["first", "second", "third"]
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_times_out(self):
+        """Test a wait that outlasts its timeout raises and leaves the queue."""
+        pool = _pool(max_connections=1)
+        await pool._acquire_connection()
+
+        with pytest.raises(TimeoutError):
+            await pool._acquire_connection(timeout=0.02)
+        assert pool.queue_size == 0
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejected(self):
+        """Test callers beyond max_queue_size fail instead of waiting."""
+        pool = _pool(max_connections=1, max_queue_size=1)
+        held = await pool._acquire_connection()
+        waiter = asyncio.create_task(pool._acquire_connection())
+        await _until(lambda: pool.queue_size == 1)
+
+        with pytest.raises(RuntimeError, match="queue is full"):
+            await pool._acquire_connection()
+
+        pool._return_connection(held)
+        assert await waiter is held
+        await pool.shutdown()
+
+
+class TestIdleTombstones:
+    """Test IDs discarded while queued are skipped, not handed out."""
+
+    @pytest.mark.asyncio
+    async def test_take_idle_skips_discarded_id(self):
+        """Test a discarded ID left in the queue is passed over."""
+        pool = _pool()
+        first, second = await asyncio.gather(pool._acquire_connection(),
+                                             pool._acquire_connection())
+        pool._return_connection(first)
+        pool._return_connection(second)
+
+        pool._discard_idle({first.connection_id})
+
+        assert pool._take_idle() is second
+        assert pool._take_idle() is None
+        assert pool.available_connections == 0
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_waiter_woken_by_tombstone_keeps_waiting(self):
+        """Test a waiter handed a discarded ID waits for the next real one."""
+        pool = _pool(max_connections=1)
+        held = await pool._acquire_connection()
+        waiter = asyncio.create_task(pool._acquire_connection())
+        await _until(lambda: pool.queue_size == 1)
+
+        # Hand the ID to the waiter, then discard it before the waiter runs
+        pool._return_connection(held)
+        pool._discard_idle({held.connection_id})
+        await _until(lambda: pool.queue_size == 1 and pool._idle.empty())
+        assert not waiter.done()
+
+        pool._mark_available(held.connection_id)
+        assert await waiter is held
+        await pool.shutdown()
+
+
+class TestRecycling:
+    """Test connections past their age or use limit are retired on checkout."""
+
+    @staticmethod
+    async def _assert_retired(pool, old):
+        await _until(lambda: old.metrics.status == ConnectionStatus.CLOSED)
+        assert old.connection_id not in pool._connections
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_max_uses(self):
+        """Test a connection that ran max_uses scripts is replaced."""
+        pool = _pool(max_uses=2)
+        repl = FakeRepl(lambda t: (f'{t["OK"]}ok{t["EOF"]}\n', f'{t["EOF"]}\n'))
+
+        async with pool.get_connection() as connection:
+            connection._process = repl
+            await connection.execute_script('return "ok"')
+            await connection.execute_script('return "ok"')
+        old = connection
+
+        async with pool.get_connection() as connection:
+            assert connection is not old
+        await self._assert_retired(pool, old)
+        assert pool.total_connections == 1
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_pool_recycle_age(self):
+        """Test a connection older than pool_recycle is replaced."""
+        pool = _pool(pool_recycle=60)
+        async with pool.get_connection() as old:
+            pass
+
+        async with pool.get_connection() as connection:
+            assert connection is old  # Still young
+
+        old.metrics.created_at -= 61
+        async with pool.get_connection() as connection:
+            assert connection is not old
+        await self._assert_retired(pool, old)
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_waiter_never_gets_recycled_connection(self):
+        """Test a waiter woken by a spent connection gets a fresh one instead."""
+        pool = _pool(max_connections=1, max_uses=1)
+        held = await pool._acquire_connection()
+        held.metrics.use_count = 1
+        waiter = asyncio.create_task(pool._acquire_connection())
+        await _until(lambda: pool.queue_size == 1)
+
+        pool._return_connection(held)
+        connection = await waiter
+
+        assert connection is not held
+        assert connection.is_available
+        await self._assert_retired(pool, held)
+        await pool.shutdown()
+
+
+class TestIdleExpiry:
+    """Test the per-connection max_idle_time timers."""
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_closed_and_not_reused(self):
+        """Test an expired connection is closed and never handed out again."""
+        pool = _pool(max_idle_time=0.01)
+        async with pool.get_connection() as old:
+            pass
+
+        await asyncio.sleep(0.05)
+        assert pool.available_connections == 0
+        assert old.metrics.status == ConnectionStatus.CLOSED
+
+        async with pool.get_connection() as connection:
+            assert connection is not old
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_checkout_cancels_expiry(self):
+        """Test a connection in use is not expired by its earlier idle timer."""
+        pool = _pool(max_idle_time=0.02)
+        async with pool.get_connection() as first:
+            pass
+
+        async with pool.get_connection() as connection:
+            assert connection is first
+            await asyncio.sleep(0.05)
+            assert connection.is_available
+        assert pool.total_connections == 1
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_min_connections_kept(self):
+        """Test expiry never drops the pool below min_connections."""
+        pool = _pool(min_connections=1, max_idle_time=0.01)
+        await pool.initialize()
+
+        await asyncio.sleep(0.05)
+        assert pool.total_connections == 1
+        assert pool.available_connections == 1
+        await pool.shutdown()
+
+
+class TestInitialize:
+    """Test pool start-up."""
+
+    @pytest.mark.asyncio
+    async def test_min_connections_created_concurrently(self):
+        """Test the minimum connections are probed in parallel, not one by one."""
+        pool = AppleScriptConnectionPool(PoolConfiguration(min_connections=3, check_health=False))
+        active = peak = 0
+
+        async def health_check(connection):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        with patch.object(AppleScriptConnection, "health_check", health_check):
+            await pool.initialize()
+
+        assert peak == 3
+        assert pool.status == PoolStatus.ACTIVE
+        assert pool.available_connections == 3
+        await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_start_fails_pool(self):
+        """Test a failed osascript probe marks the pool failed."""
+        pool = AppleScriptConnectionPool(PoolConfiguration(min_connections=2, check_health=False))
+
+        async def health_check(connection):
+            return False
+
+        with patch.object(AppleScriptConnection, "health_check", health_check), \
+                pytest.raises(RuntimeError):
+            await pool.initialize()
+        assert pool.status == PoolStatus.FAILED
+
+
+@pytest.mark.skipif(sys.platform != "darwin" or shutil.which("osascript") is None,
+                    reason="requires macOS osascript")
+class TestOsascriptParity:
+    """Test pooled execution matches `osascript -e` for the same script."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("script", [
+        'return "hello world"',
+        'return "quote \\" and backslash \\\\"',
+        'return 42',
+        'return 2.5',
+        'log "noise"\nreturn "after log"',
+        'set total to 0\nrepeat with i from 1 to 3\nset total to total + i\nend repeat\nreturn total',
+        'return 1 / 0',
+    ])
+    async def test_matches_osascript_e(self, script):
+        """Test success and output agree with a one-shot osascript run."""
+        expected = subprocess.run(['osascript', '-e', script],
+                                  capture_output=True, text=True)
+        connection = AppleScriptConnection("parity_conn")
+        try:
+            result = await connection.execute_script(script)
+        finally:
+            await connection.close()
+
+        assert result.success == (expected.returncode == 0)
+        if result.success:
+            assert result.output == (expected.stdout.strip() or None)
+        else:
+            assert result.error and result.error.split(" (")[0] in expected.stderr
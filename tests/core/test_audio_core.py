@@ -0,0 +1,312 @@
+"""
+Tests for the audio core.
+
+Runs AudioCore against a fake osascript connection so volume parsing can be
+checked with the output shapes an interactive osascript child produces, and
+against canned `say` and `system_profiler` output for speech, voice and
+device listing.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.applescript_pool import ScriptResult
+from src.core import audio_core
+from src.core.audio_core import (
+    AudioCore, SAY_ARGV_MAX_CHARS, SAY_PATH, _CommandResult, _parse_volume
+)
+
+
+class FakeConnection:
+    """Stands in for the persistent osascript connection."""
+
+    def __init__(self, output=None, success=True, error=None):
+        self.result = ScriptResult(success, output, error, "fake_audio")
+        self.scripts = []
+
+    async def execute_script(self, script, timeout=30.0):
+        self.scripts.append(script)
+        return self.result
+
+    async def close(self):
+        pass
+
+
+def _audio_core(connection: FakeConnection) -> AudioCore:
+    core = AudioCore(AsyncMock())
+    core._osa = connection
+    return core
+
+
+class TestVolumeParsing:
+    """Test volume levels survive REPL-style output."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output", [
+        "42", "=> 42", '"42"', "?> => 42\n", "log line\n42",
+    ])
+    async def test_get_system_volume_repl_output(self, output):
+        """Test prompts, quoting and stray lines around the level are ignored."""
+        core = _audio_core(FakeConnection(output))
+        with patch.object(core._scripts, "compile", AsyncMock(return_value=None)):
+            result = await core.get_system_volume()
+
+        assert result.success
+        assert result.output == "42"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("output", [None, "missing value", "2.5", "150"])
+    async def test_get_system_volume_unparseable(self, output):
+        """Test output without a 0-100 level reports a parse error."""
+        core = _audio_core(FakeConnection(output))
+        with patch.object(core._scripts, "compile", AsyncMock(return_value=None)):
+            result = await core.get_system_volume()
+
+        assert not result.success
+        assert result.error_code == "PARSE_ERROR"
+
+    def test_parse_volume_takes_last_level(self):
+        """Test the level is the last standalone integer in the output."""
+        assert _parse_volume("km_op_1 => 0") == 0
+        assert _parse_volume("100") == 100
+        assert _parse_volume("") is None
+
+
+class TestVolumeScripts:
+    """Test volume scripts run from their compiled form with argv."""
+
+    @pytest.mark.asyncio
+    async def test_set_volume_passes_level_as_parameter(self, tmp_path):
+        """Test the level reaches the compiled script through `with parameters`."""
+        connection = FakeConnection("=> 30")
+        core = _audio_core(connection)
+        compiled = tmp_path / "set_volume.scpt"
+        with patch.object(core._scripts, "compile", AsyncMock(return_value=compiled)):
+            result = await core.set_system_volume(30)
+
+        assert result.success
+        assert connection.scripts == [
+            f'run script (POSIX file "{compiled}") with parameters {{"30"}}'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_set_volume_falls_back_to_source(self):
+        """Test the level is sent as source when the script cannot be compiled."""
+        connection = FakeConnection("=> 30")
+        core = _audio_core(connection)
+        with patch.object(core._scripts, "compile", AsyncMock(return_value=None)):
+            await core.set_system_volume(30)
+
+        assert connection.scripts == ["set volume output volume 30"]
+
+
+class TestBackgroundCompile:
+    """Test the restore-script compile started by play_sound."""
+
+    @pytest.mark.asyncio
+    async def test_compile_task_held_until_done(self):
+        """Test the background compile stays referenced until it finishes."""
+        core = _audio_core(FakeConnection("=> 55"))
+        gate = asyncio.Event()
+        caller = asyncio.current_task()
+
+        async def compile(source):
+            if asyncio.current_task() is not caller:
+                await gate.wait()  # The background compile outlives playback
+            return None
+
+        validator = MagicMock()
+        validator.validate_file_path.return_value.is_valid = True
+        with patch.object(audio_core, "system_validator", validator), \
+                patch.object(core._scripts, "compile", compile), \
+                patch.object(core, "_run_command",
+                             AsyncMock(return_value=_CommandResult(True, None, None))):
+            result = await core.play_sound("/tmp/sound.aiff", volume=30)
+
+            assert result.success
+            assert len(core._compile_tasks) == 1
+            gate.set()
+            await core.close()
+
+        assert not core._compile_tasks
+
+
+SAY_VOICES = """\
+Albert              en_US    # Hello! My name is Albert.
+Bad News            en_US    # Hello! My name is Bad News.
+Eddy (English (US)) en_US    # Hello! My name is Eddy.
+Grandma (Français (France)) fr_FR    # Bonjour, je m’appelle Grandma.
+Ting-Ting           zh_CN    # 你好！我叫婷婷。
+"""
+
+SP_AUDIO = """\
+Audio:
+
+    Devices:
+
+        MacBook Pro Microphone:
+
+          Default Input Device: Yes
+          Input Channels: 1
+          Manufacturer: Apple Inc.
+          Current SampleRate: 48000
+          Transport: Built-in
+
+        MacBook Pro Speakers:
+
+          Default Output Device: Yes
+          Default System Output Device: Yes
+          Manufacturer: Apple Inc.
+          Output Channels: 2
+          Current SampleRate: 48000
+          Transport: Built-in
+
+        USB Audio Interface:
+
+          Input Channels: 2
+          Manufacturer: Focusrite
+          Output Channels: 2
+          Transport: USB
+
+        Aggregate Device:
+
+          Manufacturer: Apple Inc.
+          Transport: Aggregate
+"""
+
+
+def _command_core(output=None, success=True, error=None):
+    core = _audio_core(FakeConnection())
+    run = AsyncMock(return_value=_CommandResult(success, output, error))
+    core._run_command = run
+    return core, run
+
+
+class TestSpeakText:
+    """Test the say argv built by speak_text."""
+
+    @pytest.mark.asyncio
+    async def test_short_text_passed_as_argument(self):
+        """Test text up to the argv limit follows "--" so leading dashes are safe."""
+        core, run = _command_core()
+        text = "-v is not an option here"
+
+        result = await core.speak_text(text, voice="Albert", rate=200)
+
+        assert result.success
+        argv = run.await_args.args[0]
+        assert argv == [SAY_PATH, "-v", "Albert", "-r", "200", "--", text]
+        assert run.await_args.kwargs.get("input") is None
+
+    @pytest.mark.asyncio
+    async def test_long_text_streamed_on_stdin(self):
+        """Test text over the argv limit is piped to say with "-f -"."""
+        core, run = _command_core()
+        text = "word " * (SAY_ARGV_MAX_CHARS // 5 + 1)
+
+        result = await core.speak_text(text)
+
+        assert result.success
+        assert result.text_length == len(text)
+        argv = run.await_args.args[0]
+        assert argv == [SAY_PATH, "-f", "-"]
+        assert run.await_args.kwargs["input"] == text.encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_text_at_limit_stays_in_argv(self):
+        """Test the boundary length still uses the argument form."""
+        core, run = _command_core()
+        text = "a" * SAY_ARGV_MAX_CHARS
+
+        await core.speak_text(text)
+
+        argv = run.await_args.args[0]
+        assert argv[-2:] == ["--", text]
+
+    @pytest.mark.asyncio
+    async def test_say_failure_reported(self):
+        """Test a failing say run surfaces its stderr."""
+        core, _ = _command_core(success=False, error="say: voice not found")
+
+        result = await core.speak_text("hello", voice="Nobody")
+
+        assert not result.success
+        assert result.error_code == "SPEECH_FAILED"
+        assert result.error == "say: voice not found"
+
+
+class TestVoiceListing:
+    """Test voice names are taken from `say -v ?` output."""
+
+    @pytest.mark.asyncio
+    async def test_names_with_spaces_and_parentheses(self):
+        """Test multi-word and parenthesised names keep everything before the locale."""
+        core, run = _command_core(SAY_VOICES)
+
+        voices = await core.list_available_voices()
+
+        assert voices == [
+            "Albert", "Bad News", "Eddy (English (US))",
+            "Grandma (Français (France))", "Ting-Ting",
+        ]
+        assert run.await_args.args[0] == [SAY_PATH, "-v", "?"]
+
+    @pytest.mark.asyncio
+    async def test_listing_cached_until_invalidated(self):
+        """Test repeated calls reuse the listing until the cache is dropped."""
+        core, run = _command_core(SAY_VOICES)
+
+        first = await core.list_available_voices()
+        first.clear()  # Callers get a copy
+        assert len(await core.list_available_voices()) == 5
+        assert run.await_count == 1
+
+        core.invalidate_voices_cache()
+        await core.list_available_voices()
+        assert run.await_count == 2
+
+
+class TestDeviceListing:
+    """Test device blocks are split out of `system_profiler SPAudioDataType`."""
+
+    @pytest.mark.asyncio
+    async def test_devices_split_by_direction(self):
+        """Test channels decide direction and defaults are flagged per block."""
+        core, _ = _command_core(SP_AUDIO)
+
+        devices = await core.list_audio_devices()
+
+        inputs = {device.name: device.is_default for device in devices['input']}
+        outputs = {device.name: device.is_default for device in devices['output']}
+        assert inputs == {"MacBook Pro Microphone": True, "USB Audio Interface": False}
+        assert outputs == {"MacBook Pro Speakers": True, "USB Audio Interface": False}
+
+    @pytest.mark.asyncio
+    async def test_profiler_failure_lists_nothing(self):
+        """Test a failed system_profiler run returns empty lists."""
+        core, _ = _command_core(success=False, error="boom")
+
+        assert await core.list_audio_devices() == {'input': [], 'output': []}
+
+
+class TestSharedInstance:
+    """Test tool calls share one AudioCore that shutdown closes."""
+
+    @pytest.mark.asyncio
+    async def test_get_audio_core_is_memoized_and_closed(self, monkeypatch):
+        """Test the same instance is handed out until the manager shuts down."""
+        from src.core import context_manager
+
+        monkeypatch.setattr(context_manager, "_context_manager", None)
+        manager = context_manager.initialize_context_manager(None, AsyncMock())
+
+        core = context_manager.get_audio_core()
+        assert isinstance(core, AudioCore)
+        assert context_manager.get_audio_core() is core
+
+        with patch.object(core, "close", AsyncMock()) as close:
+            await manager.shutdown()
+        close.assert_awaited_once()
+        assert manager.get_audio_core() is not core
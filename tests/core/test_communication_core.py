@@ -0,0 +1,270 @@
+"""
+Tests for the communication core.
+
+Runs CommunicationCore against a fake Keyboard Maestro interface that
+answers AppleScript process probes, covering the service status cache,
+the batched process probe, attachment validation and service detection.
+"""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from src.core import communication_core
+from src.core.communication_core import (
+    CommunicationCore, CommunicationService, DEFAULT_APPLESCRIPT_CONCURRENCY,
+    SERVICE_CACHE_TTL, SERVICE_ERROR_CACHE_TTL
+)
+
+
+class FakeKMInterface:
+    """Answers System Events probes from a set of running process names."""
+
+    def __init__(self, running=("Mail", "Messages"), batched_reply=None):
+        self.running = set(running)
+        self.batched_reply = batched_reply
+        self.scripts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def execute_applescript(self, script):
+        self.scripts.append(script)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)  # Let concurrent callers overlap
+        finally:
+            self.active -= 1
+        if '& "|" &' in script:
+            if self.batched_reply is not None:
+                return {"result": self.batched_reply}
+            names = ("Mail", "Messages")
+            return {"result": "|".join(str(name in self.running).lower() for name in names)}
+        name = "Mail" if '"Mail"' in script else "Messages"
+        return {"result": str(name in self.running).lower()}
+
+
+class FakeClock:
+    """Replaces the module's time so cache expiry can be stepped."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch.object(communication_core, "time", fake):
+        yield fake
+
+
+def _core(km_interface: FakeKMInterface) -> CommunicationCore:
+    return CommunicationCore(km_interface, error_handler=None)
+
+
+class TestServiceCache:
+    """Test availability results are cached per service."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl_and_miss_after(self, clock):
+        """Test a fresh status is reused and an expired one is re-checked."""
+        km = FakeKMInterface()
+        core = _core(km)
+
+        first = await core.check_service_availability(CommunicationService.EMAIL)
+        clock.now += SERVICE_CACHE_TTL - 1
+        second = await core.check_service_availability(CommunicationService.EMAIL)
+        assert first is second
+        assert len(km.scripts) == 1
+
+        clock.now += 2
+        await core.check_service_availability(CommunicationService.EMAIL)
+        assert len(km.scripts) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_service_cache(self, clock):
+        """Test invalidation forces a fresh check for one or all services."""
+        km = FakeKMInterface()
+        core = _core(km)
+        await core.check_service_availability(CommunicationService.EMAIL)
+        await core.check_service_availability(CommunicationService.SMS)
+
+        core.invalidate_service_cache(CommunicationService.EMAIL)
+        await core.check_service_availability(CommunicationService.EMAIL)
+        await core.check_service_availability(CommunicationService.SMS)
+        assert len(km.scripts) == 3
+
+        core.invalidate_service_cache()
+        await core.check_service_availability(CommunicationService.EMAIL)
+        await core.check_service_availability(CommunicationService.SMS)
+        assert len(km.scripts) == 5
+
+    @pytest.mark.asyncio
+    async def test_error_status_expires_quickly(self, clock):
+        """Test a status carrying an error message uses the short TTL."""
+        km = FakeKMInterface(running=())
+        core = _core(km)
+
+        status = await core.check_service_availability(CommunicationService.EMAIL)
+        assert not status.available and status.error_message
+
+        km.running.add("Mail")
+        clock.now += SERVICE_ERROR_CACHE_TTL + 1
+        status = await core.check_service_availability(CommunicationService.EMAIL)
+        assert status.available
+        assert len(km.scripts) == 2
+
+
+class TestBatchedProbe:
+    """Test get_available_services answers Mail and Messages in one call."""
+
+    @pytest.mark.asyncio
+    async def test_one_probe_for_all_services(self, clock):
+        """Test a single System Events query covers every process check."""
+        km = FakeKMInterface(running=("Mail",))
+        core = _core(km)
+
+        statuses = {status.service: status.available
+                    for status in await core.get_available_services()}
+
+        assert statuses == {
+            CommunicationService.EMAIL: True,
+            CommunicationService.SMS: False,
+            CommunicationService.IMESSAGE: False,
+            CommunicationService.NOTIFICATION: True,
+        }
+        assert len(km.scripts) == 1
+
+        await core.get_available_services()
+        assert len(km.scripts) == 1  # Everything cached
+
+    @pytest.mark.asyncio
+    async def test_malformed_probe_falls_back(self, clock):
+        """Test an unparseable probe reply falls back to per-service checks."""
+        km = FakeKMInterface(running=("Messages",), batched_reply="garbage")
+        core = _core(km)
+
+        statuses = {status.service: status.available
+                    for status in await core.get_available_services()}
+
+        assert statuses[CommunicationService.EMAIL] is False
+        assert statuses[CommunicationService.SMS] is True
+        assert statuses[CommunicationService.IMESSAGE] is True
+        assert len(km.scripts) == 4  # Probe plus three individual checks
+
+
+class TestAttachments:
+    """Test attachment validation."""
+
+    @pytest.mark.asyncio
+    async def test_missing_and_nul_paths(self, tmp_path):
+        """Test missing files and paths with NUL bytes report as absent."""
+        present = tmp_path / "report.pdf"
+        present.write_bytes(b"%PDF")
+        missing = str(tmp_path / "missing.txt")
+        nul = str(tmp_path / "bad\x00name.txt")
+        core = _core(FakeKMInterface())
+
+        results = await core.validate_attachments([str(present), missing, nul])
+
+        assert results[str(present)]["exists"] and results[str(present)]["type"] == ".pdf"
+        for path in (missing, nul):
+            assert results[path]["exists"] is False
+            assert results[path]["readable"] is False
+            assert "error" not in results[path]
+
+
+class TestServiceDetection:
+    """Test bulk detection matches per-recipient detection."""
+
+    RECIPIENTS = ["user@example.com", "+15551234567", "not a recipient", ""]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("running", [("Messages",), ()])
+    async def test_bulk_agrees_with_single(self, clock, running):
+        """Test both detection paths pick the same service per recipient."""
+        single = _core(FakeKMInterface(running=running))
+        expected = [await single.detect_message_service(recipient)
+                    for recipient in self.RECIPIENTS]
+
+        km = FakeKMInterface(running=running)
+        bulk = await _core(km).detect_message_services_bulk(self.RECIPIENTS)
+
+        assert bulk == expected
+        assert len(km.scripts) == 1
+
+
+class TestProbeConcurrency:
+    """Test probes are de-duplicated and capped process-wide."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_slots(self, monkeypatch):
+        monkeypatch.setattr(communication_core, "_applescript_slots", None)
+        monkeypatch.delenv("KM_MAX_APPLESCRIPT_CONCURRENCY", raising=False)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_callers_share_one_check(self, clock):
+        """Test callers arriving before the cache fills wait on one check."""
+        km = FakeKMInterface()
+        core = _core(km)
+
+        statuses = await asyncio.gather(
+            *(core.check_service_availability(CommunicationService.EMAIL) for _ in range(5))
+        )
+
+        assert len(km.scripts) == 1
+        assert all(status is statuses[0] for status in statuses)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_service_listings_share_one_probe(self, clock):
+        """Test overlapping get_available_services calls run one batched probe."""
+        km = FakeKMInterface()
+        core = _core(km)
+
+        await asyncio.gather(*(core.get_available_services() for _ in range(3)))
+
+        assert len(km.scripts) == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_shared_across_instances(self, clock, monkeypatch):
+        """Test the concurrency limit applies across CommunicationCore instances."""
+        monkeypatch.setenv("KM_MAX_APPLESCRIPT_CONCURRENCY", "1")
+        km = FakeKMInterface()
+        first, second = _core(km), _core(km)
+
+        await asyncio.gather(
+            first.check_service_availability(CommunicationService.EMAIL),
+            second.check_service_availability(CommunicationService.SMS),
+            second.check_service_availability(CommunicationService.IMESSAGE),
+        )
+
+        assert len(km.scripts) == 3
+        assert km.max_active == 1
+
+    def test_malformed_limit_falls_back(self, monkeypatch, caplog):
+        """Test a malformed limit logs and uses the default instead of raising."""
+        monkeypatch.setenv("KM_MAX_APPLESCRIPT_CONCURRENCY", "four")
+
+        with caplog.at_level(logging.WARNING, logger=communication_core.__name__):
+            assert communication_core._applescript_concurrency() == DEFAULT_APPLESCRIPT_CONCURRENCY
+        assert "KM_MAX_APPLESCRIPT_CONCURRENCY" in caplog.text
+
+
+class TestSharedInstance:
+    """Test tool calls share one CommunicationCore."""
+
+    def test_get_communication_core_is_memoized(self, monkeypatch):
+        """Test the context manager hands out the same instance every call."""
+        from src.core import context_manager
+
+        monkeypatch.setattr(context_manager, "_context_manager", None)
+        context_manager.initialize_context_manager(None, FakeKMInterface())
+
+        core = context_manager.get_communication_core()
+        assert isinstance(core, CommunicationCore)
+        assert context_manager.get_communication_core() is core
@@ -24,7 +24,7 @@ from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any
 
 from src.core.km_interface import KeyboardMaestroInterface, MockKMInterface, MacroExecutionContext
-from src.core.applescript_pool import AppleScriptConnectionPool, PoolConfiguration
+from src.core.applescript_pool import AppleScriptConnectionPool, PoolConfiguration, ScriptResult
 from src.validators.km_validators import KMValidator
 from src.boundaries.km_boundaries import KMBoundaryGuard
 from src.core.km_error_handler import KMErrorHandler
@@ -75,11 +75,12 @@ class TestKMIntegrationWorkflow:
         
         # Mock connection pool behavior
         mock_connection = Mock()
-        mock_connection.execute_script = AsyncMock(return_value={
-            'success': True,
-            'output': 'Macro executed successfully',
-            'error': None
-        })
+        mock_connection.execute_script = AsyncMock(return_value=ScriptResult(
+            success=True,
+            output='Macro executed successfully',
+            error=None,
+            connection_id='test_conn'
+        ))
         
         km_interface.connection_pool.get_connection.return_value.__aenter__ = AsyncMock(return_value=mock_connection)
         km_interface.connection_pool.get_connection.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -112,11 +113,12 @@ class TestKMIntegrationWorkflow:
         
         # Mock connection behavior
         mock_connection = Mock()
-        mock_connection.execute_script = AsyncMock(return_value={
-            'success': True,
-            'output': var_value,
-            'error': None
-        })
+        mock_connection.execute_script = AsyncMock(return_value=ScriptResult(
+            success=True,
+            output=var_value,
+            error=None,
+            connection_id='test_conn'
+        ))
         
         km_interface.connection_pool.get_connection.return_value.__aenter__ = AsyncMock(return_value=mock_connection)
         km_interface.connection_pool.get_connection.return_value.__aexit__ = AsyncMock(return_value=None)
@@ -153,11 +155,12 @@ class TestKMIntegrationWorkflow:
         
         # Mock connection to fail
         mock_connection = Mock()
-        mock_connection.execute_script = AsyncMock(return_value={
-            'success': False,
-            'output': None,
-            'error': 'Macro not found'
-        })
+        mock_connection.execute_script = AsyncMock(return_value=ScriptResult(
+            success=False,
+            output=None,
+            error='Macro not found',
+            connection_id='test_conn'
+        ))
         
         km_interface.connection_pool.get_connection.return_value.__aenter__ = AsyncMock(return_value=mock_connection)
         km_interface.connection_pool.get_connection.return_value.__aexit__ = AsyncMock(return_value=None)